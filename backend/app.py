@@ -3,36 +3,96 @@ ATS Resume Analyzer - Main Flask Application
 Analyzes resumes against job descriptions using NLP and ML
 """
 
-from flask import Flask, request, jsonify
+from flask import Flask, Request, Response, request, jsonify, stream_with_context
 from flask_cors import CORS
 from werkzeug.utils import secure_filename
+import io
+import json
+import logging
 import os
+import threading
+import uuid
 from datetime import datetime
 
 # Import custom modules
-from models.resume_parser import ResumeParser
-from models.nlp_analyzer import NLPAnalyzer
-from models.ats_scorer import ATSScorer
+from models.analysis_pipeline import StageTimeoutError
 from utils.text_processing import clean_text, extract_keywords
-from utils.skill_extraction import SkillExtractor
+from utils.job_queue import JobQueue, JobWorkerPool
+from utils.result_cache import ResultCache
+from utils.job_registry import JobRegistry
+from utils.resume_index import ResumeIndex
+from utils.components import build_components, load_config
+from utils import metrics
+from utils.metrics import span, record
+from utils.memory import process_memory
+
+class InMemoryRequest(Request):
+    """Request that keeps uploaded files in memory instead of temp files"""
+    
+    def _get_file_stream(self, total_content_length, content_type,
+                         filename=None, content_length=None):
+        # Uploads are bounded by MAX_CONTENT_LENGTH, so never spool to disk
+        return io.BytesIO()
+
+logging.basicConfig(level=os.environ.get('LOG_LEVEL', 'INFO'), format='%(message)s')
+request_logger = logging.getLogger('ats.requests')
 
 # Initialize Flask app
 app = Flask(__name__)
+app.request_class = InMemoryRequest
 CORS(app)  # Enable CORS for React frontend
 
 # Configuration
 app.config['MAX_CONTENT_LENGTH'] = 5 * 1024 * 1024  # 5MB max file size
-app.config['UPLOAD_FOLDER'] = 'uploads'
 app.config['ALLOWED_EXTENSIONS'] = {'pdf', 'docx', 'txt'}
-
-# Create upload folder if it doesn't exist
-os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
+app.config['MAX_BATCH_FILES'] = 100
+app.config['MODEL_WARMUP'] = os.environ.get('MODEL_WARMUP', '1') == '1'
+app.config['JOB_QUEUE_DB'] = os.environ.get('JOB_QUEUE_DB', 'jobs.db')
+app.config['JOB_WORKERS'] = int(os.environ.get('JOB_WORKERS', 2))
+app.config['JOB_WORKERS_AUTOSTART'] = os.environ.get('JOB_WORKERS_AUTOSTART', '1') == '1'
+app.config['RESULT_CACHE_SIZE'] = int(os.environ.get('RESULT_CACHE_SIZE', 1024))
+app.config['RESULT_CACHE_TTL'] = int(os.environ.get('RESULT_CACHE_TTL', 24 * 3600))
+app.config['RESULT_CACHE_DB'] = os.environ.get('RESULT_CACHE_DB') or None
+app.config['JOB_REGISTRY_SIZE'] = int(os.environ.get('JOB_REGISTRY_SIZE', 256))
+app.config['JOB_REGISTRY_DB'] = os.environ.get('JOB_REGISTRY_DB') or None
+app.config['RESUME_INDEX_DIR'] = os.environ.get('RESUME_INDEX_DIR', 'resume_index')
+app.config['MAX_RANK_SHORTLIST'] = int(os.environ.get('MAX_RANK_SHORTLIST', 500))
+app.config['MAX_MATCH_JOBS'] = int(os.environ.get('MAX_MATCH_JOBS', 500))
+app.config['MAX_SKILLS_PAGE'] = int(os.environ.get('MAX_SKILLS_PAGE', 1000))
+# Model, embedding, skills and stage settings (shared with the job workers)
+app.config.update(load_config())
 
 # Initialize components
-resume_parser = ResumeParser()
-nlp_analyzer = NLPAnalyzer()
-ats_scorer = ATSScorer()
-skill_extractor = SkillExtractor()
+components = build_components(app.config)
+embedding_cache = components['embedding_cache']
+nlp_analyzer = components['nlp_analyzer']
+skill_extractor = components['skill_extractor']
+pipeline = components['pipeline']
+resume_parser = pipeline.resume_parser
+ats_scorer = pipeline.ats_scorer
+
+# Analysis result cache
+result_cache = ResultCache(
+    max_entries=app.config['RESULT_CACHE_SIZE'],
+    ttl_seconds=app.config['RESULT_CACHE_TTL'],
+    db_path=app.config['RESULT_CACHE_DB']
+)
+
+# Registered job descriptions with precomputed job-side analysis
+job_registry = JobRegistry(
+    max_entries=app.config['JOB_REGISTRY_SIZE'],
+    db_path=app.config['JOB_REGISTRY_DB']
+)
+
+# Asynchronous job queue (workers start on first use unless a server
+# such as serve.py runs one pool for all web processes)
+job_queue = JobQueue(app.config['JOB_QUEUE_DB'])
+job_worker_pool = None
+job_worker_lock = threading.Lock()
+
+# Stored resume corpus for ranking (opened on first use)
+resume_index = None
+resume_index_lock = threading.Lock()
 
 # ============================================================================
 # HELPER FUNCTIONS
@@ -43,16 +103,147 @@ def allowed_file(filename):
     return '.' in filename and \
            filename.rsplit('.', 1)[1].lower() in app.config['ALLOWED_EXTENSIONS']
 
-def save_uploaded_file(file):
-    """Save uploaded file and return path"""
-    if file and allowed_file(file.filename):
-        filename = secure_filename(file.filename)
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filename = f"{timestamp}_{filename}"
-        filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-        file.save(filepath)
-        return filepath
-    return None
+def parse_upload(data, mime):
+    """Extract resume text from upload bytes and count input size"""
+    with span('parse'):
+        document = resume_parser.extract_document(data, mime)
+    metrics.record_document(document['file_type'], document['pages'])
+    return document['text']
+
+def load_registered_job(job_id, profile=None):
+    """
+    Prepared job for a registered ID, rebuilt if the pipeline changed (or None)
+    
+    The registry keeps the preparation for the configured spaCy profile;
+    other profiles get a fresh preparation that is not stored. Neither is
+    a preparation made while a model was unavailable.
+    """
+    entry = job_registry.get(job_id)
+    if entry is None:
+        return None
+    
+    version = pipeline.config_version(profile)
+    if entry['version'] != version or entry['job']['nlp']['embedding'] is None:
+        # Prepared with other models, settings or profile, or without the
+        # embedding model; redo it from the stored text
+        job = pipeline.prepare_job(entry['job']['text'], profile)
+        pipeline.chunk_embeddings([], [job])
+        if version != pipeline.config_version() or not nlp_analyzer.is_ready():
+            record('job_id', job_id)
+            return job
+        job_registry.register(job, version)
+        entry = job_registry.get(job_id)
+    
+    record('job_id', job_id)
+    return entry['job']
+
+def cache_result(cache_key, result, profile=None):
+    """
+    Cache an analysis unless a model it needed was unavailable
+    
+    Without the embedding or spaCy model the result has zero similarity
+    and no entities; caching it would keep serving that after recovery.
+    """
+    if nlp_analyzer.is_ready(profile):
+        result_cache.set(cache_key, result)
+
+def request_list(data, field):
+    """Read a list field from JSON (list) or form data (repeated or comma-separated)"""
+    if hasattr(data, 'getlist'):
+        values = data.getlist(field)
+        if field.endswith('_ids'):
+            values = [part for value in values for part in value.split(',')]
+    else:
+        values = data.get(field) or []
+    return [value.strip() for value in values if value and value.strip()]
+
+def posting_title(job_description):
+    """First non-empty line of a job posting"""
+    for line in job_description.splitlines():
+        if line.strip():
+            return line.strip()[:100]
+    return ''
+
+def request_profile(data):
+    """spaCy profile named by a request (None means the configured default)"""
+    profile = data.get('profile')
+    return profile.strip() if isinstance(profile, str) and profile.strip() else None
+
+def unknown_profile(profile):
+    """Response for an unknown spaCy profile"""
+    return jsonify({
+        'error': f"Unknown profile '{profile}'. Use one of: {', '.join(sorted(nlp_analyzer.spacy_profiles))}"
+    }), 400
+
+def job_not_found(job_id):
+    """Response for an unknown job_id"""
+    return jsonify({
+        'error': f'Job description {job_id} not found. Register it with POST /api/jobs-descriptions'
+    }), 404
+
+def get_resume_index():
+    """Open the resume corpus index if it is not open yet"""
+    global resume_index
+    with resume_index_lock:
+        if resume_index is None:
+            resume_index = ResumeIndex(
+                app.config['RESUME_INDEX_DIR'],
+                embedding_version=':'.join(filter(None, (
+                    nlp_analyzer.sentence_model_name, nlp_analyzer.config_version()
+                )))
+            )
+        return resume_index
+
+def ensure_job_workers():
+    """Start the analysis worker pool if it is not running yet (and autostart is on)"""
+    global job_worker_pool
+    with job_worker_lock:
+        if job_worker_pool is None and app.config['JOB_WORKERS_AUTOSTART']:
+            job_worker_pool = JobWorkerPool(
+                app.config['JOB_QUEUE_DB'],
+                num_workers=app.config['JOB_WORKERS']
+            )
+            job_worker_pool.start()
+
+# ============================================================================
+# REQUEST INSTRUMENTATION
+# ============================================================================
+
+@app.before_request
+def start_request_trace():
+    """Collect stage timings and input sizes for this request"""
+    metrics.start_trace(
+        request.headers.get('X-Request-ID') or uuid.uuid4().hex,
+        request.endpoint or 'unknown'
+    )
+
+@app.after_request
+def finish_request_trace(response):
+    """Record request metrics and emit one structured log line"""
+    trace = metrics.end_trace()
+    if trace is None:
+        return response
+    
+    response.headers['X-Request-ID'] = trace.request_id
+    if trace.endpoint == 'prometheus_metrics' or response.is_streamed:
+        # Streaming responses log once the stream finishes
+        return response
+    
+    log_request_trace(trace, response.status_code)
+    return response
+
+def log_request_trace(trace, status):
+    """Count the request and write its structured log line"""
+    log_line = trace.to_dict()
+    log_line['status'] = status
+    if metrics.REGISTRY.enabled:
+        metrics.REQUESTS.inc(endpoint=trace.endpoint, status=status)
+        metrics.REQUEST_DURATION.observe(log_line['duration_ms'] / 1000, endpoint=trace.endpoint)
+    request_logger.info(json.dumps(log_line))
+
+def sse_event(event, data):
+    """Format one server-sent event"""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
 
 # ============================================================================
 # API ROUTES
@@ -67,22 +258,47 @@ def home():
         'version': '1.0.0',
         'endpoints': {
             'analyze': '/api/analyze',
+            'analyze_batch': '/api/analyze/batch',
+            'analyze_stream': '/api/analyze/stream',
+            'jobs': '/api/jobs',
+            'cache_stats': '/api/cache/stats',
             'health': '/api/health',
+            'ready': '/api/ready',
             'skills': '/api/skills'
         }
     })
 
 @app.route('/api/health')
 def health():
-    """API health check"""
+    """Liveness check: the process is up and serving requests"""
     return jsonify({
         'status': 'healthy',
+        'timestamp': datetime.now().isoformat()
+    })
+
+@app.route('/api/ready')
+def ready():
+    """Readiness check: every model has loaded successfully"""
+    nlp_status = nlp_analyzer.status()
+    is_ready = nlp_analyzer.is_ready()
+    
+    return jsonify({
+        'status': 'ready' if is_ready else 'not_ready',
         'timestamp': datetime.now().isoformat(),
         'components': {
             'parser': 'ready',
-            'nlp': 'ready',
-            'scorer': 'ready'
-        }
+            'scorer': 'ready',
+            'nlp': nlp_status['models']
+        },
+        'warm_up': nlp_status['warm_up']
+    }), 200 if is_ready else 503
+
+@app.route('/api/memory')
+def memory():
+    """Memory usage of the worker serving this request (USS = unique to it)"""
+    return jsonify({
+        'success': True,
+        'memory': process_memory()
     })
 
 @app.route('/api/analyze', methods=['POST'])
@@ -93,6 +309,8 @@ def analyze_resume():
     Request:
         - resume_file: PDF/DOCX/TXT file
         - job_description: Text of job posting
+          (or job_id: ID from POST /api/jobs-descriptions)
+        - profile: spaCy profile, 'fast' or 'full' (optional)
         
     Response:
         - ats_score: Overall ATS score (0-100)
@@ -106,12 +324,17 @@ def analyze_resume():
         if 'resume_file' not in request.files:
             return jsonify({'error': 'No resume file provided'}), 400
         
-        if 'job_description' not in request.form:
+        job_id = request.form.get('job_id')
+        if 'job_description' not in request.form and not job_id:
             return jsonify({'error': 'No job description provided'}), 400
         
+        profile = request_profile(request.form)
+        if profile and profile not in nlp_analyzer.spacy_profiles:
+            return unknown_profile(profile)
+        
         # Get files and data
         resume_file = request.files['resume_file']
-        job_description = request.form['job_description']
+        job_description = request.form.get('job_description')
         
         if resume_file.filename == '':
             return jsonify({'error': 'No file selected'}), 400
@@ -119,263 +342,917 @@ def analyze_resume():
         if not allowed_file(resume_file.filename):
             return jsonify({'error': 'Invalid file type. Use PDF, DOCX, or TXT'}), 400
         
-        # Save uploaded file
-        filepath = save_uploaded_file(resume_file)
-        if not filepath:
-            return jsonify({'error': 'Failed to save file'}), 500
-        
-        # Step 1: Parse resume
-        print(f"[1/5] Parsing resume: {resume_file.filename}")
-        resume_text = resume_parser.extract_text(filepath)
-        resume_sections = resume_parser.extract_sections(resume_text)
-        
-        # Step 2: Clean and preprocess
-        print("[2/5] Preprocessing text")
-        resume_clean = clean_text(resume_text)
-        job_clean = clean_text(job_description)
-        
-        # Step 3: NLP Analysis
-        print("[3/5] Performing NLP analysis")
-        nlp_results = nlp_analyzer.analyze(resume_clean, job_clean)
-        
-        # Step 4: Extract keywords and skills
-        print("[4/5] Extracting keywords and skills")
-        resume_keywords = extract_keywords(resume_clean)
-        job_keywords = extract_keywords(job_clean)
-        
-        resume_skills = skill_extractor.extract_skills(resume_text)
-        job_skills = skill_extractor.extract_skills(job_description)
-        
-        # Step 5: Calculate ATS score
-        print("[5/5] Calculating ATS score")
-        ats_results = ats_scorer.calculate_score(
-            resume_text=resume_text,
-            job_description=job_description,
-            resume_sections=resume_sections,
-            nlp_results=nlp_results,
-            resume_keywords=resume_keywords,
-            job_keywords=job_keywords,
-            resume_skills=resume_skills,
-            job_skills=job_skills
+        # Registered job descriptions skip all job-side work
+        job = None
+        if job_id:
+            job = load_registered_job(job_id, profile)
+            if job is None:
+                return job_not_found(job_id)
+            job_description = job['text']
+        
+        # Serve repeated submissions from cache
+        resume_data = resume_file.read()
+        cache_key = ResultCache.make_key(
+            resume_data, job_description, pipeline.config_version(profile)
         )
+        cached = result_cache.get(cache_key)
+        if cached is not None:
+            record('cached', True)
+            return jsonify(dict(cached, cached=True))
+        
+        # Step 1: Parse resume straight from the upload
+        resume_text = parse_upload(resume_data, resume_file.mimetype)
+        
+        # Step 2: Process job description
+        if job is None:
+            job = pipeline.prepare_job(job_description, profile)
+        
+        # Step 3: Analyze and score resume
+        response = pipeline.analyze(resume_text, job, profile)
+        cache_result(cache_key, response, profile)
+        
+        record('cached', False)
+        record('ats_score', response['ats_score'])
+        return jsonify(dict(response, cached=False))
+        
+    except StageTimeoutError as e:
+        print(f"Error in analyze_resume: {str(e)}")
+        record('error', str(e))
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 504
+    except Exception as e:
+        print(f"Error in analyze_resume: {str(e)}")
+        record('error', str(e))
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/api/analyze/stream', methods=['POST'])
+def analyze_resume_stream():
+    """
+    Analyze resume and stream partial results as server-sent events
+    
+    Request:
+        - resume_file: PDF/DOCX/TXT file
+        - job_description: Text of job posting
+          (or job_id: ID from POST /api/jobs-descriptions)
+        - profile: spaCy profile, 'fast' or 'full' (optional)
+        
+    Events (in order):
+        - sections: Resume section analysis
+        - keyword_match: Matched and missing keywords
+        - skill_gap: Required vs present skills
+        - semantic_similarity: Transformer similarity (0-100)
+        - score: Full /api/analyze response with score and suggestions
+        - error: Sent instead of the remaining events if analysis fails
+    """
+    try:
+        # Validate request
+        if 'resume_file' not in request.files:
+            return jsonify({'error': 'No resume file provided'}), 400
+        
+        job_id = request.form.get('job_id')
+        if 'job_description' not in request.form and not job_id:
+            return jsonify({'error': 'No job description provided'}), 400
         
-        # Keyword matching
-        matched_keywords = list(set(resume_keywords) & set(job_keywords))
-        missing_keywords = list(set(job_keywords) - set(resume_keywords))
+        profile = request_profile(request.form)
+        if profile and profile not in nlp_analyzer.spacy_profiles:
+            return unknown_profile(profile)
         
-        keyword_match_percentage = (len(matched_keywords) / len(job_keywords) * 100) if job_keywords else 0
+        resume_file = request.files['resume_file']
+        job_description = request.form.get('job_description')
         
-        # Skill gap analysis
-        matched_skills = list(set(resume_skills) & set(job_skills))
-        missing_skills = list(set(job_skills) - set(resume_skills))
+        if resume_file.filename == '':
+            return jsonify({'error': 'No file selected'}), 400
         
-        # Generate suggestions
-        suggestions = generate_suggestions(
-            ats_results['score'],
-            missing_keywords,
-            missing_skills,
-            resume_sections
+        if not allowed_file(resume_file.filename):
+            return jsonify({'error': 'Invalid file type. Use PDF, DOCX, or TXT'}), 400
+        
+        registered_job = None
+        if job_id:
+            registered_job = load_registered_job(job_id, profile)
+            if registered_job is None:
+                return job_not_found(job_id)
+            job_description = registered_job['text']
+        
+        resume_data = resume_file.read()
+        cache_key = ResultCache.make_key(
+            resume_data, job_description, pipeline.config_version(profile)
         )
+        cached = result_cache.get(cache_key)
+        
+        # Parse before streaming so bad uploads still get a JSON error
+        resume_text = None if cached is not None else parse_upload(resume_data, resume_file.mimetype)
         
-        # Clean up uploaded file
+    except Exception as e:
+        print(f"Error in analyze_resume_stream: {str(e)}")
+        record('error', str(e))
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+    
+    trace = metrics.current_trace()
+    
+    def generate():
+        metrics.attach_trace(trace)
+        status = 200
         try:
-            os.remove(filepath)
-        except:
-            pass
+            if cached is not None:
+                record('cached', True)
+                for event in ('sections', 'keyword_match', 'skill_gap'):
+                    yield sse_event(event, cached[event])
+                yield sse_event('semantic_similarity', {
+                    'semantic_similarity': cached['semantic_similarity']
+                })
+                yield sse_event('score', dict(cached, cached=True))
+                return
+            
+            # Text-only job steps are fast; model work happens after the first events
+            job = registered_job or pipeline.prepare_job_text(job_description)
+            for stage, data in pipeline.iter_stages(resume_text, job, profile=profile):
+                if stage == 'score':
+                    cache_result(cache_key, data, profile)
+                    record('cached', False)
+                    record('ats_score', data['ats_score'])
+                    data = dict(data, cached=False)
+                yield sse_event(stage, data)
+        except Exception as e:
+            print(f"Error in analyze_resume_stream: {str(e)}")
+            record('error', str(e))
+            status = 500
+            yield sse_event('error', {'success': False, 'error': str(e)})
+        finally:
+            finished = metrics.end_trace()
+            if finished is not None:
+                log_request_trace(finished, status)
+    
+    return Response(
+        stream_with_context(generate()),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+@app.route('/api/analyze/batch', methods=['POST'])
+def analyze_resume_batch():
+    """
+    Analyze many resumes against one job description
+    
+    The job description is processed once and all resumes are
+    embedded in a single batch.
+    
+    Request:
+        - resume_files: PDF/DOCX/TXT files (repeat the field per file)
+        - job_description: Text of job posting
+          (or job_id: ID from POST /api/jobs-descriptions)
+        - profile: spaCy profile, 'fast' or 'full' (optional)
+        
+    Response:
+        - results: Per-resume analysis (same shape as /api/analyze)
+        - ranking: Resumes ordered by ATS score
+        - errors: Files that could not be processed
+    """
+    try:
+        # Validate request
+        resume_files = [f for f in request.files.getlist('resume_files') if f.filename]
+        if not resume_files:
+            return jsonify({'error': 'No resume files provided'}), 400
+        
+        job_id = request.form.get('job_id')
+        if 'job_description' not in request.form and not job_id:
+            return jsonify({'error': 'No job description provided'}), 400
+        
+        profile = request_profile(request.form)
+        if profile and profile not in nlp_analyzer.spacy_profiles:
+            return unknown_profile(profile)
+        
+        if len(resume_files) > app.config['MAX_BATCH_FILES']:
+            return jsonify({
+                'error': f"Too many files. Maximum is {app.config['MAX_BATCH_FILES']}"
+            }), 400
         
-        # Prepare response
-        response = {
+        job_description = request.form.get('job_description')
+        job = None
+        if job_id:
+            job = load_registered_job(job_id, profile)
+            if job is None:
+                return job_not_found(job_id)
+            job_description = job['text']
+        
+        config_version = pipeline.config_version(profile)
+        
+        # Step 1: Parse resumes not already in the cache
+        results = []
+        pending = []  # (filename, cache_key, resume_text)
+        errors = []
+        for resume_file in resume_files:
+            if not allowed_file(resume_file.filename):
+                errors.append({
+                    'filename': resume_file.filename,
+                    'error': 'Invalid file type. Use PDF, DOCX, or TXT'
+                })
+                continue
+            
+            try:
+                resume_data = resume_file.read()
+                cache_key = ResultCache.make_key(resume_data, job_description, config_version)
+                cached = result_cache.get(cache_key)
+                if cached is not None:
+                    results.append(dict(cached, filename=resume_file.filename, cached=True))
+                    continue
+                
+                resume_text = parse_upload(resume_data, resume_file.mimetype)
+                pending.append((resume_file.filename, cache_key, resume_text))
+            except Exception as e:
+                errors.append({'filename': resume_file.filename, 'error': str(e)})
+        
+        if pending:
+            # Step 2: Process job description once
+            if job is None:
+                job = pipeline.prepare_job(job_description, profile)
+            
+            # Step 3: Analyze all uncached resumes
+            analyses = pipeline.analyze_batch([text for _, _, text in pending], job, profile=profile)
+            for (filename, cache_key, _), result in zip(pending, analyses):
+                cache_result(cache_key, result, profile)
+                results.append(dict(result, filename=filename, cached=False))
+        
+        ranked = sorted(results, key=lambda r: r['ats_score'], reverse=True)
+        ranking = [
+            {
+                'rank': i + 1,
+                'filename': result['filename'],
+                'ats_score': result['ats_score'],
+                'rating': result['rating']['level']
+            }
+            for i, result in enumerate(ranked)
+        ]
+        
+        record('resumes', len(resume_files))
+        record('cache_hits', len(results) - len(pending))
+        return jsonify({
             'success': True,
-            'ats_score': round(ats_results['score'], 2),
-            'score_breakdown': ats_results['breakdown'],
-            'rating': get_rating(ats_results['score']),
-            'keyword_match': {
-                'matched': matched_keywords[:20],  # Top 20
-                'missing': missing_keywords[:20],
-                'match_percentage': round(keyword_match_percentage, 2),
-                'total_job_keywords': len(job_keywords),
-                'total_matched': len(matched_keywords)
-            },
-            'skill_gap': {
-                'required': list(job_skills)[:15],
-                'present': list(matched_skills)[:15],
-                'missing': list(missing_skills)[:15],
-                'match_percentage': round((len(matched_skills) / len(job_skills) * 100) if job_skills else 0, 2)
-            },
-            'sections': {
-                'contact': resume_sections.get('contact', False),
-                'summary': resume_sections.get('summary', False),
-                'experience': resume_sections.get('experience', False),
-                'education': resume_sections.get('education', False),
-                'skills': resume_sections.get('skills', False),
-                'projects': resume_sections.get('projects', False)
-            },
-            'suggestions': suggestions,
-            'semantic_similarity': round(nlp_results.get('similarity', 0) * 100, 2),
+            'total': len(resume_files),
+            'analyzed': len(results),
+            'results': results,
+            'ranking': ranking,
+            'errors': errors,
             'analysis_timestamp': datetime.now().isoformat()
-        }
+        })
+        
+    except Exception as e:
+        print(f"Error in analyze_resume_batch: {str(e)}")
+        record('error', str(e))
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/api/jobs-descriptions', methods=['POST'])
+def register_job_description():
+    """
+    Register a job description and precompute its analysis
+    
+    Request (JSON or form):
+        - job_description: Text of job posting
         
-        print(f"✓ Analysis complete! ATS Score: {response['ats_score']}")
-        return jsonify(response)
+    Response:
+        - job_id: Pass as job_id to /api/analyze instead of the text
+        - created: False if the posting was already registered
+    """
+    try:
+        data = request.get_json(silent=True) or request.form
+        job_description = data.get('job_description', '')
+        
+        if not job_description.strip():
+            return jsonify({'error': 'No job description provided'}), 400
+        
+        job_id = JobRegistry.make_id(job_description)
+        job = load_registered_job(job_id)
+        created = job is None
+        if created:
+            job = pipeline.prepare_job(job_description)
+            pipeline.chunk_embeddings([], [job])
+            if not nlp_analyzer.is_ready():
+                # A job prepared without its models would be reused with zero similarity
+                return jsonify({
+                    'success': False,
+                    'error': 'Models unavailable; register the job description once /api/ready reports ready'
+                }), 503
+            job_registry.register(job, pipeline.config_version())
+            job = job_registry.get(job_id)['job']
+        
+        return jsonify({
+            'success': True,
+            'job_id': job_id,
+            'created': created,
+            'keywords': job['keywords'][:50],
+            'skills': sorted(job['skills'])
+        }), 201 if created else 200
         
     except Exception as e:
-        print(f"Error in analyze_resume: {str(e)}")
+        print(f"Error in register_job_description: {str(e)}")
+        record('error', str(e))
         return jsonify({
             'success': False,
             'error': str(e)
         }), 500
 
-@app.route('/api/skills', methods=['GET'])
-def get_skills_database():
-    """Get list of common skills by category"""
+@app.route('/api/jobs-descriptions/<job_id>', methods=['GET'])
+def get_job_description(job_id):
+    """Get a registered job description and its precomputed analysis"""
     try:
-        skills = skill_extractor.get_skills_database()
+        entry = job_registry.get(job_id)
+        if entry is None:
+            return job_not_found(job_id)
+        
+        job = entry['job']
         return jsonify({
             'success': True,
-            'skills': skills
+            'job_id': job_id,
+            'registered_at': datetime.fromtimestamp(entry['created_at']).isoformat(),
+            'job_description': job['text'],
+            'keywords': job['keywords'][:50],
+            'skills': sorted(job['skills']),
+            'entities': job['nlp']['entities'],
+            'concepts': job['nlp']['concepts'],
+            'has_embedding': job['nlp']['embedding'] is not None
         })
+        
     except Exception as e:
         return jsonify({
             'success': False,
             'error': str(e)
         }), 500
 
-@app.route('/api/keywords', methods=['POST'])
-def extract_keywords_endpoint():
-    """Extract keywords from text"""
+@app.route('/api/resumes', methods=['POST'])
+def add_resumes():
+    """
+    Store resumes in the corpus used for ranking
+    
+    Request:
+        - resume_files: PDF/DOCX/TXT files (repeat the field per file)
+        
+    Response:
+        - results: resume_id per file (added is False if already stored)
+        - errors: Files that could not be processed
+    """
     try:
-        data = request.get_json()
-        text = data.get('text', '')
+        resume_files = [f for f in request.files.getlist('resume_files') if f.filename]
+        if not resume_files:
+            return jsonify({'error': 'No resume files provided'}), 400
         
-        if not text:
-            return jsonify({'error': 'No text provided'}), 400
+        if len(resume_files) > app.config['MAX_BATCH_FILES']:
+            return jsonify({
+                'error': f"Too many files. Maximum is {app.config['MAX_BATCH_FILES']}"
+            }), 400
         
-        keywords = extract_keywords(text)
+        # Step 1: Parse every file
+        parsed = []  # (filename, resume_id, resume_text)
+        errors = []
+        for resume_file in resume_files:
+            if not allowed_file(resume_file.filename):
+                errors.append({
+                    'filename': resume_file.filename,
+                    'error': 'Invalid file type. Use PDF, DOCX, or TXT'
+                })
+                continue
+            
+            try:
+                resume_data = resume_file.read()
+                resume_text = parse_upload(resume_data, resume_file.mimetype)
+                parsed.append((resume_file.filename, ResumeIndex.make_id(resume_data), resume_text))
+            except Exception as e:
+                errors.append({'filename': resume_file.filename, 'error': str(e)})
+        
+        results = []
+        if parsed:
+            # Step 2: Embed all resumes in one batch
+            with span('clean'):
+                resume_cleans = [clean_text(text) for _, _, text in parsed]
+            embeddings = nlp_analyzer.encode(resume_cleans)
+            if embeddings is None:
+                return jsonify({'error': 'Embedding model unavailable'}), 503
+            
+            # Step 3: Store texts and embeddings
+            added = get_resume_index().add([
+                {'resume_id': resume_id, 'filename': filename, 'text': text, 'embedding': embedding}
+                for (filename, resume_id, text), embedding in zip(parsed, embeddings)
+            ])
+            results = [
+                dict(item, filename=filename)
+                for (filename, _, _), item in zip(parsed, added)
+            ]
         
+        record('resumes', len(resume_files))
         return jsonify({
             'success': True,
-            'keywords': keywords[:50],  # Top 50
-            'count': len(keywords)
+            'added': sum(1 for item in results if item['added']),
+            'results': results,
+            'errors': errors,
+            'corpus_size': get_resume_index().count()
         })
         
     except Exception as e:
+        print(f"Error in add_resumes: {str(e)}")
+        record('error', str(e))
         return jsonify({
             'success': False,
             'error': str(e)
         }), 500
 
-# ============================================================================
-# UTILITY FUNCTIONS
-# ============================================================================
-
-def get_rating(score):
-    """Convert score to rating"""
-    if score >= 90:
-        return {
-            'level': 'Excellent',
-            'color': 'green',
-            'message': 'Very high chance of passing ATS!'
-        }
-    elif score >= 75:
-        return {
-            'level': 'Good',
-            'color': 'blue',
-            'message': 'Good chance with minor improvements'
-        }
-    elif score >= 60:
-        return {
-            'level': 'Fair',
-            'color': 'yellow',
-            'message': 'Needs improvements to pass ATS'
-        }
-    elif score >= 45:
-        return {
-            'level': 'Poor',
-            'color': 'orange',
-            'message': 'Significant changes required'
-        }
-    else:
-        return {
-            'level': 'Very Poor',
-            'color': 'red',
-            'message': 'Major overhaul needed'
-        }
-
-def generate_suggestions(score, missing_keywords, missing_skills, sections):
-    """Generate actionable improvement suggestions"""
-    suggestions = []
+@app.route('/api/resumes/rank', methods=['POST'])
+def rank_resumes():
+    """
+    Rank stored resumes against a job description
     
-    # Score-based suggestions
-    if score < 60:
-        suggestions.append({
-            'type': 'critical',
-            'category': 'Overall',
-            'message': 'Your resume needs significant improvements to pass ATS screening',
-            'action': 'Focus on adding relevant keywords and restructuring content'
-        })
+    Embedding similarity over the whole corpus picks a shortlist, which is
+    then re-scored with the full analysis pipeline.
     
-    # Keyword suggestions
-    if missing_keywords:
-        top_missing = missing_keywords[:5]
-        suggestions.append({
-            'type': 'high',
-            'category': 'Keywords',
-            'message': f'Add these critical keywords: {", ".join(top_missing)}',
-            'action': 'Incorporate these keywords naturally in your experience and skills sections'
+    Request (JSON):
+        - job_description: Text of job posting (or job_id)
+        - top_k: Number of candidates to return (default 50)
+        - shortlist: Candidates re-scored in full (default 2 * top_k)
+        - approximate: Use the IVF index if built (default false)
+        - nprobe: IVF lists scanned (default 8)
+        - profile: spaCy profile, 'fast' or 'full' (optional)
+        
+    Response:
+        - ranking: Best candidates by ATS score
+        - results: Full analysis per candidate (same shape as /api/analyze)
+    """
+    try:
+        data = request.get_json(silent=True) or {}
+        job_id = data.get('job_id')
+        job_description = data.get('job_description')
+        if not job_description and not job_id:
+            return jsonify({'error': 'No job description provided'}), 400
+        
+        profile = request_profile(data)
+        if profile and profile not in nlp_analyzer.spacy_profiles:
+            return unknown_profile(profile)
+        
+        try:
+            top_k = int(data.get('top_k', 50))
+            shortlist = int(data.get('shortlist', top_k * 2))
+            nprobe = int(data.get('nprobe', 8))
+        except (TypeError, ValueError):
+            top_k = shortlist = nprobe = 0
+        if top_k < 1 or shortlist < top_k or nprobe < 1:
+            return jsonify({
+                'error': 'top_k and nprobe must be integers of at least 1 and shortlist at least top_k'
+            }), 400
+        if shortlist > app.config['MAX_RANK_SHORTLIST']:
+            return jsonify({
+                'error': f"Shortlist too large. Maximum is {app.config['MAX_RANK_SHORTLIST']}"
+            }), 400
+        
+        # Step 1: Job side (registered or computed now)
+        if job_id:
+            job = load_registered_job(job_id, profile)
+            if job is None:
+                return job_not_found(job_id)
+        else:
+            job = pipeline.prepare_job(job_description, profile)
+        
+        if job['nlp']['embedding'] is None:
+            return jsonify({'error': 'Embedding model unavailable'}), 503
+        
+        # Step 2: Shortlist by embedding similarity
+        index = get_resume_index()
+        with span('vector_search'):
+            hits = index.search(
+                job['nlp']['embedding'],
+                k=shortlist,
+                approximate=bool(data.get('approximate', False)),
+                nprobe=nprobe
+            )
+        
+        # Step 3: Full analysis of the shortlist, reusing stored embeddings
+        stored = index.get([resume_id for resume_id, _, _ in hits])
+        hits = [hit for hit in hits if hit[0] in stored]
+        analyses = pipeline.analyze_batch(
+            [stored[resume_id]['text'] for resume_id, _, _ in hits],
+            job,
+            embeddings=index.vectors([row for _, row, _ in hits]) if hits else None,
+            profile=profile
+        )
+        
+        results = [
+            dict(
+                result,
+                resume_id=resume_id,
+                filename=stored[resume_id]['filename'],
+                vector_similarity=round(similarity * 100, 2)
+            )
+            for (resume_id, _, similarity), result in zip(hits, analyses)
+        ]
+        results = sorted(results, key=lambda r: r['ats_score'], reverse=True)[:top_k]
+        
+        ranking = [
+            {
+                'rank': i + 1,
+                'resume_id': result['resume_id'],
+                'filename': result['filename'],
+                'ats_score': result['ats_score'],
+                'vector_similarity': result['vector_similarity'],
+                'rating': result['rating']['level']
+            }
+            for i, result in enumerate(results)
+        ]
+        
+        record('corpus_size', index.count())
+        record('shortlist', len(hits))
+        return jsonify({
+            'success': True,
+            'corpus_size': index.count(),
+            'shortlisted': len(hits),
+            'ranking': ranking,
+            'results': results,
+            'analysis_timestamp': datetime.now().isoformat()
         })
+        
+    except Exception as e:
+        print(f"Error in rank_resumes: {str(e)}")
+        record('error', str(e))
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/api/resumes/index', methods=['POST'])
+def build_resume_index():
+    """
+    Build (or rebuild) the approximate IVF index over stored resumes
     
-    # Skill suggestions
-    if missing_skills:
-        top_skills = missing_skills[:5]
-        suggestions.append({
-            'type': 'high',
-            'category': 'Skills',
-            'message': f'Missing required skills: {", ".join(top_skills)}',
-            'action': 'Add these skills if you have them, or consider learning them'
+    Request (JSON, optional):
+        - n_lists: Number of clusters (default about sqrt of corpus size)
+        - iterations: k-means iterations (default 10)
+    """
+    try:
+        data = request.get_json(silent=True) or {}
+        n_lists = data.get('n_lists')
+        
+        with span('ivf_build'):
+            info = get_resume_index().build_ivf(
+                n_lists=int(n_lists) if n_lists else None,
+                iterations=int(data.get('iterations', 10))
+            )
+        
+        return jsonify({
+            'success': True,
+            'index': info
         })
-    
-    # Section suggestions
-    if not sections.get('summary'):
-        suggestions.append({
-            'type': 'medium',
-            'category': 'Structure',
-            'message': 'Add a professional summary at the top',
-            'action': 'Write a 2-3 sentence summary highlighting your key qualifications'
+        
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        print(f"Error in build_resume_index: {str(e)}")
+        record('error', str(e))
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/api/resumes/stats', methods=['GET'])
+def resume_index_stats():
+    """Get resume corpus size and index details"""
+    try:
+        return jsonify({
+            'success': True,
+            'corpus': get_resume_index().stats()
         })
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/api/jobs/match', methods=['POST'])
+def match_jobs():
+    """
+    Score one resume against many job postings
     
-    if not sections.get('skills'):
-        suggestions.append({
-            'type': 'high',
-            'category': 'Structure',
-            'message': 'Add a dedicated Skills section',
-            'action': 'Create a clear skills section with relevant technical and soft skills'
-        })
+    The resume is parsed and encoded once; similarities to every posting
+    come from one matrix product. Raw postings are registered as they are
+    prepared, so later calls can pass their job_id instead.
     
-    # Formatting suggestions
-    suggestions.append({
-        'type': 'low',
-        'category': 'Formatting',
-        'message': 'Use standard section headings',
-        'action': 'Use clear headings like "Experience", "Education", "Skills"'
-    })
+    Request (multipart, or JSON with resume_id):
+        - resume_file: PDF/DOCX/TXT file (or resume_id from POST /api/resumes)
+        - job_descriptions: Posting texts (repeat the field per posting)
+        - job_ids: Registered posting IDs (repeat the field or comma-separate)
+        - limit: Number of matches to return (default all)
+        - details: Include the full analysis per posting
+        - profile: spaCy profile, 'fast' or 'full' (optional)
+        
+    Response:
+        - matches: Postings ranked by ATS score
+        - errors: job_ids that are not registered
+    """
+    try:
+        data = request.get_json(silent=True) or request.form
+        job_descriptions = request_list(data, 'job_descriptions')
+        job_ids = request_list(data, 'job_ids')
+        
+        if not job_descriptions and not job_ids:
+            return jsonify({'error': 'No job descriptions provided'}), 400
+        
+        if len(job_descriptions) + len(job_ids) > app.config['MAX_MATCH_JOBS']:
+            return jsonify({
+                'error': f"Too many job postings. Maximum is {app.config['MAX_MATCH_JOBS']}"
+            }), 400
+        
+        try:
+            limit = int(data.get('limit') or 0) or None
+        except (TypeError, ValueError):
+            limit = -1
+        if limit is not None and limit < 1:
+            return jsonify({'error': 'limit must be a positive integer'}), 400
+        
+        profile = request_profile(data)
+        if profile and profile not in nlp_analyzer.spacy_profiles:
+            return unknown_profile(profile)
+        
+        # Step 1: Resume text (uploaded or stored in the corpus)
+        resume_embedding = None
+        resume_id = data.get('resume_id')
+        if resume_id:
+            stored = get_resume_index().get([resume_id]).get(resume_id)
+            if stored is None:
+                return jsonify({'error': f'Resume {resume_id} not found'}), 404
+            resume_text = stored['text']
+            resume_embedding = get_resume_index().vectors([stored['row']])[0]
+        else:
+            resume_file = request.files.get('resume_file')
+            if resume_file is None or resume_file.filename == '':
+                return jsonify({'error': 'No resume file provided'}), 400
+            if not allowed_file(resume_file.filename):
+                return jsonify({'error': 'Invalid file type. Use PDF, DOCX, or TXT'}), 400
+            resume_text = parse_upload(resume_file.read(), resume_file.mimetype)
+        
+        # Step 2: Postings, reusing registered ones and preparing the rest in one batch
+        jobs = {}  # job_id -> prepared job
+        errors = []
+        for job_id in job_ids:
+            job = load_registered_job(job_id, profile)
+            if job is None:
+                errors.append({'job_id': job_id, 'error': 'Job description not found'})
+            else:
+                jobs[job_id] = job
+        
+        new_postings = {}
+        for job_description in job_descriptions:
+            job_id = JobRegistry.make_id(job_description)
+            if job_id in jobs or job_id in new_postings:
+                continue
+            job = load_registered_job(job_id, profile)
+            if job is None:
+                new_postings[job_id] = job_description
+            else:
+                jobs[job_id] = job
+        
+        if new_postings:
+            # Only complete preparations for the configured profile are stored
+            version = pipeline.config_version(profile)
+            prepared = pipeline.prepare_jobs(list(new_postings.values()), profile)
+            store = version == pipeline.config_version() and nlp_analyzer.is_ready()
+            for job in prepared:
+                if store:
+                    job_registry.register(job, version)
+                jobs[JobRegistry.make_id(job['text'])] = job
+        
+        # Step 3: Score the resume against every posting
+        job_ids = list(jobs)
+        analyses = pipeline.match_jobs(
+            resume_text, [jobs[job_id] for job_id in job_ids],
+            resume_embedding=resume_embedding, profile=profile
+        )
+        
+        matches = []
+        for job_id, result in zip(job_ids, analyses):
+            match = {
+                'job_id': job_id,
+                'title': posting_title(jobs[job_id]['text']),
+                'ats_score': result['ats_score'],
+                'rating': result['rating']['level'],
+                'semantic_similarity': result['semantic_similarity'],
+                'keyword_match_percentage': result['keyword_match']['match_percentage'],
+                'skill_match_percentage': result['skill_gap']['match_percentage'],
+                'matched_skills': result['skill_gap']['present'],
+                'missing_skills': result['skill_gap']['missing']
+            }
+            if data.get('details') in (True, 'true', '1'):
+                match['analysis'] = result
+            matches.append(match)
+        
+        matches.sort(key=lambda m: m['ats_score'], reverse=True)
+        matches = [dict(match, rank=i + 1) for i, match in enumerate(matches[:limit])]
+        
+        record('postings', len(job_ids))
+        return jsonify({
+            'success': True,
+            'total': len(job_ids),
+            'matches': matches,
+            'errors': errors,
+            'analysis_timestamp': datetime.now().isoformat()
+        })
+        
+    except Exception as e:
+        print(f"Error in match_jobs: {str(e)}")
+        record('error', str(e))
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/api/jobs', methods=['POST'])
+def submit_job():
+    """
+    Queue a resume analysis and return immediately
     
-    suggestions.append({
-        'type': 'low',
-        'category': 'Formatting',
-        'message': 'Avoid tables, images, and complex formatting',
-        'action': 'Use simple text formatting that ATS can easily parse'
+    Request:
+        - resume_file: PDF/DOCX/TXT file
+        - job_description: Text of job posting
+        
+    Response:
+        - job_id: ID to poll with GET /api/jobs/<job_id>
+    """
+    try:
+        # Validate request
+        if 'resume_file' not in request.files:
+            return jsonify({'error': 'No resume file provided'}), 400
+        
+        if 'job_description' not in request.form:
+            return jsonify({'error': 'No job description provided'}), 400
+        
+        resume_file = request.files['resume_file']
+        job_description = request.form['job_description']
+        
+        if resume_file.filename == '':
+            return jsonify({'error': 'No file selected'}), 400
+        
+        if not allowed_file(resume_file.filename):
+            return jsonify({'error': 'Invalid file type. Use PDF, DOCX, or TXT'}), 400
+        
+        ensure_job_workers()
+        
+        job_id = job_queue.submit(
+            secure_filename(resume_file.filename),
+            resume_file.read(),
+            job_description
+        )
+        
+        return jsonify({
+            'success': True,
+            'job_id': job_id,
+            'status': 'queued',
+            'status_url': f'/api/jobs/{job_id}'
+        }), 202
+        
+    except Exception as e:
+        print(f"Error in submit_job: {str(e)}")
+        record('error', str(e))
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/api/jobs/<job_id>', methods=['GET'])
+def get_job(job_id):
+    """Get status and result of a queued analysis"""
+    try:
+        ensure_job_workers()
+        
+        job = job_queue.get(job_id)
+        if job is None:
+            return jsonify({'error': 'Job not found'}), 404
+        
+        job['success'] = True
+        return jsonify(job)
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/api/cache/stats', methods=['GET'])
+def cache_stats():
+    """Get result cache, job description registry and embedding cache counters"""
+    return jsonify({
+        'success': True,
+        'cache': result_cache.stats(),
+        'job_registry': job_registry.stats(),
+        'embedding_cache': embedding_cache.stats()
     })
+
+@app.route('/metrics', methods=['GET'])
+def prometheus_metrics():
+    """Expose metrics in Prometheus text format"""
+    if not metrics.REGISTRY.enabled:
+        return jsonify({'error': 'Metrics are disabled'}), 404
     
-    # Positive feedback
-    if score >= 75:
-        suggestions.insert(0, {
-            'type': 'success',
-            'category': 'Overall',
-            'message': 'Great job! Your resume is well-optimized for ATS',
-            'action': 'Make the suggested minor improvements to reach excellent level'
+    return Response(
+        metrics.REGISTRY.render(),
+        mimetype='text/plain; version=0.0.4'
+    )
+
+@app.route('/api/skills', methods=['GET'])
+def get_skills_database():
+    """
+    Get skills by category, or page through the taxonomy
+
+    Query parameters (any of them selects paging):
+        page: 1-based page number (default 1)
+        per_page: Skills per page (default 100, at most MAX_SKILLS_PAGE)
+        category: Only skills in this category
+        q: Only skills whose name starts with this
+    """
+    try:
+        paging = {'page', 'per_page', 'category', 'q'} & set(request.args)
+        if not paging:
+            return jsonify({
+                'success': True,
+                'skills': skill_extractor.get_skills_database()
+            })
+        
+        try:
+            page = int(request.args.get('page', 1))
+            per_page = int(request.args.get('per_page', 100))
+        except ValueError:
+            page = per_page = 0
+        if page < 1 or not 1 <= per_page <= app.config['MAX_SKILLS_PAGE']:
+            return jsonify({
+                'success': False,
+                'error': f"page must be >= 1 and per_page between 1 and {app.config['MAX_SKILLS_PAGE']}"
+            }), 400
+        
+        try:
+            result = skill_extractor.skills_page(
+                offset=(page - 1) * per_page,
+                limit=per_page,
+                category=request.args.get('category'),
+                prefix=request.args.get('q')
+            )
+        except ValueError as e:
+            return jsonify({'success': False, 'error': str(e)}), 400
+        
+        return jsonify(dict(result, success=True, page=page, per_page=per_page))
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/api/skills/reload', methods=['POST'])
+def reload_skills():
+    """Recompile the skills taxonomy if it changed and load it in this worker"""
+    try:
+        if not skill_extractor.index_path:
+            return jsonify({
+                'success': False,
+                'error': 'No skills taxonomy configured (set SKILLS_TAXONOMY or SKILLS_INDEX)'
+            }), 400
+        
+        try:
+            taxonomy = skill_extractor.reload()
+        except ValueError as e:
+            # Invalid taxonomy; the loaded one stays in use
+            return jsonify({'success': False, 'error': str(e)}), 400
+        
+        return jsonify({'success': True, 'taxonomy': taxonomy})
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/api/keywords', methods=['POST'])
+def extract_keywords_endpoint():
+    """Extract keywords from text"""
+    try:
+        data = request.get_json()
+        text = data.get('text', '')
+        
+        if not text:
+            return jsonify({'error': 'No text provided'}), 400
+        
+        keywords = extract_keywords(text)
+        
+        return jsonify({
+            'success': True,
+            'keywords': keywords[:50],  # Top 50
+            'count': len(keywords)
         })
-    
-    return suggestions
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
 
 # ============================================================================
 # ERROR HANDLERS
@@ -414,5 +1291,9 @@ if __name__ == '__main__':
     print("API will be available at: http://localhost:5000")
     print("="*70)
     
+    # Load models in the background; the reloader's watcher process never serves requests
+    if app.config['MODEL_WARMUP'] and os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+        pipeline.start_warm_up()
+    
     # Run in debug mode for development
     app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
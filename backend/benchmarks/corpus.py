@@ -0,0 +1,227 @@
+"""
+Benchmark Corpus - Deterministic synthetic resumes and job descriptions
+Renders the same text as TXT, DOCX and PDF so parsers can be compared
+"""
+
+import io
+import random
+
+# Roughly one printed page of prose
+WORDS_PER_PAGE = 450
+LINES_PER_PDF_PAGE = 50
+CHARS_PER_PDF_LINE = 90
+
+SKILLS = [
+    'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'go', 'rust',
+    'react', 'angular', 'node.js', 'django', 'flask', 'spring', 'sql',
+    'postgresql', 'mongodb', 'redis', 'aws', 'azure', 'gcp', 'docker',
+    'kubernetes', 'terraform', 'jenkins', 'ci/cd', 'machine learning',
+    'deep learning', 'pytorch', 'tensorflow', 'pandas', 'numpy', 'tableau',
+    'power bi', 'agile', 'scrum', 'microservices', 'rest api', 'graphql',
+    'leadership', 'communication', 'problem solving', 'linux', 'security'
+]
+
+VERBS = [
+    'designed', 'built', 'developed', 'led', 'optimized', 'migrated',
+    'automated', 'maintained', 'delivered', 'improved', 'launched', 'scaled'
+]
+
+NOUNS = [
+    'platform', 'pipeline', 'service', 'dashboard', 'api', 'system',
+    'application', 'infrastructure', 'data warehouse', 'model', 'framework',
+    'integration', 'workflow', 'feature', 'release process', 'test suite'
+]
+
+FILLER = [
+    'team', 'customers', 'performance', 'reliability', 'latency', 'cost',
+    'quality', 'stakeholders', 'requirements', 'production', 'users',
+    'engineers', 'product', 'roadmap', 'metrics', 'scale', 'revenue'
+]
+
+COMPANIES = ['Acme Corp', 'Globex', 'Initech', 'Umbrella Labs', 'Hooli', 'Stark Industries']
+
+def _sentence(rng: random.Random) -> str:
+    """One resume-style bullet sentence"""
+    return (
+        f"{rng.choice(VERBS).capitalize()} a {rng.choice(NOUNS)} using "
+        f"{rng.choice(SKILLS)} and {rng.choice(SKILLS)} that improved "
+        f"{rng.choice(FILLER)} for {rng.choice(FILLER)} by {rng.randint(5, 80)}%."
+    )
+
+def generate_resume(pages: int = 1, seed: int = 0) -> str:
+    """
+    Generate a resume of roughly the given number of pages
+
+    Args:
+        pages: Target length in pages
+        seed: Random seed (same seed, same text)
+
+    Returns:
+        Resume text with standard section headings
+    """
+    rng = random.Random(f'resume-{pages}-{seed}')
+    target_words = pages * WORDS_PER_PAGE
+
+    lines = [
+        'Jane Candidate',
+        'jane.candidate@example.com | +1 555 123 4567 | linkedin.com/in/janecandidate | github.com/janec',
+        '',
+        'Summary',
+        f"Software engineer with {rng.randint(2, 15)} years of experience in "
+        f"{', '.join(rng.sample(SKILLS, 4))}.",
+        '',
+        'Experience'
+    ]
+
+    words = sum(len(line.split()) for line in lines)
+    year = 2024
+    while words < target_words * 0.8:
+        start = year - rng.randint(1, 4)
+        lines.append(f"Senior Engineer, {rng.choice(COMPANIES)} ({start} - {year})")
+        for _ in range(rng.randint(3, 6)):
+            sentence = '- ' + _sentence(rng)
+            lines.append(sentence)
+            words += len(sentence.split())
+        lines.append('')
+        year = start
+
+    lines += [
+        'Education',
+        'Bachelor of Science in Computer Science, State University',
+        '',
+        'Skills',
+        ', '.join(rng.sample(SKILLS, 15)),
+        '',
+        'Projects'
+    ]
+    words = sum(len(line.split()) for line in lines)
+    while words < target_words:
+        sentence = '- ' + _sentence(rng)
+        lines.append(sentence)
+        words += len(sentence.split())
+
+    lines += ['', 'Certifications', 'AWS Certified Solutions Architect']
+    return '\n'.join(lines)
+
+def generate_job_description(pages: int = 1, seed: int = 0) -> str:
+    """
+    Generate a job description of roughly the given number of pages
+
+    Args:
+        pages: Target length in pages
+        seed: Random seed (same seed, same text)
+
+    Returns:
+        Job description text
+    """
+    rng = random.Random(f'job-{pages}-{seed}')
+    target_words = pages * WORDS_PER_PAGE
+
+    lines = [
+        f"{rng.choice(['Senior', 'Staff', 'Lead'])} Software Engineer - {rng.choice(COMPANIES)}",
+        '',
+        'About the role',
+        'We are looking for an engineer to build and scale our '
+        f"{rng.choice(NOUNS)} and {rng.choice(NOUNS)}.",
+        '',
+        'Requirements',
+        f"- {rng.randint(3, 8)}+ years of experience in software development",
+        "- Bachelor's or Master's degree in computer science or related field",
+        f"- Strong experience with {', '.join(rng.sample(SKILLS, 6))}",
+        '',
+        'Responsibilities'
+    ]
+
+    words = sum(len(line.split()) for line in lines)
+    while words < target_words:
+        sentence = (
+            f"- {rng.choice(VERBS).capitalize()} {rng.choice(NOUNS)} with "
+            f"{rng.choice(SKILLS)}, working with {rng.choice(FILLER)} to improve "
+            f"{rng.choice(FILLER)}."
+        )
+        lines.append(sentence)
+        words += len(sentence.split())
+
+    lines += ['', 'Nice to have', ', '.join(rng.sample(SKILLS, 5)), 'Certification preferred.']
+    return '\n'.join(lines)
+
+def to_txt(text: str) -> bytes:
+    """Render text as a UTF-8 TXT file"""
+    return text.encode('utf-8')
+
+def to_docx(text: str) -> bytes:
+    """Render text as a DOCX file, one paragraph per line"""
+    import docx
+
+    document = docx.Document()
+    for line in text.split('\n'):
+        document.add_paragraph(line)
+
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+def to_pdf(text: str) -> bytes:
+    """
+    Render text as a simple multi-page PDF (Helvetica, no dependencies)
+
+    Args:
+        text: Plain text
+
+    Returns:
+        PDF file contents
+    """
+    # Wrap long lines and split into pages
+    lines = []
+    for line in text.split('\n'):
+        while len(line) > CHARS_PER_PDF_LINE:
+            cut = line.rfind(' ', 0, CHARS_PER_PDF_LINE)
+            cut = cut if cut > 0 else CHARS_PER_PDF_LINE
+            lines.append(line[:cut])
+            line = line[cut:].lstrip()
+        lines.append(line)
+    pages = [lines[i:i + LINES_PER_PDF_PAGE] for i in range(0, len(lines), LINES_PER_PDF_PAGE)] or [[]]
+
+    # Objects: 1 catalog, 2 page tree, 3 font, then (page, content) pairs
+    objects = [None, None, '<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>']
+    page_ids = []
+    for page_lines in pages:
+        escaped = (
+            line.encode('latin-1', 'replace').decode('latin-1')
+            .replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+            for line in page_lines
+        )
+        content = 'BT /F1 10 Tf 50 770 Td 14 TL ' + ' '.join(f"({line}) '" for line in escaped) + ' ET'
+        content_id = len(objects) + 2
+        page_ids.append(len(objects) + 1)
+        objects.append(
+            f'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] '
+            f'/Contents {content_id} 0 R /Resources << /Font << /F1 3 0 R >> >> >>'
+        )
+        objects.append(f'<< /Length {len(content.encode("latin-1"))} >>\nstream\n{content}\nendstream')
+
+    objects[0] = '<< /Type /Catalog /Pages 2 0 R >>'
+    kids = ' '.join(f'{page_id} 0 R' for page_id in page_ids)
+    objects[1] = f'<< /Type /Pages /Kids [{kids}] /Count {len(page_ids)} >>'
+
+    output = bytearray(b'%PDF-1.4\n')
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(output))
+        output += f'{number} 0 obj\n{body}\nendobj\n'.encode('latin-1')
+
+    xref_offset = len(output)
+    output += f'xref\n0 {len(objects) + 1}\n0000000000 65535 f \n'.encode('latin-1')
+    for offset in offsets:
+        output += f'{offset:010d} 00000 n \n'.encode('latin-1')
+    output += (
+        f'trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\n'
+        f'startxref\n{xref_offset}\n%%EOF\n'
+    ).encode('latin-1')
+
+    return bytes(output)
+
+def render(text: str, file_type: str) -> bytes:
+    """Render text in the given format ('txt', 'docx' or 'pdf')"""
+    renderers = {'txt': to_txt, 'docx': to_docx, 'pdf': to_pdf}
+    return renderers[file_type](text)
@@ -0,0 +1,178 @@
+"""
+Document Passes Profile - Text passes per analysis with and without ProcessedDocument
+Profiles the text stages (no models) and counts each whole-text operation by caller
+
+Usage (from backend/):
+    python -m benchmarks.document_passes --output passes.json
+    python -m benchmarks.document_passes --sizes 1 10 --repeat 20
+
+'legacy' repeats the text stages as the pipeline ran them before
+ProcessedDocument: section search (case-insensitive, on its own lowercased
+copy), clean_text, keyword tokenizing and counting, the skill scan, then
+the experience and education scores each lowercasing both texts.
+'document' passes one ProcessedDocument per input to the components.
+The job side is prepared once in both, as in the pipeline.
+"""
+
+import argparse
+import cProfile
+import json
+import os
+import platform
+import pstats
+import re
+import sys
+from collections import Counter
+from datetime import datetime
+
+from benchmarks.corpus import generate_resume, generate_job_description
+from benchmarks.run_benchmarks import measure
+from models.ats_scorer import ATSScorer
+from models.resume_parser import ResumeParser
+from utils.processed_document import ProcessedDocument
+from utils.skill_extraction import SkillExtractor
+from utils.text_processing import clean_text, get_stop_words, tokenize
+
+DEFAULT_SIZES = [1, 5]
+
+# Whole-text operations: (label, profiler function name, source file suffix or None)
+OPERATIONS = (
+    ('lower', "<method 'lower' of 'str' objects>", None),
+    ('clean_text', 'clean_text', 'text_processing.py'),
+    ('re.sub', 'sub', os.path.join('re', '__init__.py')),
+    ('tokenize', 'tokenize', 'text_processing.py'),
+    ('skill scan', 'find', 'skill_matcher.py')
+)
+
+# Per-token calls, not passes over the text
+PER_TOKEN_CALLERS = ('skill_matcher.py',)
+
+def legacy_sections(parser, text: str) -> dict:
+    """The previous ResumeParser.extract_sections"""
+    text_lower = text.lower()
+    return {
+        section_name: bool(re.search(pattern, text_lower, re.IGNORECASE))
+        for section_name, pattern in parser.section_patterns.items()
+    }
+
+def legacy_keywords(text: str, top_n: int = 50) -> list:
+    """The previous extract_keywords: filter every token, then count"""
+    stop_words = get_stop_words()
+    keywords = [
+        word for word in tokenize(text)
+        if word not in stop_words and len(word) > 2 and word.isalpha()
+    ]
+    return [word for word, _ in Counter(keywords).most_common(top_n)]
+
+def legacy_stages(components, resume: str, job: dict) -> dict:
+    """Text stages as run before ProcessedDocument, one pass per component"""
+    parser, extractor, scorer = components
+    sections = legacy_sections(parser, resume)
+    resume_clean = clean_text(resume)
+    keywords = legacy_keywords(resume_clean)
+    skills = extractor.extract_skills(resume)
+    experience = scorer._calculate_experience_score(resume, job['text'])
+    education = scorer._calculate_education_score(resume, job['text'])
+    return {'sections': sections, 'keywords': keywords, 'skills': skills,
+            'scores': (experience, education)}
+
+def document_stages(components, resume: str, job: dict) -> dict:
+    """Text stages sharing one ProcessedDocument per input"""
+    parser, extractor, scorer = components
+    document = ProcessedDocument(resume)
+    job_document = ProcessedDocument(job['text'], clean=job['clean'])
+    sections = parser.extract_sections(document)
+    keywords = document.keywords()
+    skills = extractor.extract_skills(document)
+    experience = scorer._calculate_experience_score(document, job_document)
+    education = scorer._calculate_education_score(document, job_document)
+    return {'sections': sections, 'keywords': keywords, 'skills': skills,
+            'scores': (experience, education)}
+
+def count_operations(fn) -> dict:
+    """
+    Profile one call and count whole-text operations
+
+    Returns:
+        {label: calls}, excluding per-token calls
+    """
+    profiler = cProfile.Profile()
+    profiler.runcall(fn)
+    stats = pstats.Stats(profiler).stats
+
+    counts = {}
+    for label, name, suffix in OPERATIONS:
+        total = 0
+        for (filename, _, function), (_, _, _, _, callers) in stats.items():
+            if function != name or (suffix and not filename.endswith(suffix)):
+                continue
+            for (caller_file, _, _), caller_stats in callers.items():
+                if not caller_file.endswith(PER_TOKEN_CALLERS):
+                    total += caller_stats[0]
+        counts[label] = total
+    return counts
+
+def run(sizes, repeat) -> dict:
+    """
+    Count passes and time both variants for every document size
+
+    Returns:
+        {pages: {'legacy'|'document': {'passes', 'timing'}, 'same_output'}}
+    """
+    components = (ResumeParser(), SkillExtractor(), ATSScorer())
+    results = {}
+    for pages in sizes:
+        resume = generate_resume(pages)
+        job_text = generate_job_description(pages)
+        job = {'text': job_text, 'clean': clean_text(job_text)}
+        print(f"  {pages} page(s)", file=sys.stderr)
+
+        row = {}
+        for variant, stages in (('legacy', legacy_stages), ('document', document_stages)):
+            row[variant] = {
+                'passes': count_operations(lambda: stages(components, resume, job)),
+                'timing': measure(lambda: stages(components, resume, job), repeat)
+            }
+        row['same_output'] = (
+            legacy_stages(components, resume, job) == document_stages(components, resume, job)
+        )
+        results[str(pages)] = row
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description='Profile text passes with and without ProcessedDocument')
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help='Resume and job description sizes in pages')
+    parser.add_argument('--repeat', type=int, default=10, help='Timed runs per variant')
+    parser.add_argument('--output', help='Write results JSON here (default: stdout)')
+    args = parser.parse_args()
+
+    results = run(args.sizes, args.repeat)
+
+    for pages, row in results.items():
+        print(f"{pages:>3}p  legacy {row['legacy']['timing']['median_ms']:>7.2f} ms  "
+              f"document {row['document']['timing']['median_ms']:>7.2f} ms", file=sys.stderr)
+        for label, _, _ in OPERATIONS:
+            print(f"       {label:<14} {row['legacy']['passes'][label]:>3} -> "
+                  f"{row['document']['passes'][label]:>3}", file=sys.stderr)
+        if not row['same_output']:
+            print(f"⚠ {pages}p: outputs differ", file=sys.stderr)
+
+    output = json.dumps({
+        'meta': {
+            'timestamp': datetime.now().isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'repeat': args.repeat
+        },
+        'sizes': results
+    }, indent=2)
+    if args.output:
+        with open(args.output, 'w') as file:
+            file.write(output + '\n')
+    else:
+        print(output)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,208 @@
+"""
+Embedding Backend Benchmark - Parity, throughput and memory per inference backend
+Each backend runs in a fresh process; embeddings are compared with the torch reference
+
+Usage (from backend/):
+    python -m scripts.export_onnx --output onnx/all-MiniLM-L6-v2
+    python -m benchmarks.embedding_backends --onnx-dir onnx/all-MiniLM-L6-v2 --output backends.json
+
+Exits with status 1 if a backend fails to run or drifts below its minimum
+cosine similarity.
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+import numpy as np
+
+from benchmarks.corpus import generate_resume, generate_job_description
+
+REFERENCE_BACKEND = 'torch'
+DEFAULT_BATCH_SIZES = [1, 8, 32]
+
+# Minimum per-text cosine similarity to the reference embeddings
+DEFAULT_MIN_COSINE = {'onnx': 0.9999, 'onnx-int8': 0.98}
+
+def parity_corpus(documents: int = 10) -> list:
+    """
+    Fixed texts: whole cleaned documents (long, truncated by the model)
+    plus their section chunks (typical chunked-mode inputs)
+    """
+    from utils.chunking import section_chunks
+    from utils.text_processing import clean_text
+
+    texts = []
+    for seed in range(documents):
+        for text in (generate_resume(1 + seed % 5, seed=seed),
+                     generate_job_description(1 + seed % 2, seed=seed)):
+            texts.append(clean_text(text))
+            texts.extend(chunk for _, chunk in section_chunks(text))
+    return texts
+
+def run_backend(backend, model_name, onnx_dir, threads, batch_sizes, repeat, documents, output_path) -> dict:
+    """
+    Load one backend, time it and save its corpus embeddings (runs in the child process)
+
+    Returns:
+        Dictionary with load time, memory and throughput per batch size
+    """
+    from models.embedding_backend import create_embedding_backend
+    from utils.memory import process_memory
+
+    texts = parity_corpus(documents)
+
+    before = process_memory()
+    start = time.perf_counter()
+    model = create_embedding_backend(backend, model_name, onnx_dir, threads)
+    load_time = time.perf_counter() - start
+    loaded = process_memory()
+
+    embeddings = model.encode(texts)
+    np.save(output_path, np.asarray(embeddings, dtype=np.float32))
+    after = process_memory()
+
+    throughput = {}
+    for batch_size in batch_sizes:
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            model.encode(texts, batch_size=batch_size)
+            times.append(time.perf_counter() - start)
+        best = min(times)
+        throughput[str(batch_size)] = {
+            'texts_per_s': round(len(texts) / best, 1),
+            'ms_per_text': round(best / len(texts) * 1000, 3)
+        }
+    peak = process_memory()
+
+    return {
+        'texts': len(texts),
+        'load_s': round(load_time, 3),
+        'memory': {
+            'model_rss_mb': round(loaded.get('rss_mb', 0) - before.get('rss_mb', 0), 1),
+            'inference_rss_mb': round(after.get('rss_mb', 0) - before.get('rss_mb', 0), 1),
+            'peak_rss_mb': peak.get('rss_mb'),
+            'peak_uss_mb': peak.get('uss_mb')
+        },
+        'throughput': throughput
+    }
+
+def parity(embeddings: np.ndarray, reference: np.ndarray) -> dict:
+    """Per-text cosine similarity to the reference embeddings"""
+    a = embeddings / np.clip(np.linalg.norm(embeddings, axis=1, keepdims=True), 1e-12, None)
+    b = reference / np.clip(np.linalg.norm(reference, axis=1, keepdims=True), 1e-12, None)
+    cosine = (a * b).sum(axis=1)
+    return {
+        'min_cosine': round(float(cosine.min()), 6),
+        'mean_cosine': round(float(cosine.mean()), 6),
+        'p1_cosine': round(float(np.percentile(cosine, 1)), 6),
+        'max_abs_diff': round(float(np.abs(embeddings - reference).max()), 6)
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark embedding backends against the torch reference')
+    parser.add_argument('--backends', nargs='+', default=['torch', 'onnx', 'onnx-int8'],
+                        help='Backends to measure (torch is the reference)')
+    parser.add_argument('--model', default='all-MiniLM-L6-v2', help='Sentence transformer name')
+    parser.add_argument('--onnx-dir', default='onnx/all-MiniLM-L6-v2',
+                        help='Output directory of scripts/export_onnx.py')
+    parser.add_argument('--threads', type=int, default=0, help='Intra-op threads (0: runtime default)')
+    parser.add_argument('--batch-sizes', type=int, nargs='+', default=DEFAULT_BATCH_SIZES,
+                        help='encode batch sizes to time')
+    parser.add_argument('--repeat', type=int, default=3, help='Timed passes over the corpus per batch size')
+    parser.add_argument('--documents', type=int, default=10, help='Resumes and postings in the corpus')
+    parser.add_argument('--min-cosine', action='append', default=[], metavar='BACKEND=VALUE',
+                        help='Override a parity threshold (repeatable)')
+    parser.add_argument('--output', help='Write results JSON here (default: stdout)')
+    parser.add_argument('--child', help=argparse.SUPPRESS)
+    parser.add_argument('--embeddings', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        # stdout carries only the result; model loading logs go to stderr
+        with contextlib.redirect_stdout(sys.stderr):
+            result = run_backend(
+                args.child, args.model, args.onnx_dir, args.threads,
+                args.batch_sizes, args.repeat, args.documents, args.embeddings
+            )
+        print(json.dumps(result))
+        return
+
+    thresholds = dict(DEFAULT_MIN_COSINE)
+    thresholds.update({key: float(value) for key, value in (item.split('=', 1) for item in args.min_cosine)})
+
+    backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    work_dir = tempfile.mkdtemp(prefix='embedding-backends-')
+    backends = {}
+    embeddings = {}
+    for backend in args.backends:
+        path = os.path.join(work_dir, f'{backend}.npy')
+        command = [
+            sys.executable, '-m', 'benchmarks.embedding_backends', '--child', backend,
+            '--model', args.model, '--onnx-dir', args.onnx_dir, '--threads', str(args.threads),
+            '--repeat', str(args.repeat), '--documents', str(args.documents),
+            '--embeddings', path, '--batch-sizes', *map(str, args.batch_sizes)
+        ]
+        print(f"  {backend}", file=sys.stderr)
+        completed = subprocess.run(command, cwd=backend_dir, stdout=subprocess.PIPE)
+        if completed.returncode != 0:
+            backends[backend] = {'error': f'exit status {completed.returncode}'}
+            continue
+        backends[backend] = json.loads(completed.stdout)
+        embeddings[backend] = np.load(path)
+
+    failed = []
+    reference = embeddings.get(REFERENCE_BACKEND)
+    for backend, result in backends.items():
+        if 'error' in result:
+            print(f"⚠ {backend}: {result['error']}", file=sys.stderr)
+            failed.append(backend)
+            continue
+        if reference is not None and backend != REFERENCE_BACKEND:
+            result['parity'] = parity(embeddings[backend], reference)
+            result['parity']['threshold'] = thresholds.get(backend)
+            result['parity']['passed'] = (
+                thresholds.get(backend) is None or result['parity']['min_cosine'] >= thresholds[backend]
+            )
+            if not result['parity']['passed']:
+                failed.append(backend)
+
+        largest = str(max(args.batch_sizes))
+        drift = f"  min cos {result['parity']['min_cosine']:.6f}" if 'parity' in result else ''
+        print(f"{backend:<10} load {result['load_s']:>6.2f}s  "
+              f"rss +{result['memory']['inference_rss_mb']:>7.1f} MB  "
+              f"{result['throughput'][largest]['texts_per_s']:>8.1f} texts/s @ batch {largest}{drift}",
+              file=sys.stderr)
+
+    output = json.dumps({
+        'meta': {
+            'timestamp': datetime.now().isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'model': args.model,
+            'threads': args.threads,
+            'reference': REFERENCE_BACKEND
+        },
+        'backends': backends
+    }, indent=2)
+    if args.output:
+        with open(args.output, 'w') as file:
+            file.write(output + '\n')
+    else:
+        print(output)
+
+    if failed:
+        print(f"⚠ Failed or drifted beyond threshold: {', '.join(failed)}", file=sys.stderr)
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,445 @@
+"""
+Load Test - Drive the API at a fixed concurrency or arrival rate
+Reports throughput, error rate, latency percentiles and server-side stage timings
+
+Usage (from backend/):
+    # Start serve.py locally and run a closed loop of 8 clients for 60s
+    python -m benchmarks.load_test --start --workers 2 --concurrency 8 --duration 60
+
+    # Open loop: Poisson arrivals at 5 requests/second against a running server
+    python -m benchmarks.load_test --url http://localhost:5000 --mode open --rate 5
+
+Server-side stage timings come from /metrics. With several gunicorn workers each
+scrape hits one worker, so stage figures cover a sample of the traffic.
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import re
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import requests
+
+from benchmarks.corpus import generate_resume, generate_job_description, render
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MIME_TYPES = {
+    'txt': 'text/plain',
+    'pdf': 'application/pdf',
+    'docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
+}
+
+STAGE_SAMPLE = re.compile(
+    r'^ats_stage_duration_seconds_(bucket|sum|count)\{stage="([^"]*)"(?:,le="([^"]*)")?\} (\S+)$'
+)
+
+class Workload:
+    """Pre-rendered request payloads and the endpoint mix"""
+
+    def __init__(self, mix: dict, sizes: list, file_types: list, unique: bool = True):
+        self.mix = mix
+        self.unique = unique
+        self.counter = 0
+        self.lock = threading.Lock()
+        self.documents = []
+
+        for pages in sizes:
+            resume = generate_resume(pages)
+            job = generate_job_description(pages)
+            for file_type in file_types:
+                self.documents.append({
+                    'pages': pages,
+                    'file_type': file_type,
+                    'data': render(resume, file_type),
+                    'resume': resume,
+                    'job': job
+                })
+
+    def next_request(self, rng: random.Random) -> dict:
+        """
+        Pick the next request
+
+        Returns:
+            Dictionary with endpoint, pages and the requests.request() kwargs
+        """
+        endpoint = rng.choices(list(self.mix), weights=list(self.mix.values()))[0]
+        document = rng.choice(self.documents)
+
+        with self.lock:
+            self.counter += 1
+            number = self.counter
+
+        job = document['job']
+        if self.unique:
+            # A distinct job description per request keeps the result cache cold
+            job += f"\nReference: load-{os.getpid()}-{number}"
+
+        if endpoint == 'analyze':
+            kwargs = {
+                'method': 'POST',
+                'path': '/api/analyze',
+                'files': {'resume_file': (
+                    f"resume.{document['file_type']}",
+                    document['data'],
+                    MIME_TYPES[document['file_type']]
+                )},
+                'data': {'job_description': job}
+            }
+        elif endpoint == 'keywords':
+            kwargs = {'method': 'POST', 'path': '/api/keywords', 'json': {'text': document['resume']}}
+        else:
+            kwargs = {'method': 'GET', 'path': '/api/skills'}
+
+        return {'endpoint': endpoint, 'pages': document['pages'], 'kwargs': kwargs}
+
+class Recorder:
+    """Thread-safe collection of request outcomes"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.samples = []  # (endpoint, latency seconds, status or error)
+
+    def add(self, endpoint: str, latency: float, status):
+        with self.lock:
+            self.samples.append((endpoint, latency, status))
+
+def send(session: requests.Session, base_url: str, request: dict, timeout: float):
+    """Send one request and return its status code or an error name"""
+    kwargs = dict(request['kwargs'])
+    method = kwargs.pop('method')
+    path = kwargs.pop('path')
+    try:
+        response = session.request(method, base_url + path, timeout=timeout, **kwargs)
+        return response.status_code
+    except requests.RequestException as e:
+        return type(e).__name__
+
+def run_closed_loop(base_url, workload, recorder, concurrency, duration, max_requests, timeout, seed):
+    """Each client sends its next request as soon as the previous one returns"""
+    deadline = time.perf_counter() + duration
+    remaining = [max_requests or float('inf')]
+    remaining_lock = threading.Lock()
+
+    def client(index):
+        rng = random.Random(f'{seed}-{index}')
+        session = requests.Session()
+        while time.perf_counter() < deadline:
+            with remaining_lock:
+                if remaining[0] <= 0:
+                    return
+                remaining[0] -= 1
+            request = workload.next_request(rng)
+            start = time.perf_counter()
+            status = send(session, base_url, request, timeout)
+            recorder.add(request['endpoint'], time.perf_counter() - start, status)
+
+    threads = [threading.Thread(target=client, args=(i,), daemon=True) for i in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+def run_open_loop(base_url, workload, recorder, concurrency, duration, max_requests, rate, timeout, seed):
+    """
+    Requests arrive as a Poisson process regardless of how fast the server answers
+
+    Latency is measured from each request's scheduled arrival time, so time spent
+    waiting for a free client counts against the server (no coordinated omission).
+    """
+    rng = random.Random(f'{seed}-arrivals')
+    sessions = threading.local()
+
+    def fire(request, scheduled):
+        if not hasattr(sessions, 'session'):
+            sessions.session = requests.Session()
+        status = send(sessions.session, base_url, request, timeout)
+        recorder.add(request['endpoint'], time.perf_counter() - scheduled, status)
+
+    start = time.perf_counter()
+    scheduled = start
+    sent = 0
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        while True:
+            scheduled += rng.expovariate(rate)
+            if scheduled - start > duration or (max_requests and sent >= max_requests):
+                break
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            executor.submit(fire, workload.next_request(rng), scheduled)
+            sent += 1
+
+def percentile(sorted_values: list, fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, math.ceil(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+def summarize(samples: list, elapsed: float) -> dict:
+    """Throughput, error rate and latency percentiles for a list of samples"""
+    latencies = sorted(latency for _, latency, _ in samples)
+    errors = sum(1 for _, _, status in samples if status != 200)
+    statuses = {}
+    for _, _, status in samples:
+        statuses[str(status)] = statuses.get(str(status), 0) + 1
+
+    return {
+        'requests': len(samples),
+        'throughput_rps': round(len(samples) / elapsed, 3) if elapsed else 0.0,
+        'error_rate': round(errors / len(samples), 4) if samples else 0.0,
+        'statuses': statuses,
+        'latency_ms': {
+            'mean': round(sum(latencies) / len(latencies) * 1000, 2) if latencies else 0.0,
+            'p50': round(percentile(latencies, 0.50) * 1000, 2),
+            'p95': round(percentile(latencies, 0.95) * 1000, 2),
+            'p99': round(percentile(latencies, 0.99) * 1000, 2),
+            'max': round(latencies[-1] * 1000, 2) if latencies else 0.0
+        }
+    }
+
+def scrape_stages(base_url: str) -> dict:
+    """
+    Read per-stage histogram state from /metrics
+
+    Returns:
+        {stage: {'sum': s, 'count': n, 'buckets': {le: cumulative count}}}, or {} if unavailable
+    """
+    try:
+        text = requests.get(base_url + '/metrics', timeout=10).text
+    except requests.RequestException:
+        return {}
+
+    stages = {}
+    for line in text.splitlines():
+        match = STAGE_SAMPLE.match(line)
+        if not match:
+            continue
+        kind, stage, le, value = match.groups()
+        state = stages.setdefault(stage, {'sum': 0.0, 'count': 0, 'buckets': {}})
+        if kind == 'bucket':
+            state['buckets'][le] = float(value)
+        else:
+            state[kind] = float(value)
+    return stages
+
+def stage_delta(before: dict, after: dict) -> dict:
+    """
+    Per-stage timings for the observations made between two scrapes
+
+    Percentiles are estimated from histogram buckets (upper bound of the bucket)
+    """
+    result = {}
+    for stage, state in after.items():
+        previous = before.get(stage, {'sum': 0.0, 'count': 0, 'buckets': {}})
+        count = state['count'] - previous['count']
+        if count <= 0:
+            continue
+
+        buckets = sorted(
+            ((float(le), cumulative - previous['buckets'].get(le, 0))
+             for le, cumulative in state['buckets'].items()),
+            key=lambda item: item[0]
+        )
+
+        def bucket_percentile(fraction):
+            for bound, cumulative in buckets:
+                if cumulative >= fraction * count:
+                    return bound * 1000 if bound != float('inf') else None
+            return None
+
+        result[stage] = {
+            'count': int(count),
+            'mean_ms': round((state['sum'] - previous['sum']) / count * 1000, 2),
+            'p50_ms_le': bucket_percentile(0.50),
+            'p95_ms_le': bucket_percentile(0.95),
+            'p99_ms_le': bucket_percentile(0.99)
+        }
+    return result
+
+def sample_stages(base_url: str, interval: float, stop: threading.Event, timeline: list):
+    """Record per-stage deltas every interval seconds until stopped"""
+    previous = scrape_stages(base_url)
+    start = time.perf_counter()
+    while not stop.wait(interval):
+        current = scrape_stages(base_url)
+        timeline.append({
+            'elapsed_s': round(time.perf_counter() - start, 1),
+            'stages': stage_delta(previous, current)
+        })
+        previous = current
+
+def start_server(port: int, workers: int, threads: int) -> subprocess.Popen:
+    """Start serve.py on localhost and wait until /api/ready succeeds"""
+    env = dict(os.environ)
+    env.setdefault('JOB_QUEUE_DB', os.path.join(tempfile.mkdtemp(), 'jobs.db'))
+    env.setdefault('LOG_LEVEL', 'WARNING')
+
+    process = subprocess.Popen(
+        [sys.executable, 'serve.py', '--bind', f'127.0.0.1:{port}',
+         '--workers', str(workers), '--threads', str(threads),
+         '--memory-report-interval', '0'],
+        cwd=BACKEND_DIR,
+        env=env
+    )
+
+    base_url = f'http://127.0.0.1:{port}'
+    deadline = time.time() + 300
+    while time.time() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"Server exited with code {process.returncode}")
+        try:
+            response = requests.get(base_url + '/api/ready', timeout=2)
+            if response.status_code == 200:
+                return process
+            failed = [key for key, status in response.json()['components']['nlp'].items()
+                      if status['state'] == 'failed']
+            if failed:
+                # Will never become ready; measure the degraded server anyway
+                print(f"⚠ Models failed to load: {', '.join(failed)}", file=sys.stderr)
+                return process
+        except (requests.RequestException, ValueError, KeyError):
+            pass
+        time.sleep(0.5)
+
+    process.terminate()
+    raise RuntimeError("Server did not become ready within 300s")
+
+def server_ready(base_url: str):
+    """Model load states reported by /api/ready (None if unreachable)"""
+    try:
+        return requests.get(base_url + '/api/ready', timeout=10).json().get('components', {}).get('nlp')
+    except (requests.RequestException, ValueError):
+        return None
+
+def parse_mix(text: str) -> dict:
+    """Parse 'analyze=6,keywords=3,skills=1' into endpoint weights"""
+    mix = {}
+    for part in text.split(','):
+        name, _, weight = part.partition('=')
+        name = name.strip()
+        if name not in ('analyze', 'keywords', 'skills'):
+            raise argparse.ArgumentTypeError(f"Unknown endpoint in mix: {name}")
+        mix[name] = float(weight or 1)
+    return mix
+
+def main():
+    parser = argparse.ArgumentParser(description='Load test the ATS analyzer API')
+    parser.add_argument('--url', default='http://127.0.0.1:5000', help='Server to test')
+    parser.add_argument('--start', action='store_true', help='Start serve.py locally first')
+    parser.add_argument('--port', type=int, default=5055, help='Port for --start')
+    parser.add_argument('--workers', type=int, default=1, help='Server workers for --start')
+    parser.add_argument('--threads', type=int, default=4, help='Threads per server worker for --start')
+    parser.add_argument('--mode', choices=['closed', 'open'], default='closed')
+    parser.add_argument('--concurrency', type=int, default=4,
+                        help='Clients (closed loop) or maximum in-flight requests (open loop)')
+    parser.add_argument('--rate', type=float, default=2.0, help='Arrivals per second (open loop)')
+    parser.add_argument('--duration', type=float, default=30, help='Seconds to run')
+    parser.add_argument('--requests', type=int, default=0, help='Stop after this many requests (0 = no limit)')
+    parser.add_argument('--mix', type=parse_mix, default=parse_mix('analyze=6,keywords=3,skills=1'),
+                        help='Endpoint weights, e.g. analyze=6,keywords=3,skills=1')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1, 2, 5], help='Resume sizes in pages')
+    parser.add_argument('--file-types', nargs='+', default=['pdf', 'docx', 'txt'], choices=list(MIME_TYPES))
+    parser.add_argument('--allow-cache-hits', action='store_true',
+                        help='Repeat identical analyze requests instead of keeping the result cache cold')
+    parser.add_argument('--timeout', type=float, default=120, help='Per-request timeout in seconds')
+    parser.add_argument('--sample-interval', type=float, default=0,
+                        help='Also record stage timings every N seconds (0 = before/after only)')
+    parser.add_argument('--seed', default='0')
+    parser.add_argument('--output', help='Write the JSON report here (default: stdout)')
+    args = parser.parse_args()
+
+    server = None
+    base_url = args.url.rstrip('/')
+    if args.start:
+        base_url = f'http://127.0.0.1:{args.port}'
+        print(f"Starting server on {base_url}...", file=sys.stderr)
+        server = start_server(args.port, args.workers, args.threads)
+
+    try:
+        workload = Workload(args.mix, args.sizes, args.file_types, unique=not args.allow_cache_hits)
+        recorder = Recorder()
+
+        stages_before = scrape_stages(base_url)
+        timeline = []
+        stop = threading.Event()
+        sampler = None
+        if args.sample_interval > 0:
+            sampler = threading.Thread(
+                target=sample_stages,
+                args=(base_url, args.sample_interval, stop, timeline),
+                daemon=True
+            )
+            sampler.start()
+
+        print(f"Running {args.mode} loop for up to {args.duration}s...", file=sys.stderr)
+        start = time.perf_counter()
+        if args.mode == 'closed':
+            run_closed_loop(base_url, workload, recorder, args.concurrency, args.duration,
+                            args.requests, args.timeout, args.seed)
+        else:
+            run_open_loop(base_url, workload, recorder, args.concurrency, args.duration,
+                          args.requests, args.rate, args.timeout, args.seed)
+        elapsed = time.perf_counter() - start
+
+        stop.set()
+        if sampler:
+            sampler.join()
+        stages_after = scrape_stages(base_url)
+    finally:
+        if server:
+            server.terminate()
+            server.wait(timeout=30)
+
+    samples = recorder.samples
+    by_endpoint = {}
+    for sample in samples:
+        by_endpoint.setdefault(sample[0], []).append(sample)
+
+    report = {
+        'meta': {
+            'timestamp': datetime.now().isoformat(),
+            'url': base_url,
+            'mode': args.mode,
+            'concurrency': args.concurrency,
+            'rate': args.rate if args.mode == 'open' else None,
+            'duration_s': round(elapsed, 2),
+            'mix': args.mix,
+            'sizes': args.sizes,
+            'file_types': args.file_types,
+            'server_workers': args.workers if args.start else None,
+            'server_ready': server_ready(base_url)
+        },
+        'overall': summarize(samples, elapsed),
+        'endpoints': {endpoint: summarize(items, elapsed) for endpoint, items in by_endpoint.items()},
+        'server_stages': stage_delta(stages_before, stages_after),
+        'server_stage_timeline': timeline
+    }
+
+    overall = report['overall']
+    print(
+        f"{overall['requests']} requests in {elapsed:.1f}s: {overall['throughput_rps']} req/s, "
+        f"errors {overall['error_rate'] * 100:.1f}%, p50 {overall['latency_ms']['p50']}ms, "
+        f"p95 {overall['latency_ms']['p95']}ms, p99 {overall['latency_ms']['p99']}ms",
+        file=sys.stderr
+    )
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as file:
+            file.write(output + '\n')
+    else:
+        print(output)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,332 @@
+"""
+Benchmark Suite - Per-stage micro-benchmarks and end-to-end /api/analyze timing
+Writes machine-readable JSON and compares it against a stored baseline
+Also reports the saving of parallel over sequential stage execution
+
+Usage (from backend/):
+    python -m benchmarks.run_benchmarks --output bench.json
+    python -m benchmarks.run_benchmarks --baseline bench.json --fail-on-regression
+"""
+
+import argparse
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from benchmarks.corpus import generate_resume, generate_job_description, render
+
+DEFAULT_SIZES = [1, 2, 5, 10, 20]
+FILE_TYPES = ['txt', 'docx', 'pdf']
+
+def measure(fn, repeat: int = 5, warmup: int = 1, setup=None) -> dict:
+    """
+    Time a function
+
+    Args:
+        fn: Function to time (no arguments)
+        repeat: Timed runs
+        warmup: Untimed runs first
+        setup: Untimed function called before every run (optional)
+
+    Returns:
+        Dictionary of timing statistics in milliseconds
+    """
+    for _ in range(warmup):
+        if setup:
+            setup()
+        fn()
+
+    times = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - start) * 1000)
+
+    times.sort()
+    return {
+        'runs': repeat,
+        'min_ms': round(times[0], 3),
+        'median_ms': round(statistics.median(times), 3),
+        'mean_ms': round(statistics.mean(times), 3),
+        'p95_ms': round(times[min(len(times) - 1, int(len(times) * 0.95))], 3)
+    }
+
+def run_stage_benchmarks(pipeline, sizes, repeat) -> dict:
+    """
+    Time each pipeline stage in isolation at every document size
+
+    Args:
+        pipeline: AnalysisPipeline with models already warmed up
+        sizes: Document sizes in pages
+        repeat: Timed runs per benchmark
+
+    Returns:
+        {benchmark: {pages: stats}}
+    """
+    from utils.text_processing import clean_text, extract_keywords
+
+    parser = pipeline.resume_parser
+    analyzer = pipeline.nlp_analyzer
+    skills = pipeline.skill_extractor
+    scorer = pipeline.ats_scorer
+
+    results = {}
+
+    def add(name, pages, fn):
+        results.setdefault(name, {})[str(pages)] = measure(fn, repeat)
+
+    for pages in sizes:
+        resume = generate_resume(pages)
+        job = generate_job_description(pages)
+        print(f"  stages @ {pages} page(s)", file=sys.stderr)
+
+        for file_type in FILE_TYPES:
+            data = render(resume, file_type)
+            add(f'parse_{file_type}', pages, lambda data=data: parser.extract_text_from_bytes(data))
+
+        resume_clean = clean_text(resume)
+        job_clean = clean_text(job)
+        job_analysis = analyzer.analyze_job(job_clean)
+
+        add('clean', pages, lambda: clean_text(resume))
+        add('sections', pages, lambda: parser.extract_sections(resume))
+        add('keywords', pages, lambda: extract_keywords(resume_clean))
+        add('skills', pages, lambda: skills.extract_skills(resume))
+        add('nlp_similarity', pages, lambda: analyzer._encode([resume_clean]))
+        add('embedding_cached', pages, lambda: analyzer.encode([resume_clean]))
+        resume_doc = analyzer.parse(resume_clean)
+        add('spacy_parse', pages, lambda: analyzer.parse(resume_clean))
+        add('entities', pages, lambda: analyzer._extract_entities(resume_doc))
+        add('noun_chunks', pages, lambda: analyzer._extract_noun_phrases(resume_doc))
+        add('nlp_analyze', pages, lambda: analyzer.analyze(
+            resume_clean, job_clean, job_analysis=job_analysis
+        ))
+
+        resume_keywords = extract_keywords(resume_clean)
+        job_keywords = extract_keywords(job_clean)
+        resume_skills = skills.extract_skills(resume)
+        job_skills = skills.extract_skills(job)
+        resume_sections = parser.extract_sections(resume)
+        nlp_results = analyzer.analyze(resume_clean, job_clean, job_analysis=job_analysis)
+
+        add('score', pages, lambda: scorer.calculate_score(
+            resume_text=resume,
+            job_description=job,
+            resume_sections=resume_sections,
+            nlp_results=nlp_results,
+            resume_keywords=resume_keywords,
+            job_keywords=job_keywords,
+            resume_skills=resume_skills,
+            job_skills=job_skills
+        ))
+        add('prepare_job', pages, lambda: pipeline.prepare_job(job))
+
+    return results
+
+def run_parallel_benchmarks(pipeline, sizes, repeat, threads) -> tuple:
+    """
+    Time a full analysis with stages run sequentially and on a thread pool
+
+    The embedding cache is bypassed so every run encodes the resume.
+
+    Args:
+        pipeline: AnalysisPipeline with models already warmed up
+        sizes: Document sizes in pages
+        repeat: Timed runs per benchmark
+        threads: Pool size for parallel mode
+
+    Returns:
+        ({benchmark: {pages: stats}}, {pages: wall-clock saving})
+    """
+    analyzer = pipeline.nlp_analyzer
+    executor, cache = pipeline.executor, analyzer.embedding_cache
+    analyzer.embedding_cache = None
+
+    results = {}
+    saving = {}
+    with ThreadPoolExecutor(max_workers=threads, thread_name_prefix='analysis-stage') as pool:
+        try:
+            for pages in sizes:
+                resume = generate_resume(pages)
+                job = pipeline.prepare_job(generate_job_description(pages))
+                print(f"  parallel @ {pages} page(s)", file=sys.stderr)
+
+                for mode, mode_executor in (('sequential', None), ('parallel', pool)):
+                    pipeline.executor = mode_executor
+                    results.setdefault(f'analyze_{mode}', {})[str(pages)] = measure(
+                        lambda: pipeline.analyze(resume, job), repeat
+                    )
+
+                sequential = results['analyze_sequential'][str(pages)]['median_ms']
+                parallel = results['analyze_parallel'][str(pages)]['median_ms']
+                saving[str(pages)] = {
+                    'sequential_ms': sequential,
+                    'parallel_ms': parallel,
+                    'saving_ms': round(sequential - parallel, 3),
+                    'saving_pct': round((sequential - parallel) / sequential * 100, 1) if sequential else 0.0
+                }
+        finally:
+            pipeline.executor, analyzer.embedding_cache = executor, cache
+
+    return results, saving
+
+def run_end_to_end_benchmarks(app_module, sizes, repeat) -> dict:
+    """
+    Time POST /api/analyze through the Flask test client (result cache cleared)
+
+    Returns:
+        {benchmark: {pages: stats}}
+    """
+    client = app_module.app.test_client()
+    results = {}
+
+    for pages in sizes:
+        resume = generate_resume(pages)
+        job = generate_job_description(pages)
+        print(f"  end-to-end @ {pages} page(s)", file=sys.stderr)
+
+        for file_type in FILE_TYPES:
+            data = render(resume, file_type)
+
+            def post(data=data, file_type=file_type):
+                response = client.post(
+                    '/api/analyze',
+                    data={
+                        'resume_file': (io.BytesIO(data), f'resume.{file_type}'),
+                        'job_description': job
+                    },
+                    content_type='multipart/form-data'
+                )
+                if response.status_code != 200:
+                    raise RuntimeError(f"/api/analyze failed: {response.get_json()}")
+
+            results.setdefault(f'e2e_analyze_{file_type}', {})[str(pages)] = measure(
+                post, repeat, setup=app_module.result_cache.clear
+            )
+
+    return results
+
+def compare(current: dict, baseline: dict, tolerance: float, min_delta_ms: float = 0.5) -> list:
+    """
+    Compare median times against a baseline
+
+    Args:
+        current: Results from this run
+        baseline: Results loaded from a previous run
+        tolerance: Allowed slowdown ratio (0.2 = 20% slower)
+        min_delta_ms: Ignore slowdowns smaller than this (timer noise)
+
+    Returns:
+        List of comparison rows, regressions flagged
+    """
+    rows = []
+    for name, by_size in current['benchmarks'].items():
+        for pages, stats in by_size.items():
+            base = baseline.get('benchmarks', {}).get(name, {}).get(pages)
+            if not base or not base['median_ms']:
+                continue
+            ratio = stats['median_ms'] / base['median_ms']
+            rows.append({
+                'benchmark': name,
+                'pages': pages,
+                'baseline_ms': base['median_ms'],
+                'current_ms': stats['median_ms'],
+                'ratio': round(ratio, 3),
+                'regression': (ratio > 1 + tolerance and
+                               stats['median_ms'] - base['median_ms'] > min_delta_ms)
+            })
+    return rows
+
+def main():
+    parser = argparse.ArgumentParser(description='Run ATS analyzer benchmarks')
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help='Document sizes in pages')
+    parser.add_argument('--repeat', type=int, default=5, help='Timed runs per benchmark')
+    parser.add_argument('--skip-stages', action='store_true', help='Skip per-stage benchmarks')
+    parser.add_argument('--skip-e2e', action='store_true', help='Skip end-to-end benchmarks')
+    parser.add_argument('--skip-parallel', action='store_true',
+                        help='Skip the parallel vs sequential stage comparison')
+    parser.add_argument('--analysis-threads', type=int, default=4,
+                        help='Thread pool size for the parallel stage comparison')
+    parser.add_argument('--output', help='Write results JSON here (default: stdout)')
+    parser.add_argument('--baseline', help='Compare against this results JSON')
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help='Allowed median slowdown before flagging a regression')
+    parser.add_argument('--min-delta-ms', type=float, default=0.5,
+                        help='Ignore slowdowns smaller than this many milliseconds')
+    parser.add_argument('--fail-on-regression', action='store_true',
+                        help='Exit with status 1 if any benchmark regressed')
+    args = parser.parse_args()
+
+    # Keep benchmark runs away from the real job queue and request log
+    os.environ.setdefault('JOB_QUEUE_DB', os.path.join(tempfile.mkdtemp(), 'jobs.db'))
+    os.environ.setdefault('LOG_LEVEL', 'WARNING')
+
+    import app as app_module
+
+    pipeline = app_module.pipeline
+    pipeline.warm_up()
+
+    results = {
+        'meta': {
+            'timestamp': datetime.now().isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'sizes': args.sizes,
+            'repeat': args.repeat,
+            'models': {
+                key: status['state']
+                for key, status in pipeline.nlp_analyzer.status()['models'].items()
+            }
+        },
+        'benchmarks': {}
+    }
+
+    if not args.skip_stages:
+        results['benchmarks'].update(run_stage_benchmarks(pipeline, args.sizes, args.repeat))
+    if not args.skip_e2e:
+        results['benchmarks'].update(run_end_to_end_benchmarks(app_module, args.sizes, args.repeat))
+    if not args.skip_parallel:
+        timings, saving = run_parallel_benchmarks(
+            pipeline, args.sizes, args.repeat, args.analysis_threads
+        )
+        results['benchmarks'].update(timings)
+        results['parallel'] = {'threads': args.analysis_threads, 'saving': saving}
+
+        for pages, row in saving.items():
+            print(f"parallel {pages:>3}p  {row['sequential_ms']:>10.2f} -> {row['parallel_ms']:>10.2f} ms  "
+                  f"saved {row['saving_ms']:.2f} ms ({row['saving_pct']:.1f}%)", file=sys.stderr)
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+        results['comparison'] = compare(results, baseline, args.tolerance, args.min_delta_ms)
+
+        for row in results['comparison']:
+            flag = '  REGRESSION' if row['regression'] else ''
+            print(f"{row['benchmark']:<24} {row['pages']:>3}p  "
+                  f"{row['baseline_ms']:>10.2f} -> {row['current_ms']:>10.2f} ms  "
+                  f"x{row['ratio']:.2f}{flag}", file=sys.stderr)
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, 'w') as file:
+            file.write(output + '\n')
+    else:
+        print(output)
+
+    if args.fail_on_regression and any(row['regression'] for row in results.get('comparison', [])):
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,151 @@
+"""
+Skill Matching Benchmark - Compiled single-pass matcher vs per-skill regex scans
+Taxonomies are the built-in skills padded with synthetic ones to each size
+
+Usage (from backend/):
+    python -m benchmarks.skill_matching --output skills.json
+    python -m benchmarks.skill_matching --taxonomy-sizes 150 5000 --sizes 1 5
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import re
+import sys
+import time
+from datetime import datetime
+
+from benchmarks.corpus import generate_resume, generate_job_description
+from benchmarks.run_benchmarks import measure
+from utils.skill_extraction import SkillExtractor
+from utils.skill_matcher import SkillMatcher
+
+DEFAULT_TAXONOMY_SIZES = [150, 5000, 50000]
+DEFAULT_SIZES = [1, 5]
+
+SYLLABLES = ['ka', 'lo', 'mi', 'ne', 'ro', 'ta', 'vu', 'zen', 'dex', 'qua', 'sor', 'bix', 'tri', 'plu']
+SHAPES = ['{a}', '{a}', '{a} {b}', '{a} {b} {c}', '{a}.js', '{a}++', '{a}#', '{a}/{b}', '{a}-{b}']
+
+def synthetic_taxonomy(size: int, seed: int = 0) -> list:
+    """
+    Built-in skills plus unique synthetic ones, shaped like real skill names
+
+    Args:
+        size: Total skills
+        seed: Random seed
+
+    Returns:
+        List of skill names
+    """
+    skills = list(dict.fromkeys(
+        skill for group in SkillExtractor().get_skills_database().values() for skill in group
+    ))
+    seen = set(skills)
+    rng = random.Random(seed)
+
+    def word():
+        return ''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4)))
+
+    while len(skills) < size:
+        skill = rng.choice(SHAPES).format(a=word(), b=word(), c=word())
+        if skill not in seen:
+            seen.add(skill)
+            skills.append(skill)
+    return skills[:size]
+
+def legacy_extract(skills: list, text: str) -> set:
+    """The previous SkillExtractor.extract_skills: one regex search per skill"""
+    text_lower = text.lower()
+    found_skills = set()
+    for skill in skills:
+        pattern = r'\b' + re.escape(skill) + r'\b'
+        if re.search(pattern, text_lower):
+            found_skills.add(skill)
+    return found_skills
+
+def run(taxonomy_sizes, sizes, repeat) -> dict:
+    """
+    Time both implementations for every taxonomy and document size
+
+    Returns:
+        {taxonomy size: {'build_ms', 'documents': {pages: timings}, 'parity'}}
+    """
+    results = {}
+    for taxonomy_size in taxonomy_sizes:
+        skills = synthetic_taxonomy(taxonomy_size)
+
+        start = time.perf_counter()
+        matcher = SkillMatcher(skills)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        documents = {}
+        only_legacy, only_matcher = set(), set()
+        for pages in sizes:
+            text = generate_resume(pages) + '\n' + generate_job_description(pages)
+            print(f"  {taxonomy_size} skills @ {pages} page(s)", file=sys.stderr)
+
+            legacy = measure(lambda: legacy_extract(skills, text), repeat)
+            compiled = measure(lambda: matcher.extract(text), repeat)
+            documents[str(pages)] = {
+                'legacy': legacy,
+                'matcher': compiled,
+                'speedup': round(legacy['median_ms'] / compiled['median_ms'], 1) if compiled['median_ms'] else None
+            }
+
+            expected, found = legacy_extract(skills, text), matcher.extract(text)
+            only_legacy |= expected - found
+            only_matcher |= found - expected
+
+        results[str(taxonomy_size)] = {
+            'build_ms': round(build_ms, 3),
+            'documents': documents,
+            # Legacy misses skills ending in a symbol ("c++", "c#"); it should find nothing extra
+            'parity': {
+                'only_legacy': sorted(only_legacy),
+                'only_matcher': sorted(only_matcher)
+            }
+        }
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark skill matching against per-skill regex scans')
+    parser.add_argument('--taxonomy-sizes', type=int, nargs='+', default=DEFAULT_TAXONOMY_SIZES,
+                        help='Skills in the taxonomy')
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help='Document sizes in pages (resume plus job description)')
+    parser.add_argument('--repeat', type=int, default=3, help='Timed runs per benchmark')
+    parser.add_argument('--output', help='Write results JSON here (default: stdout)')
+    args = parser.parse_args()
+
+    results = run(args.taxonomy_sizes, args.sizes, args.repeat)
+
+    for taxonomy_size, result in results.items():
+        for pages, row in result['documents'].items():
+            print(f"{taxonomy_size:>6} skills {pages:>3}p  "
+                  f"legacy {row['legacy']['median_ms']:>10.2f} ms  "
+                  f"matcher {row['matcher']['median_ms']:>8.2f} ms  x{row['speedup']}",
+                  file=sys.stderr)
+        if result['parity']['only_legacy']:
+            print(f"⚠ {taxonomy_size} skills: matcher missed {result['parity']['only_legacy']}", file=sys.stderr)
+
+    output = json.dumps({
+        'meta': {
+            'timestamp': datetime.now().isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'sizes': args.sizes,
+            'repeat': args.repeat
+        },
+        'taxonomies': results
+    }, indent=2)
+    if args.output:
+        with open(args.output, 'w') as file:
+            file.write(output + '\n')
+    else:
+        print(output)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,194 @@
+"""
+spaCy Profile Benchmark - Latency, memory and result agreement per analyzer profile
+Each profile is measured in a fresh process so model memory is not shared
+
+Usage (from backend/):
+    python -m benchmarks.spacy_profiles --output profiles.json
+    python -m benchmarks.spacy_profiles --profiles full fast --sizes 1 5 20
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+from benchmarks.corpus import generate_resume
+from benchmarks.run_benchmarks import measure
+
+DEFAULT_SIZES = [1, 2, 5, 10, 20]
+REFERENCE_PROFILE = 'full'
+
+def run_profile(profile, sizes, repeat, models) -> dict:
+    """
+    Load one profile and time parsing plus extraction (runs in the child process)
+
+    Args:
+        profile: Profile name
+        sizes: Document sizes in pages
+        repeat: Timed runs per benchmark
+        models: {profile: spaCy model name} overrides
+
+    Returns:
+        Dictionary with load time, memory, latency and extracted features
+    """
+    from models.nlp_analyzer import NLPAnalyzer
+    from utils.memory import process_memory
+    from utils.text_processing import clean_text
+
+    analyzer = NLPAnalyzer(
+        spacy_profile=profile,
+        spacy_profiles={name: {'model': model} for name, model in models.items()}
+    )
+
+    before = process_memory()
+    start = time.perf_counter()
+    nlp = analyzer.get_nlp(profile)
+    load_time = time.perf_counter() - start
+    if nlp is None:
+        return {'error': analyzer.model_status['spacy']['error']}
+
+    # Allocate parser buffers before reading steady-state memory
+    nlp(clean_text(generate_resume(1)))
+    after = process_memory()
+
+    result = {
+        'model': analyzer.spacy_model,
+        'components': list(nlp.pipe_names),
+        'load_s': round(load_time, 3),
+        'memory': {
+            key: round(after[key] - before[key], 1)
+            for key in ('rss_mb', 'pss_mb', 'uss_mb') if key in after
+        },
+        'latency': {},
+        'features': {}
+    }
+
+    for pages in sizes:
+        text = clean_text(generate_resume(pages))
+        print(f"  {profile} @ {pages} page(s)", file=sys.stderr)
+
+        def extract():
+            doc = analyzer.parse(text)
+            analyzer._extract_entities(doc)
+            analyzer._extract_noun_phrases(doc)
+
+        result['latency'][str(pages)] = {
+            'parse': measure(lambda: analyzer.parse(text), repeat),
+            'parse_extract': measure(extract, repeat)
+        }
+
+        doc = analyzer.parse(text)
+        result['features'][str(pages)] = {
+            'entities': analyzer._extract_entities(doc),
+            'concepts': analyzer._extract_noun_phrases(doc)
+        }
+
+    return result
+
+def jaccard(a, b) -> float:
+    """Set overlap, 1.0 when both are empty"""
+    a, b = set(a), set(b)
+    return round(len(a & b) / len(a | b), 4) if a | b else 1.0
+
+def agreement(profile_result, reference) -> dict:
+    """
+    Compare a profile's extracted features against the reference profile
+
+    Returns:
+        {pages: {entities, entity_texts, concepts}} Jaccard similarities
+    """
+    rows = {}
+    for pages, features in profile_result['features'].items():
+        expected = reference['features'].get(pages)
+        if expected is None:
+            continue
+        rows[pages] = {
+            'entities': jaccard(
+                [(e['text'], e['label']) for e in features['entities']],
+                [(e['text'], e['label']) for e in expected['entities']]
+            ),
+            'entity_texts': jaccard(
+                [e['text'] for e in features['entities']],
+                [e['text'] for e in expected['entities']]
+            ),
+            'concepts': jaccard(features['concepts'], expected['concepts'])
+        }
+    return rows
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark spaCy analyzer profiles')
+    parser.add_argument('--profiles', nargs='+', default=['full', 'fast'], help='Profiles to measure')
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help='Document sizes in pages')
+    parser.add_argument('--repeat', type=int, default=5, help='Timed runs per benchmark')
+    parser.add_argument('--model', action='append', default=[], metavar='PROFILE=MODEL',
+                        help='Override the spaCy model of a profile (repeatable)')
+    parser.add_argument('--output', help='Write results JSON here (default: stdout)')
+    parser.add_argument('--child', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    models = dict(item.split('=', 1) for item in args.model)
+
+    if args.child:
+        # stdout carries only the result; model loading logs go to stderr
+        with contextlib.redirect_stdout(sys.stderr):
+            result = run_profile(args.child, args.sizes, args.repeat, models)
+        print(json.dumps(result))
+        return
+
+    backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    profiles = {}
+    for profile in args.profiles:
+        command = [
+            sys.executable, '-m', 'benchmarks.spacy_profiles', '--child', profile,
+            '--repeat', str(args.repeat), '--sizes', *map(str, args.sizes)
+        ]
+        for item in args.model:
+            command += ['--model', item]
+        completed = subprocess.run(command, cwd=backend_dir, stdout=subprocess.PIPE)
+        if completed.returncode != 0:
+            profiles[profile] = {'error': f'exit status {completed.returncode}'}
+            continue
+        profiles[profile] = json.loads(completed.stdout)
+
+    reference = profiles.get(REFERENCE_PROFILE)
+    for profile, result in profiles.items():
+        if 'error' in result:
+            print(f"⚠ {profile}: {result['error']}", file=sys.stderr)
+            continue
+        if reference and 'error' not in reference and profile != REFERENCE_PROFILE:
+            result['agreement'] = agreement(result, reference)
+        largest = str(max(args.sizes))
+        print(f"{profile:<8} {result['model']:<18} load {result['load_s']:>6.2f}s  "
+              f"uss +{result['memory'].get('uss_mb', 0):>7.1f} MB  "
+              f"parse@{largest}p {result['latency'][largest]['parse']['median_ms']:>9.2f} ms",
+              file=sys.stderr)
+
+    # Extracted features only served the comparison
+    for result in profiles.values():
+        result.pop('features', None)
+
+    output = json.dumps({
+        'meta': {
+            'timestamp': datetime.now().isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'sizes': args.sizes,
+            'repeat': args.repeat,
+            'reference': REFERENCE_PROFILE
+        },
+        'profiles': profiles
+    }, indent=2)
+    if args.output:
+        with open(args.output, 'w') as file:
+            file.write(output + '\n')
+    else:
+        print(output)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,136 @@
+"""
+Tokenizer Benchmark - Regex keyword tokenizer vs NLTK word_tokenize
+Checks that both give the same keywords and bigrams, and times them
+
+Usage (from backend/):
+    python -m benchmarks.tokenizers --output tokenizers.json
+    python -m benchmarks.tokenizers --sizes 1 5 --documents 50
+
+Exits with status 1 if keywords or bigrams of cleaned text differ (the
+pipeline only tokenizes clean_text output). Raw-text differences, as seen
+by /api/keywords, are reported but do not fail the run.
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+from collections import Counter
+from datetime import datetime
+
+from benchmarks.corpus import generate_resume, generate_job_description
+from benchmarks.run_benchmarks import measure
+from utils.text_processing import clean_text, extract_bigrams, extract_keywords, tokenize
+
+DEFAULT_SIZES = [1, 5]
+
+def corpus(pages: int, documents: int) -> list:
+    """Resumes and job descriptions of a size, half of each"""
+    texts = []
+    for seed in range(documents):
+        generate = generate_resume if seed % 2 == 0 else generate_job_description
+        texts.append(generate(pages, seed=seed))
+    return texts
+
+def check_parity(texts: list) -> dict:
+    """
+    Compare keywords and bigrams of both tokenizers
+
+    Returns:
+        {'documents', 'keywords_differ', 'bigrams_differ', 'only_regex', 'only_nltk'}
+        where the last two count kept tokens found by one tokenizer only
+    """
+    keywords_differ = bigrams_differ = 0
+    only_regex, only_nltk = Counter(), Counter()
+    for text in texts:
+        if extract_keywords(text, tokenizer='regex') != extract_keywords(text, tokenizer='nltk'):
+            keywords_differ += 1
+        if extract_bigrams(text, tokenizer='regex') != extract_bigrams(text, tokenizer='nltk'):
+            bigrams_differ += 1
+        regex_tokens = Counter(t for t in tokenize(text, 'regex') if t.isalpha())
+        nltk_tokens = Counter(t for t in tokenize(text, 'nltk') if t.isalpha())
+        only_regex.update(regex_tokens - nltk_tokens)
+        only_nltk.update(nltk_tokens - regex_tokens)
+    return {
+        'documents': len(texts),
+        'keywords_differ': keywords_differ,
+        'bigrams_differ': bigrams_differ,
+        'only_regex': dict(only_regex.most_common(10)),
+        'only_nltk': dict(only_nltk.most_common(10))
+    }
+
+def run(sizes, documents, repeat) -> dict:
+    """
+    Time both tokenizers on raw and cleaned text of every size
+
+    Returns:
+        {pages: {'raw'|'clean': {'nltk', 'regex', 'speedup', 'parity'}}}
+    """
+    results = {}
+    for pages in sizes:
+        raw = corpus(pages, documents)
+        variants = {'raw': raw, 'clean': [clean_text(text) for text in raw]}
+        print(f"  {documents} documents @ {pages} page(s)", file=sys.stderr)
+
+        results[str(pages)] = {}
+        for variant, texts in variants.items():
+            timings = {
+                tokenizer: measure(
+                    lambda: [extract_keywords(text, tokenizer=tokenizer) for text in texts], repeat
+                )
+                for tokenizer in ('nltk', 'regex')
+            }
+            results[str(pages)][variant] = {
+                'nltk': timings['nltk'],
+                'regex': timings['regex'],
+                'speedup': round(timings['nltk']['median_ms'] / timings['regex']['median_ms'], 1)
+                if timings['regex']['median_ms'] else None,
+                'parity': check_parity(texts)
+            }
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the regex keyword tokenizer against NLTK')
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help='Document sizes in pages')
+    parser.add_argument('--documents', type=int, default=20, help='Documents per size')
+    parser.add_argument('--repeat', type=int, default=3, help='Timed runs per benchmark')
+    parser.add_argument('--output', help='Write results JSON here (default: stdout)')
+    args = parser.parse_args()
+
+    results = run(args.sizes, args.documents, args.repeat)
+
+    failed = False
+    for pages, variants in results.items():
+        for variant, row in variants.items():
+            parity = row['parity']
+            print(f"{pages:>3}p {variant:<5}  nltk {row['nltk']['median_ms']:>9.2f} ms  "
+                  f"regex {row['regex']['median_ms']:>8.2f} ms  x{row['speedup']}  "
+                  f"keywords differ {parity['keywords_differ']}/{parity['documents']}  "
+                  f"bigrams differ {parity['bigrams_differ']}/{parity['documents']}",
+                  file=sys.stderr)
+            if variant == 'clean' and (parity['keywords_differ'] or parity['bigrams_differ']):
+                print(f"⚠ {pages}p: tokenizers disagree on cleaned text", file=sys.stderr)
+                failed = True
+
+    output = json.dumps({
+        'meta': {
+            'timestamp': datetime.now().isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'documents': args.documents,
+            'repeat': args.repeat
+        },
+        'sizes': results
+    }, indent=2)
+    if args.output:
+        with open(args.output, 'w') as file:
+            file.write(output + '\n')
+    else:
+        print(output)
+    sys.exit(1 if failed else 0)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,758 @@
+"""
+Analysis Pipeline - Run the full resume analysis end to end
+Prepares the job description once so it can be reused across many resumes
+"""
+
+import threading
+import time
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from datetime import datetime
+
+from models.resume_parser import ResumeParser
+from models.nlp_analyzer import NLPAnalyzer, chunk_centroid
+from models.ats_scorer import ATSScorer
+from utils.processed_document import ProcessedDocument, as_document
+from utils.text_processing import warm_up_tokenizer
+from utils.skill_extraction import SkillExtractor
+from utils.metrics import span, record_input_size, current_trace, attach_trace
+
+# Bump when analysis output changes for identical inputs
+PIPELINE_VERSION = '2'
+
+# Stages that run concurrently in parallel mode, before scoring
+PARALLEL_STAGES = ('keywords', 'skills', 'embedding', 'spacy', 'job_nlp')
+
+class StageTimeoutError(Exception):
+    """A parallel analysis stage did not finish within its timeout"""
+
+def parse_stage_timeouts(spec: str) -> dict:
+    """
+    Parse per-stage timeouts such as "embedding=10,spacy=5"
+
+    Args:
+        spec: Comma-separated stage=seconds pairs
+
+    Returns:
+        Dictionary of stage name to timeout in seconds
+    """
+    timeouts = {}
+    for item in (spec or '').split(','):
+        if not item.strip():
+            continue
+        stage, _, seconds = item.partition('=')
+        stage = stage.strip()
+        if stage not in PARALLEL_STAGES:
+            raise ValueError(f"Unknown stage '{stage}'. Available: {', '.join(PARALLEL_STAGES)}")
+        timeouts[stage] = float(seconds)
+    return timeouts
+
+class StageTask:
+    """
+    One independent stage of an analysis
+
+    With an executor the stage starts immediately on the pool and result()
+    waits at most its timeout, counted from submission. Without one it is
+    deferred and runs inline when result() is called, as in sequential mode.
+    A timed-out stage is abandoned, not interrupted; it finishes on its pool
+    thread and its result is discarded.
+    """
+
+    def __init__(self, stage: str, fn, args: tuple, kwargs: dict = None, executor=None,
+                 timeout: float = None):
+        """
+        Args:
+            stage: Stage name from PARALLEL_STAGES
+            fn: Function computing the stage
+            args: Positional arguments for fn
+            kwargs: Keyword arguments for fn (optional)
+            executor: Shared thread pool, or None to run inline
+            timeout: Seconds to wait for the result in parallel mode
+        """
+        self.stage = stage
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs or {}
+        self.timeout = timeout
+        self.future = None
+        if executor is not None:
+            self.deadline = time.perf_counter() + timeout if timeout else None
+            self.future = executor.submit(self._run, current_trace())
+
+    def _run(self, trace):
+        """Compute the stage on a pool thread, recording spans in the request's trace"""
+        attach_trace(trace)
+        try:
+            return self.fn(*self.args, **self.kwargs)
+        finally:
+            attach_trace(None)
+
+    def result(self):
+        """Return the stage output, raising StageTimeoutError past the deadline"""
+        if self.future is None:
+            return self.fn(*self.args, **self.kwargs)
+
+        remaining = None
+        if self.deadline is not None:
+            remaining = max(0.0, self.deadline - time.perf_counter())
+        try:
+            return self.future.result(timeout=remaining)
+        except FutureTimeoutError:
+            self.future.cancel()
+            raise StageTimeoutError(f"Stage '{self.stage}' timed out after {self.timeout}s")
+
+class AnalysisPipeline:
+    """Analyze resumes against a job description"""
+
+    def __init__(self, resume_parser=None, nlp_analyzer=None,
+                 ats_scorer=None, skill_extractor=None,
+                 executor=None, stage_timeout: float = 30.0, stage_timeouts: dict = None,
+                 semantic_skills=None):
+        """
+        Initialize pipeline components
+
+        Args:
+            semantic_skills: SemanticSkillMatcher; when given, skills paraphrased
+                by noun phrases also count as present
+            executor: Shared, bounded thread pool; when given, independent
+                stages of each analysis run concurrently on it
+            stage_timeout: Seconds each parallel stage may take (None: no limit)
+            stage_timeouts: Per-stage overrides of stage_timeout
+        """
+        self.resume_parser = resume_parser or ResumeParser()
+        self.nlp_analyzer = nlp_analyzer or NLPAnalyzer()
+        self.ats_scorer = ats_scorer or ATSScorer()
+        self.skill_extractor = skill_extractor or SkillExtractor()
+        self.executor = executor
+        self.stage_timeout = stage_timeout
+        self.stage_timeouts = stage_timeouts or {}
+        self.semantic_skills = semantic_skills
+        if semantic_skills is not None:
+            self.nlp_analyzer.skill_phrases = True
+
+    @property
+    def parallel(self) -> bool:
+        """Whether independent stages run concurrently"""
+        return self.executor is not None
+
+    def start_stage(self, stage: str, fn, *args, **kwargs) -> StageTask:
+        """Start an independent stage (on the shared pool in parallel mode)"""
+        return StageTask(
+            stage, fn, args, kwargs,
+            executor=self.executor,
+            timeout=self.stage_timeouts.get(stage, self.stage_timeout)
+        )
+
+    @staticmethod
+    def _extract_keywords(resume: ProcessedDocument) -> list:
+        """Keyword stage"""
+        with span('keywords'):
+            return resume.keywords()
+
+    def _extract_skills(self, resume: ProcessedDocument) -> set:
+        """Skill stage"""
+        with span('skills'):
+            return self.skill_extractor.extract_skills(resume)
+
+    def _embed_resume(self, resume: ProcessedDocument, job: dict):
+        """Embedding stage: chunk embeddings in chunked mode, else the document embedding"""
+        if self.nlp_analyzer.chunked:
+            resume.chunks = self.chunk_embeddings([resume.text], [job])[0]
+            return
+        embeddings = self.nlp_analyzer.encode([resume.clean])
+        resume.embedding = embeddings[0] if embeddings is not None else None
+
+    def warm_up(self, dummy_inference: bool = True):
+        """
+        Load models and tokenizer data ahead of the first request
+        
+        Args:
+            dummy_inference: Run each model once; without it no inference
+                runs at all (a missing skill embedding matrix is not built)
+        """
+        warm_up_tokenizer()
+        self.nlp_analyzer.warm_up(dummy_inference)
+        if self.semantic_skills is not None:
+            self.semantic_skills.warm_up(build=dummy_inference)
+
+    def start_warm_up(self, dummy_inference: bool = True) -> threading.Thread:
+        """Run warm_up in a background thread"""
+        thread = threading.Thread(
+            target=self.warm_up,
+            args=(dummy_inference,),
+            name='pipeline-warm-up',
+            daemon=True
+        )
+        thread.start()
+        return thread
+
+    def config_version(self, profile: str = None) -> str:
+        """
+        Return a version string covering pipeline and scorer configuration
+
+        Args:
+            profile: spaCy profile of the analysis (default: the configured one)
+        """
+        version = (f"{PIPELINE_VERSION}:{self.ats_scorer.config_version()}"
+                   f":{self.skill_extractor.config_version()}")
+        if self.semantic_skills is not None:
+            version = f"{version}:{self.semantic_skills.config_version()}"
+        nlp_version = self.nlp_analyzer.config_version()
+        if nlp_version:
+            version = f"{version}:{nlp_version}"
+        # Noun phrases (and so semantic skill matches) come from the profile's parse
+        return f"{version}:spacy-{profile or self.nlp_analyzer.spacy_profile}"
+
+    def match_semantic_skills(self, resume_phrases: list, job_phrase_lists: list) -> tuple:
+        """
+        Semantic skill matches for a resume and jobs, encoded in one batch
+
+        Args:
+            resume_phrases: Candidate phrases of the resume
+            job_phrase_lists: Candidate phrases of each job
+
+        Returns:
+            (resume matches, list of job matches); empty without semantic_skills
+        """
+        if self.semantic_skills is None:
+            return {}, [{} for _ in job_phrase_lists]
+        matches = self.semantic_skills.match_many([resume_phrases] + list(job_phrase_lists))
+        return matches[0], matches[1:]
+
+    def prepare_job(self, job_description: str, profile: str = None) -> dict:
+        """
+        Run every job-side step once
+
+        Args:
+            job_description: Raw job description text
+            profile: spaCy profile (default: the analyzer's)
+
+        Returns:
+            Dictionary with cleaned text, keywords, skills and NLP results
+        """
+        job = self.prepare_job_text(job_description)
+        job['nlp'] = self.nlp_analyzer.analyze_job(job['clean'], profile=profile)
+        return job
+
+    def prepare_jobs(self, job_descriptions: list, profile: str = None) -> list:
+        """
+        Run every job-side step for many job descriptions
+
+        All job descriptions are embedded with a single batched encode call
+        and parsed with one nlp.pipe pass.
+
+        Args:
+            job_descriptions: List of raw job description texts
+            profile: spaCy profile (default: the analyzer's)
+
+        Returns:
+            List of prepared jobs, in input order
+        """
+        jobs = [self.prepare_job_text(text) for text in job_descriptions]
+        analyses = self.nlp_analyzer.analyze_many([job['clean'] for job in jobs], profile=profile)
+        for job, analysis in zip(jobs, analyses):
+            job['nlp'] = analysis
+        return jobs
+
+    def prepare_job_text(self, job_description: str) -> dict:
+        """
+        Run the fast, text-only job-side steps (no models)
+
+        Args:
+            job_description: Raw job description text
+
+        Returns:
+            Dictionary with cleaned text, keywords and skills
+        """
+        job = ProcessedDocument(job_description)
+        with span('clean'):
+            job_clean = job.clean
+
+        with span('keywords'):
+            job_keywords = job.keywords()
+        record_input_size('job', len(job_description), len(job.tokens))
+
+        with span('skills'):
+            job_skills = self.skill_extractor.extract_skills(job)
+
+        return {
+            'text': job_description,
+            'clean': job_clean,
+            'keywords': job_keywords,
+            'skills': job_skills
+        }
+
+    def chunk_embeddings(self, resume_texts: list, jobs: list) -> list:
+        """
+        Chunk embeddings for resumes, filling in jobs that lack them
+
+        Chunks of every text are encoded in one batched call, so job chunks
+        are left to the first analysis rather than computed by prepare_job.
+        Does nothing unless the analyzer is in chunked mode.
+
+        Args:
+            resume_texts: Raw resume texts
+            jobs: Prepared jobs; their 'chunks' entry is set if missing
+
+        Returns:
+            List of resume chunk embeddings (None entries in document mode)
+        """
+        if not self.nlp_analyzer.chunked:
+            return [None] * len(resume_texts)
+
+        pending = [job for job in jobs if job.get('chunks') is None]
+        chunks = self.nlp_analyzer.encode_chunks(
+            list(resume_texts) + [job['text'] for job in pending]
+        )
+        for job, job_chunks in zip(pending, chunks[len(resume_texts):]):
+            job['chunks'] = job_chunks
+        return chunks[:len(resume_texts)]
+
+    def analyze(self, resume_text: str, job: dict, profile: str = None) -> dict:
+        """
+        Analyze a single resume against a prepared job description
+
+        Args:
+            resume_text: Raw resume text or ProcessedDocument
+            job: Output of prepare_job
+            profile: spaCy profile (default: the analyzer's)
+
+        Returns:
+            Analysis response dictionary
+        """
+        return self._run_stages(self.iter_stages(resume_text, job, profile=profile))
+
+    def analyze_batch(self, resume_texts: list, job: dict, embeddings=None,
+                      profile: str = None) -> list:
+        """
+        Analyze many resumes against one prepared job description
+
+        All resumes are embedded with a single batched encode call (of their
+        chunks in chunked mode) and parsed with one nlp.pipe pass.
+
+        Args:
+            resume_texts: List of raw resume texts or ProcessedDocuments
+            job: Output of prepare_job
+            embeddings: Precomputed resume embeddings, one row per text (optional)
+            profile: spaCy profile (default: the analyzer's)
+
+        Returns:
+            List of analysis response dictionaries, in input order
+        """
+        resumes = [as_document(text) for text in resume_texts]
+        with span('clean'):
+            resume_cleans = [resume.clean for resume in resumes]
+        chunks = self.chunk_embeddings([resume.text for resume in resumes], [job])
+        if embeddings is None and not self.nlp_analyzer.chunked:
+            embeddings = self.nlp_analyzer.encode(resume_cleans)
+        docs = self.nlp_analyzer.parse_many(resume_cleans, profile=profile)
+
+        results = []
+        for i, resume in enumerate(resumes):
+            resume.doc, resume.chunks = docs[i], chunks[i]
+            if embeddings is not None:
+                resume.embedding = embeddings[i]
+            results.append(self._run_stages(self.iter_stages(resume, job, profile)))
+
+        return results
+
+    def match_jobs(self, resume_text: str, jobs: list, resume_embedding=None,
+                   profile: str = None) -> list:
+        """
+        Analyze one resume against many prepared job descriptions
+
+        The resume is processed once; similarities to every job come from a
+        single matrix product and skill gaps from set operations.
+
+        Args:
+            resume_text: Raw resume text or ProcessedDocument
+            jobs: Outputs of prepare_job or prepare_jobs
+            resume_embedding: Precomputed resume embedding (optional)
+            profile: spaCy profile (default: the analyzer's)
+
+        Returns:
+            List of analysis response dictionaries, in job order
+        """
+        resume = as_document(resume_text)
+        if resume_embedding is not None:
+            resume.embedding = resume_embedding
+
+        with span('sections'):
+            resume_sections = self.resume_parser.extract_sections(resume)
+
+        with span('clean'):
+            resume.clean  # shared by keywords, the embedding and the parse
+
+        with span('keywords'):
+            resume_keywords = resume.keywords()
+        record_input_size('resume', len(resume.text), len(resume.tokens))
+
+        with span('skills'):
+            resume_skills = self.skill_extractor.extract_skills(resume)
+
+        resume.chunks = self.chunk_embeddings([resume.text], jobs)[0]
+        if resume.embedding is None and resume.chunks is not None:
+            resume.embedding = chunk_centroid(resume.chunks)
+
+        resume_nlp = self.nlp_analyzer.analyze_resume(resume, profile=profile)
+        if self.nlp_analyzer.chunked:
+            pairs = [self.nlp_analyzer.chunk_similarity(resume.chunks, job['chunks']) for job in jobs]
+            similarities = [similarity for similarity, _ in pairs]
+            details = [detail for _, detail in pairs]
+        else:
+            with span('similarity_matrix'):
+                similarities = self.nlp_analyzer.similarities(
+                    resume_nlp['embedding'], [job['nlp']['embedding'] for job in jobs]
+                )
+            details = [None] * len(jobs)
+
+        resume_semantic, job_semantics = self.match_semantic_skills(
+            resume_nlp.get('phrases', []), [job['nlp'].get('phrases', []) for job in jobs]
+        )
+
+        results = []
+        for job, similarity, detail, job_semantic in zip(jobs, similarities, details, job_semantics):
+            nlp_results = self.nlp_analyzer.combine(resume_nlp, job['nlp'], similarity, detail)
+            keyword_match = summarize_keywords(resume_keywords, job['keywords'])
+            skill_gap = summarize_skills(
+                resume_skills | set(resume_semantic), set(job['skills']) | set(job_semantic)
+            )
+
+            with span('score'):
+                ats_results = self.ats_scorer.calculate_score(
+                    resume_text=resume,
+                    job_description=ProcessedDocument(job['text'], clean=job['clean']),
+                    resume_sections=resume_sections,
+                    nlp_results=nlp_results,
+                    resume_keywords=resume_keywords,
+                    job_keywords=job['keywords'],
+                    resume_skills=resume_skills,
+                    job_skills=job['skills'],
+                    resume_semantic_skills=set(resume_semantic),
+                    job_semantic_skills=set(job_semantic)
+                )
+
+            response = build_response(
+                ats_results, nlp_results, resume_sections, keyword_match, skill_gap
+            )
+            if self.semantic_skills is not None:
+                response['semantic_skills'] = summarize_semantic_skills(
+                    resume_semantic, job_semantic, resume_skills, job['skills']
+                )
+            results.append(response)
+
+        return results
+
+    def iter_stages(self, resume_text, job: dict, profile: str = None):
+        """
+        Analyze a resume stage by stage, cheapest stages first
+
+        Job NLP results are computed here if job came from prepare_job_text.
+        In parallel mode keywords, skills, the resume embedding, the spaCy
+        parse and job NLP run concurrently once the text is cleaned; stages
+        are still yielded in the same order, and a stage that exceeds its
+        timeout raises StageTimeoutError.
+
+        Args:
+            resume_text: Raw resume text, or ProcessedDocument (its cleaned
+                text, Doc, embedding and chunks are used when present)
+            job: Output of prepare_job or prepare_job_text
+            profile: spaCy profile for texts parsed here (default: the analyzer's)
+
+        Yields:
+            (stage, data) tuples: 'sections', 'keyword_match', 'skill_gap',
+            'semantic_similarity', then 'score' with the full response.
+            With semantic skills, the early 'skill_gap' has exact matches
+            only; the final response includes semantic matches.
+        """
+        resume = as_document(resume_text)
+        # Stages fill in the job's NLP results and chunks on this copy, never
+        # on a registered job that other requests share
+        job = dict(job)
+        with span('sections'):
+            resume_sections = self.resume_parser.extract_sections(resume)
+        yield 'sections', summarize_sections(resume_sections)
+
+        # Text artifacts are computed once, before the stages that share them
+        # start, so concurrent stages never fill the same lazy field
+        with span('clean'):
+            resume.token_counts
+
+        # Independent stages: none needs another's output; each stores its
+        # own artifact (skill hits, Doc, embedding or chunks) on the document
+        keywords_task = self.start_stage('keywords', self._extract_keywords, resume)
+        skills_task = self.start_stage('skills', self._extract_skills, resume)
+        embedding_task = None
+        if resume.chunks is None and resume.embedding is None:
+            embedding_task = self.start_stage('embedding', self._embed_resume, resume, job)
+        spacy_task = None
+        if resume.doc is None:
+            spacy_task = self.start_stage('spacy', self.nlp_analyzer.parse, resume, profile)
+        job_nlp_task = None
+        if 'nlp' not in job:
+            job_nlp_task = self.start_stage(
+                'job_nlp', self.nlp_analyzer.analyze_job, job['clean'], profile=profile
+            )
+
+        # Keywords
+        resume_keywords = keywords_task.result()
+        record_input_size('resume', len(resume.text), len(resume.tokens))
+        job_keywords = job['keywords']
+        keyword_match = summarize_keywords(resume_keywords, job_keywords)
+        yield 'keyword_match', keyword_match
+
+        # Skills
+        resume_skills = skills_task.result()
+        job_skills = job['skills']
+        skill_gap = summarize_skills(resume_skills, job_skills)
+        yield 'skill_gap', skill_gap
+
+        # NLP analysis against precomputed job results
+        if embedding_task is not None:
+            embedding_task.result()
+        if spacy_task is not None:
+            spacy_task.result()
+        if job_nlp_task is not None:
+            job['nlp'] = job_nlp_task.result()
+        nlp_results = self.nlp_analyzer.analyze(
+            resume,
+            job['clean'],
+            job_analysis=job['nlp'],
+            profile=profile,
+            job_chunks=job.get('chunks')
+        )
+        yield 'semantic_similarity', {
+            'semantic_similarity': round(nlp_results.get('similarity', 0) * 100, 2)
+        }
+
+        # Skills paraphrased by noun phrases
+        resume_semantic, (job_semantic,) = self.match_semantic_skills(
+            nlp_results.get('resume_phrases', []), [nlp_results.get('job_phrases', [])]
+        )
+        if resume_semantic or job_semantic:
+            skill_gap = summarize_skills(
+                set(resume_skills) | set(resume_semantic), set(job_skills) | set(job_semantic)
+            )
+
+        # ATS score
+        with span('score'):
+            ats_results = self.ats_scorer.calculate_score(
+                resume_text=resume,
+                job_description=ProcessedDocument(job['text'], clean=job['clean']),
+                resume_sections=resume_sections,
+                nlp_results=nlp_results,
+                resume_keywords=resume_keywords,
+                job_keywords=job_keywords,
+                resume_skills=resume_skills,
+                job_skills=job_skills,
+                resume_semantic_skills=set(resume_semantic),
+                job_semantic_skills=set(job_semantic)
+            )
+
+        response = build_response(
+            ats_results, nlp_results, resume_sections, keyword_match, skill_gap
+        )
+        if self.semantic_skills is not None:
+            response['semantic_skills'] = summarize_semantic_skills(
+                resume_semantic, job_semantic, resume_skills, job_skills
+            )
+        yield 'score', response
+
+    @staticmethod
+    def _run_stages(stages) -> dict:
+        """Drain iter_stages and return the final response"""
+        for _, data in stages:
+            pass
+        return data
+
+def summarize_sections(resume_sections):
+    """Section presence as reported in the API response"""
+    return {
+        'contact': resume_sections.get('contact', False),
+        'summary': resume_sections.get('summary', False),
+        'experience': resume_sections.get('experience', False),
+        'education': resume_sections.get('education', False),
+        'skills': resume_sections.get('skills', False),
+        'projects': resume_sections.get('projects', False)
+    }
+
+def summarize_keywords(resume_keywords, job_keywords):
+    """Matched and missing keywords as reported in the API response"""
+    matched_keywords = list(set(resume_keywords) & set(job_keywords))
+    missing_keywords = list(set(job_keywords) - set(resume_keywords))
+
+    keyword_match_percentage = (len(matched_keywords) / len(job_keywords) * 100) if job_keywords else 0
+
+    return {
+        'matched': matched_keywords[:20],  # Top 20
+        'missing': missing_keywords[:20],
+        'match_percentage': round(keyword_match_percentage, 2),
+        'total_job_keywords': len(job_keywords),
+        'total_matched': len(matched_keywords)
+    }
+
+def summarize_skills(resume_skills, job_skills):
+    """Skill gap as reported in the API response"""
+    matched_skills = list(set(resume_skills) & set(job_skills))
+    missing_skills = list(set(job_skills) - set(resume_skills))
+
+    return {
+        'required': list(job_skills)[:15],
+        'present': list(matched_skills)[:15],
+        'missing': list(missing_skills)[:15],
+        'match_percentage': round((len(matched_skills) / len(job_skills) * 100) if job_skills else 0, 2)
+    }
+
+def summarize_semantic_skills(resume_semantic, job_semantic, resume_skills, job_skills):
+    """Semantic skill matches not also found exactly, as reported in the API response"""
+    def rows(matches, exact):
+        return [
+            {'skill': skill, 'phrase': match['phrase'], 'similarity': round(match['similarity'] * 100, 2)}
+            for skill, match in sorted(matches.items()) if skill not in exact
+        ]
+
+    return {
+        'resume': rows(resume_semantic, resume_skills),
+        'job': rows(job_semantic, job_skills)
+    }
+
+def build_response(ats_results, nlp_results, resume_sections, keyword_match, skill_gap):
+    """Assemble the API response for one analysis"""
+    # Suggestions only use the top few missing items, so the truncated lists suffice
+    suggestions = generate_suggestions(
+        ats_results['score'],
+        keyword_match['missing'],
+        skill_gap['missing'],
+        resume_sections
+    )
+
+    response = {
+        'success': True,
+        'ats_score': round(ats_results['score'], 2),
+        'score_breakdown': ats_results['breakdown'],
+        'rating': get_rating(ats_results['score']),
+        'keyword_match': keyword_match,
+        'skill_gap': skill_gap,
+        'sections': summarize_sections(resume_sections),
+        'suggestions': suggestions,
+        'semantic_similarity': round(nlp_results.get('similarity', 0) * 100, 2),
+        'analysis_timestamp': datetime.now().isoformat()
+    }
+
+    # Chunked embeddings also report coverage per resume section
+    if 'chunk_count' in nlp_results:
+        response['chunk_count'] = nlp_results['chunk_count']
+        response['section_similarity'] = {
+            section: round(similarity * 100, 2)
+            for section, similarity in nlp_results['section_similarity'].items()
+        }
+
+    return response
+
+def get_rating(score):
+    """Convert score to rating"""
+    if score >= 90:
+        return {
+            'level': 'Excellent',
+            'color': 'green',
+            'message': 'Very high chance of passing ATS!'
+        }
+    elif score >= 75:
+        return {
+            'level': 'Good',
+            'color': 'blue',
+            'message': 'Good chance with minor improvements'
+        }
+    elif score >= 60:
+        return {
+            'level': 'Fair',
+            'color': 'yellow',
+            'message': 'Needs improvements to pass ATS'
+        }
+    elif score >= 45:
+        return {
+            'level': 'Poor',
+            'color': 'orange',
+            'message': 'Significant changes required'
+        }
+    else:
+        return {
+            'level': 'Very Poor',
+            'color': 'red',
+            'message': 'Major overhaul needed'
+        }
+
+def generate_suggestions(score, missing_keywords, missing_skills, sections):
+    """Generate actionable improvement suggestions"""
+    suggestions = []
+
+    # Score-based suggestions
+    if score < 60:
+        suggestions.append({
+            'type': 'critical',
+            'category': 'Overall',
+            'message': 'Your resume needs significant improvements to pass ATS screening',
+            'action': 'Focus on adding relevant keywords and restructuring content'
+        })
+
+    # Keyword suggestions
+    if missing_keywords:
+        top_missing = missing_keywords[:5]
+        suggestions.append({
+            'type': 'high',
+            'category': 'Keywords',
+            'message': f'Add these critical keywords: {", ".join(top_missing)}',
+            'action': 'Incorporate these keywords naturally in your experience and skills sections'
+        })
+
+    # Skill suggestions
+    if missing_skills:
+        top_skills = missing_skills[:5]
+        suggestions.append({
+            'type': 'high',
+            'category': 'Skills',
+            'message': f'Missing required skills: {", ".join(top_skills)}',
+            'action': 'Add these skills if you have them, or consider learning them'
+        })
+
+    # Section suggestions
+    if not sections.get('summary'):
+        suggestions.append({
+            'type': 'medium',
+            'category': 'Structure',
+            'message': 'Add a professional summary at the top',
+            'action': 'Write a 2-3 sentence summary highlighting your key qualifications'
+        })
+
+    if not sections.get('skills'):
+        suggestions.append({
+            'type': 'high',
+            'category': 'Structure',
+            'message': 'Add a dedicated Skills section',
+            'action': 'Create a clear skills section with relevant technical and soft skills'
+        })
+
+    # Formatting suggestions
+    suggestions.append({
+        'type': 'low',
+        'category': 'Formatting',
+        'message': 'Use standard section headings',
+        'action': 'Use clear headings like "Experience", "Education", "Skills"'
+    })
+
+    suggestions.append({
+        'type': 'low',
+        'category': 'Formatting',
+        'message': 'Avoid tables, images, and complex formatting',
+        'action': 'Use simple text formatting that ATS can easily parse'
+    })
+
+    # Positive feedback
+    if score >= 75:
+        suggestions.insert(0, {
+            'type': 'success',
+            'category': 'Overall',
+            'message': 'Great job! Your resume is well-optimized for ATS',
+            'action': 'Make the suggested minor improvements to reach excellent level'
+        })
+
+    return suggestions
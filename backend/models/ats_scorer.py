@@ -3,6 +3,11 @@ ATS Scorer - Calculate comprehensive ATS score
 Combines multiple factors to predict resume's ATS performance
 """
 
+import hashlib
+import json
+
+from utils.processed_document import as_document
+
 class ATSScorer:
     """Calculate ATS score based on multiple factors"""
     
@@ -16,32 +21,42 @@ class ATSScorer:
             'format_structure': 0.10    # 10 points
         }
     
+    def config_version(self) -> str:
+        """Return a short hash of the scoring configuration"""
+        config = json.dumps(self.weights, sort_keys=True)
+        return hashlib.sha256(config.encode('utf-8')).hexdigest()[:12]
+    
     def calculate_score(self, **kwargs) -> dict:
         """
         Calculate overall ATS score
         
         Args:
-            resume_text: Full resume text
-            job_description: Job description text
+            resume_text: Full resume text or ProcessedDocument
+            job_description: Job description text or ProcessedDocument
             resume_sections: Dict of section presence
             nlp_results: NLP analysis results
             resume_keywords: List of resume keywords
             job_keywords: List of job keywords
             resume_skills: Set of resume skills
             job_skills: Set of job skills
+            resume_semantic_skills: Skills the resume paraphrases (optional)
+            job_semantic_skills: Skills the job description paraphrases (optional)
             
         Returns:
             Dictionary with score and breakdown
         """
         # Extract arguments
-        resume_text = kwargs.get('resume_text', '')
-        job_description = kwargs.get('job_description', '')
+        # Both texts are lowercased once for the experience and education checks
+        resume_text = as_document(kwargs.get('resume_text', ''))
+        job_description = as_document(kwargs.get('job_description', ''))
         resume_sections = kwargs.get('resume_sections', {})
         nlp_results = kwargs.get('nlp_results', {})
         resume_keywords = kwargs.get('resume_keywords', [])
         job_keywords = kwargs.get('job_keywords', [])
         resume_skills = kwargs.get('resume_skills', set())
         job_skills = kwargs.get('job_skills', set())
+        resume_semantic_skills = kwargs.get('resume_semantic_skills', set())
+        job_semantic_skills = kwargs.get('job_semantic_skills', set())
         
         # Calculate component scores
         keyword_score = self._calculate_keyword_score(
@@ -49,7 +64,7 @@ class ATSScorer:
         )
         
         skills_score = self._calculate_skills_score(
-            resume_skills, job_skills
+            resume_skills, job_skills, resume_semantic_skills, job_semantic_skills
         )
         
         experience_score = self._calculate_experience_score(
@@ -99,8 +114,13 @@ class ATSScorer:
         
         return exact_score + semantic_score
     
-    def _calculate_skills_score(self, resume_skills, job_skills):
-        """Calculate skills matching score (0-1)"""
+    def _calculate_skills_score(self, resume_skills, job_skills,
+                                resume_semantic_skills=(), job_semantic_skills=()):
+        """Calculate skills matching score (0-1), counting semantic matches as present"""
+        if resume_semantic_skills or job_semantic_skills:
+            resume_skills = set(resume_skills) | set(resume_semantic_skills)
+            job_skills = set(job_skills) | set(job_semantic_skills)
+        
         if not job_skills:
             return 0.6  # Neutral score if no required skills
         
@@ -120,8 +140,8 @@ class ATSScorer:
         score = 0.5  # Base score
         
         # Check for years of experience
-        resume_lower = resume_text.lower()
-        job_lower = job_description.lower()
+        resume_lower = as_document(resume_text).lower
+        job_lower = as_document(job_description).lower
         
         # Look for experience mentions
         experience_keywords = ['years', 'experience', 'worked', 'developed']
@@ -135,8 +155,8 @@ class ATSScorer:
         """Calculate education matching score (0-1)"""
         score = 0.5  # Base score
         
-        resume_lower = resume_text.lower()
-        job_lower = job_description.lower()
+        resume_lower = as_document(resume_text).lower
+        job_lower = as_document(job_description).lower
         
         # Common degree levels
         degrees = ['bachelor', 'master', 'phd', 'doctorate', 'mba']
@@ -0,0 +1,128 @@
+"""
+Embedding Backends - Interchangeable sentence embedding inference
+PyTorch sentence-transformers (reference) or exported ONNX Runtime models
+"""
+
+import json
+import os
+
+import numpy as np
+
+BACKENDS = ('torch', 'onnx', 'onnx-int8')
+
+# Files written by scripts/export_onnx.py
+ONNX_MODEL_FILE = 'model.onnx'
+ONNX_INT8_MODEL_FILE = 'model_int8.onnx'
+EXPORT_META_FILE = 'export.json'
+
+class TorchEmbeddingBackend:
+    """Reference backend: the sentence-transformers model on PyTorch"""
+
+    def __init__(self, model_name: str, threads: int = 0):
+        """
+        Args:
+            model_name: Sentence transformer name
+            threads: torch intra-op threads (0 keeps the default)
+        """
+        from sentence_transformers import SentenceTransformer
+
+        if threads:
+            import torch
+            torch.set_num_threads(threads)
+
+        self.name = 'torch'
+        self.model = SentenceTransformer(model_name)
+
+    def encode(self, texts: list, batch_size: int = 32) -> np.ndarray:
+        """Embed texts, one float32 row per text"""
+        return np.asarray(self.model.encode(texts, batch_size=batch_size), dtype=np.float32)
+
+class OnnxEmbeddingBackend:
+    """
+    Exported transformer run with ONNX Runtime on CPU
+
+    Tokenization, mean pooling and normalization are done here, matching the
+    sentence-transformers modules recorded in export.json.
+    """
+
+    def __init__(self, model_dir: str, quantized: bool = False, threads: int = 0):
+        """
+        Args:
+            model_dir: Output directory of scripts/export_onnx.py
+            quantized: Load the dynamically int8-quantized model
+            threads: ONNX Runtime intra-op threads (0 keeps the default)
+        """
+        import onnxruntime as ort
+        from transformers import AutoTokenizer
+
+        with open(os.path.join(model_dir, EXPORT_META_FILE)) as file:
+            self.meta = json.load(file)
+
+        path = os.path.join(model_dir, ONNX_INT8_MODEL_FILE if quantized else ONNX_MODEL_FILE)
+        if not os.path.exists(path):
+            raise FileNotFoundError(
+                f"{path} not found. Run: python -m scripts.export_onnx --output {model_dir}"
+            )
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if threads:
+            options.intra_op_num_threads = threads
+
+        self.name = 'onnx-int8' if quantized else 'onnx'
+        self.session = ort.InferenceSession(path, options, providers=['CPUExecutionProvider'])
+        self.input_names = [item.name for item in self.session.get_inputs()]
+        self.tokenizer = AutoTokenizer.from_pretrained(model_dir)
+        self.max_seq_length = self.meta['max_seq_length']
+        self.normalize = self.meta.get('normalize', True)
+
+    def encode(self, texts: list, batch_size: int = 32) -> np.ndarray:
+        """Embed texts, one float32 row per text"""
+        texts = list(texts)
+        if not texts:
+            return np.zeros((0, self.meta['dimension']), dtype=np.float32)
+
+        # Batch texts of similar length together to minimise padding
+        order = sorted(range(len(texts)), key=lambda i: -len(texts[i]))
+        embeddings = np.empty((len(texts), self.meta['dimension']), dtype=np.float32)
+
+        for start in range(0, len(order), batch_size):
+            batch = order[start:start + batch_size]
+            tokens = self.tokenizer(
+                [texts[i] for i in batch],
+                padding=True,
+                truncation=True,
+                max_length=self.max_seq_length,
+                return_tensors='np'
+            )
+            feed = {name: tokens[name].astype(np.int64) for name in self.input_names}
+            hidden = self.session.run(None, feed)[0]
+
+            mask = tokens['attention_mask'][..., None].astype(np.float32)
+            pooled = (hidden * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+            if self.normalize:
+                pooled /= np.clip(np.linalg.norm(pooled, axis=1, keepdims=True), 1e-12, None)
+            embeddings[batch] = pooled
+
+        return embeddings
+
+def create_embedding_backend(backend: str, model_name: str, onnx_dir: str = None, threads: int = 0):
+    """
+    Build an embedding backend
+
+    Args:
+        backend: One of BACKENDS
+        model_name: Sentence transformer name (torch backend)
+        onnx_dir: Exported model directory (onnx backends)
+        threads: Intra-op threads (0 keeps the runtime default)
+
+    Returns:
+        Backend with encode(texts, batch_size) -> float32 array
+    """
+    if backend == 'torch':
+        return TorchEmbeddingBackend(model_name, threads)
+    if backend in ('onnx', 'onnx-int8'):
+        if not onnx_dir:
+            raise ValueError(f"The {backend} backend needs an exported model directory")
+        return OnnxEmbeddingBackend(onnx_dir, quantized=backend == 'onnx-int8', threads=threads)
+    raise ValueError(f"Unknown embedding backend: {backend}")
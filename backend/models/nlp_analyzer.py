@@ -3,147 +3,698 @@ NLP Analyzer - Semantic analysis using spaCy and sentence transformers
 Performs advanced text analysis beyond simple keyword matching
 """
 
-import spacy
-from sentence_transformers import SentenceTransformer
+import threading
+import time
 from sklearn.metrics.pairwise import cosine_similarity
 import numpy as np
+from utils.metrics import span
+from utils.chunking import POOLING_MODES, section_chunks, normalize, pool_similarity
+from models.embedding_backend import BACKENDS, create_embedding_backend
+from utils.encode_scheduler import EncodeScheduler
+from utils.processed_document import ProcessedDocument
+
+# spaCy refuses longer texts by default
+MAX_SPACY_CHARS = 1000000
+
+# Candidate skill phrases kept per document
+MAX_SKILL_PHRASES = 100
+
+# Components each Doc-based feature needs in the en_core_web_* pipelines
+# (ner carries its own tok2vec; noun_chunks reads POS and dependencies)
+FEATURE_COMPONENTS = {
+    'entities': ('ner',),
+    'noun_chunks': ('tok2vec', 'tagger', 'attribute_ruler', 'parser')
+}
+
+# Components shipped with the en_core_web_* pipelines
+PIPELINE_COMPONENTS = ('tok2vec', 'tagger', 'parser', 'senter', 'attribute_ruler', 'lemmatizer', 'ner')
+
+# Analyzer profiles: spaCy model plus the features it must support
+# (features None loads every component)
+SPACY_PROFILES = {
+    'full': {'model': 'en_core_web_md', 'features': None},
+    'fast': {'model': 'en_core_web_sm', 'features': ('entities', 'noun_chunks')}
+}
+
+def profile_exclude(features) -> list:
+    """
+    Pipeline components a profile does not need to load
+    
+    Args:
+        features: Feature names from FEATURE_COMPONENTS, or None for all
+        
+    Returns:
+        List of component names to pass to spacy.load(exclude=...)
+    """
+    if features is None:
+        return []
+    
+    required = set()
+    for feature in features:
+        required.update(FEATURE_COMPONENTS[feature])
+    return [name for name in PIPELINE_COMPONENTS if name not in required]
+
+def chunk_centroid(chunks: dict):
+    """Unit-length mean of a text's chunk embeddings (None if it has none)"""
+    if chunks is None or not len(chunks['embeddings']):
+        return None
+    return normalize(chunks['embeddings'].mean(axis=0, keepdims=True))[0]
 
 class NLPAnalyzer:
     """Perform NLP analysis on resume and job description"""
     
-    def __init__(self):
-        """Initialize NLP models"""
-        try:
-            # Load spaCy model
-            self.nlp = spacy.load("en_core_web_md")
-            print("✓ Loaded spaCy model: en_core_web_md")
-        except:
-            print("⚠ spaCy model not found. Run: python -m spacy download en_core_web_md")
-            self.nlp = None
+    def __init__(self, spacy_model: str = None,
+                 sentence_model_name: str = 'all-MiniLM-L6-v2',
+                 embedding_cache=None, pipe_batch_size: int = 32,
+                 pipe_n_process: int = 1, spacy_profile: str = 'full',
+                 spacy_profiles: dict = None, embedding_mode: str = 'document',
+                 chunk_words: int = 128, chunk_overlap: int = 32,
+                 pooling: str = 'max_sim', pooling_top_k: int = 3,
+                 embedding_backend: str = 'torch', onnx_dir: str = None,
+                 embedding_threads: int = 0, micro_batching: bool = False,
+                 max_batch_size: int = 32, max_wait_ms: float = 5.0):
+        """
+        Set up lazy model loading
+        
+        Models are loaded on first use (or by warm_up), not here, so
+        constructing the analyzer is cheap.
+        
+        Args:
+            spacy_model: spaCy pipeline for the full profile (optional)
+            sentence_model_name: Sentence transformer name
+            embedding_cache: EmbeddingCache reused by encode (optional)
+            pipe_batch_size: Default nlp.pipe batch size for parse_many
+            pipe_n_process: Default nlp.pipe process count for parse_many
+            spacy_profile: Profile used when a call does not name one
+            spacy_profiles: Overrides merged into SPACY_PROFILES, by profile name
+            embedding_mode: 'document' (one embedding per text) or 'chunked'
+            chunk_words: Words per chunk in chunked mode
+            chunk_overlap: Words shared by consecutive chunks
+            pooling: Chunk pooling, one of POOLING_MODES
+            pooling_top_k: Chunks averaged per job chunk for topk_mean
+            embedding_backend: Sentence embedding inference, one of BACKENDS
+            onnx_dir: Exported model directory for the onnx backends
+            embedding_threads: Intra-op threads for the embedding backend (0: default)
+            micro_batching: Batch encode calls from concurrent requests
+            max_batch_size: Texts per micro-batched forward pass
+            max_wait_ms: Longest an encode call waits for others to join its batch
+        """
+        if embedding_backend not in BACKENDS:
+            raise ValueError(f"Unknown embedding backend: {embedding_backend}")
+        if embedding_mode not in ('document', 'chunked'):
+            raise ValueError(f"Unknown embedding mode: {embedding_mode}")
+        if pooling not in POOLING_MODES:
+            raise ValueError(f"Unknown pooling mode: {pooling}")
+        if not 0 <= chunk_overlap < chunk_words:
+            raise ValueError("chunk_overlap must be at least 0 and smaller than chunk_words")
+        
+        self.spacy_profiles = {name: dict(config) for name, config in SPACY_PROFILES.items()}
+        for name, config in (spacy_profiles or {}).items():
+            self.spacy_profiles.setdefault(name, {'features': None}).update(config)
+        if spacy_model:
+            self.spacy_profiles['full']['model'] = spacy_model
+        if spacy_profile not in self.spacy_profiles:
+            raise ValueError(f"Unknown spaCy profile: {spacy_profile}")
+        
+        self.spacy_profile = spacy_profile
+        self.spacy_model = self.spacy_profiles[spacy_profile]['model']
+        self.sentence_model_name = sentence_model_name
+        self.embedding_backend = embedding_backend
+        self.onnx_dir = onnx_dir
+        self.embedding_threads = embedding_threads
+        self.encode_scheduler = (
+            EncodeScheduler(self._encode_batch, max_batch_size, max_wait_ms)
+            if micro_batching else None
+        )
+        # Backends agree only approximately, so their vectors are cached apart
+        self.embedding_key = (
+            sentence_model_name if embedding_backend == 'torch'
+            else f'{sentence_model_name}:{embedding_backend}'
+        )
+        self.embedding_cache = embedding_cache
+        self.pipe_batch_size = pipe_batch_size
+        self.pipe_n_process = pipe_n_process
+        self.embedding_mode = embedding_mode
+        self.chunk_words = chunk_words
+        self.chunk_overlap = chunk_overlap
+        self.pooling = pooling
+        self.pooling_top_k = pooling_top_k
+        # Set by the pipeline when skills are also matched semantically
+        self.skill_phrases = False
+        self._models = {}
+        self._profiles_lock = threading.Lock()
+        self._locks = {
+            'spacy': threading.Lock(),
+            'sentence_transformer': threading.Lock()
+        }
+        self.model_status = {
+            'spacy': self._new_status(self.spacy_model),
+            'sentence_transformer': self._new_status(sentence_model_name)
+        }
+        self.warm_up_status = {'state': 'not_started', 'duration': None}
+    
+    @property
+    def chunked(self) -> bool:
+        """True when similarity comes from chunk embeddings"""
+        return self.embedding_mode == 'chunked'
+    
+    def config_version(self) -> str:
+        """Settings that change similarity scores ('' for the defaults)"""
+        parts = []
+        if self.embedding_backend != 'torch':
+            parts.append(self.embedding_backend)
+        if self.chunked:
+            parts.append(
+                f"chunked-{self.chunk_words}-{self.chunk_overlap}-{self.pooling}-{self.pooling_top_k}"
+            )
+        return ':'.join(parts)
+    
+    @staticmethod
+    def _new_status(name: str) -> dict:
+        """Initial load status for a model"""
+        return {'name': name, 'state': 'not_loaded', 'load_time': None, 'error': None}
+    
+    @property
+    def nlp(self):
+        """spaCy pipeline of the default profile, loaded on first access (None if unavailable)"""
+        return self._get_model('spacy')
+    
+    def get_nlp(self, profile: str = None):
+        """
+        spaCy pipeline for a profile, loaded on first use
+        
+        Args:
+            profile: Profile name (default: spacy_profile)
+            
+        Returns:
+            spaCy Language, or None if unavailable
+        """
+        return self._get_model(self._spacy_key(profile))
+    
+    def _spacy_key(self, profile: str = None) -> str:
+        """Model key for a profile; the default profile is 'spacy'"""
+        profile = profile or self.spacy_profile
+        if profile == self.spacy_profile:
+            return 'spacy'
+        if profile not in self.spacy_profiles:
+            raise ValueError(f"Unknown spaCy profile: {profile}")
+        
+        key = f'spacy:{profile}'
+        with self._profiles_lock:
+            if key not in self.model_status:
+                self._locks[key] = threading.Lock()
+                self.model_status[key] = self._new_status(self.spacy_profiles[profile]['model'])
+        return key
+    
+    @property
+    def sentence_model(self):
+        """Embedding backend, loaded on first access (None if unavailable)"""
+        return self._get_model('sentence_transformer')
+    
+    def _get_model(self, key: str):
+        """Return a model, loading it exactly once across threads"""
+        if self.model_status[key]['state'] not in ('ready', 'failed'):
+            with self._locks[key]:
+                if self.model_status[key]['state'] not in ('ready', 'failed'):
+                    self._load_model(key)
+        return self._models.get(key)
+    
+    def _load_model(self, key: str):
+        """Load a model and record its state and load time"""
+        status = self.model_status[key]
+        status['state'] = 'loading'
+        start = time.perf_counter()
         
         try:
-            # Load sentence transformer for semantic similarity
-            self.sentence_model = SentenceTransformer('all-MiniLM-L6-v2')
-            print("✓ Loaded Sentence Transformer model")
-        except:
-            print("⚠ Sentence Transformer model not loaded")
-            self.sentence_model = None
+            if key.startswith('spacy'):
+                import spacy
+                profile = key.partition(':')[2] or self.spacy_profile
+                config = self.spacy_profiles[profile]
+                self._models[key] = spacy.load(
+                    config['model'], exclude=profile_exclude(config.get('features'))
+                )
+                print(f"✓ Loaded spaCy model: {config['model']} (profile: {profile})")
+            else:
+                self._models[key] = create_embedding_backend(
+                    self.embedding_backend, self.sentence_model_name,
+                    self.onnx_dir, self.embedding_threads
+                )
+                print(f"✓ Loaded Sentence Transformer model ({self.embedding_backend})")
+            status['state'] = 'ready'
+        except Exception as e:
+            if key.startswith('spacy'):
+                print(f"⚠ spaCy model not found. Run: python -m spacy download {status['name']}")
+            else:
+                print(f"⚠ Sentence Transformer model not loaded ({self.embedding_backend}): {e}")
+            status['state'] = 'failed'
+            status['error'] = str(e)
+        
+        status['load_time'] = round(time.perf_counter() - start, 3)
     
-    def analyze(self, resume_text: str, job_text: str) -> dict:
+    def warm_up(self, dummy_inference: bool = True):
+        """
+        Load all models and optionally run a dummy inference
+        
+        Args:
+            dummy_inference: Run each model once so lazy buffers are allocated
+        """
+        self.warm_up_status['state'] = 'running'
+        start = time.perf_counter()
+        
+        nlp = self.nlp
+        sentence_model = self.sentence_model
+        
+        if dummy_inference:
+            try:
+                if nlp:
+                    nlp("Senior software engineer with Python experience.")
+                if sentence_model:
+                    sentence_model.encode(["Senior software engineer with Python experience."])
+            except Exception as e:
+                print(f"Error during warm-up inference: {e}")
+        
+        self.warm_up_status['state'] = 'done'
+        self.warm_up_status['duration'] = round(time.perf_counter() - start, 3)
+    
+    def is_ready(self, profile: str = None) -> bool:
+        """True when a spaCy profile (default: the configured one) and the sentence transformer have loaded"""
+        keys = (self._spacy_key(profile), 'sentence_transformer')
+        with self._profiles_lock:
+            return all(
+                key in self.model_status and self.model_status[key]['state'] == 'ready'
+                for key in keys
+            )
+    
+    def status(self) -> dict:
+        """Return load state and load time of each model"""
+        with self._profiles_lock:
+            models = {key: dict(status) for key, status in self.model_status.items()}
+        return {
+            'models': models,
+            'spacy_profile': self.spacy_profile,
+            'warm_up': dict(self.warm_up_status)
+        }
+    
+    def analyze(self, resume_text: str, job_text: str, job_analysis: dict = None,
+                resume_embedding=None, resume_doc=None, profile: str = None,
+                resume_chunks: dict = None, job_chunks: dict = None) -> dict:
         """
         Perform comprehensive NLP analysis
         
         Args:
-            resume_text: Cleaned resume text
+            resume_text: Cleaned resume text, or ProcessedDocument (whose Doc,
+                embedding and chunks are used and filled in)
             job_text: Cleaned job description text
+            job_analysis: Precomputed output of analyze_job (optional)
+            resume_embedding: Precomputed resume embedding (optional)
+            resume_doc: Precomputed spaCy Doc of resume_text (optional)
+            profile: spaCy profile for texts parsed here (default: spacy_profile)
+            resume_chunks: Output of encode_chunks for the resume (optional)
+            job_chunks: Output of encode_chunks for the job description (optional)
             
         Returns:
-            Dictionary with analysis results
+            Dictionary with analysis results; with both chunk sets, similarity is
+            pooled over chunks and chunk_count and section_similarity are added
         """
-        results = {}
+        if job_analysis is None:
+            job_analysis = self.analyze_job(job_text, profile=profile)
         
-        # Semantic similarity
-        if self.sentence_model:
-            results['similarity'] = self._calculate_semantic_similarity(
-                resume_text, job_text
-            )
-        else:
-            results['similarity'] = 0.0
+        if isinstance(resume_text, ProcessedDocument):
+            if resume_embedding is None:
+                resume_embedding = resume_text.embedding
+            if resume_chunks is None:
+                resume_chunks = resume_text.chunks
         
-        # Entity extraction
-        if self.nlp:
-            results['resume_entities'] = self._extract_entities(resume_text)
-            results['job_entities'] = self._extract_entities(job_text)
-        else:
-            results['resume_entities'] = []
-            results['job_entities'] = []
+        # Chunk embeddings already cover the whole resume; skip a second model pass
+        if resume_embedding is None and resume_chunks is not None:
+            resume_embedding = chunk_centroid(resume_chunks)
+        
+        resume_analysis = self.analyze_resume(
+            resume_text, embedding=resume_embedding, doc=resume_doc, profile=profile
+        )
         
-        # Noun phrases (key concepts)
-        if self.nlp:
-            results['resume_concepts'] = self._extract_noun_phrases(resume_text)
-            results['job_concepts'] = self._extract_noun_phrases(job_text)
+        if resume_chunks is not None and job_chunks is not None:
+            similarity, detail = self.chunk_similarity(resume_chunks, job_chunks)
         else:
-            results['resume_concepts'] = []
-            results['job_concepts'] = []
+            similarity = self.similarities(resume_analysis['embedding'], [job_analysis['embedding']])[0]
+            detail = None
         
-        return results
+        return self.combine(resume_analysis, job_analysis, similarity, detail)
     
-    def _calculate_semantic_similarity(self, text1: str, text2: str) -> float:
+    def analyze_resume(self, resume_text: str, embedding=None, doc=None, profile: str = None) -> dict:
         """
-        Calculate semantic similarity using sentence transformers
+        Run the resume side of the analysis once
         
         Args:
-            text1: First text
-            text2: Second text
+            resume_text: Cleaned resume text or ProcessedDocument
+            embedding: Precomputed resume embedding (optional)
+            doc: Precomputed spaCy Doc of resume_text (optional)
+            profile: spaCy profile if doc is not given (default: spacy_profile)
             
         Returns:
-            Similarity score (0-1)
+            Dictionary with resume embedding, entities and concepts
         """
-        if not self.sentence_model:
-            return 0.0
+        return self._analyze_text(resume_text, embedding, doc, profile)
+    
+    def analyze_job(self, job_text: str, embedding=None, doc=None, profile: str = None) -> dict:
+        """
+        Run the job description side of the analysis once
+        
+        Args:
+            job_text: Cleaned job description text or ProcessedDocument
+            embedding: Precomputed job embedding (optional)
+            doc: Precomputed spaCy Doc of job_text (optional)
+            profile: spaCy profile if doc is not given (default: spacy_profile)
+            
+        Returns:
+            Dictionary with job embedding, entities and concepts
+        """
+        return self._analyze_text(job_text, embedding, doc, profile)
+    
+    def analyze_many(self, texts: list, batch_size: int = None, n_process: int = None,
+                     profile: str = None) -> list:
+        """
+        Analyze many texts with one batched encode and one nlp.pipe pass
+        
+        Args:
+            texts: Cleaned texts
+            batch_size: nlp.pipe batch size (default: pipe_batch_size)
+            n_process: nlp.pipe worker processes (default: pipe_n_process)
+            profile: spaCy profile (default: spacy_profile)
+            
+        Returns:
+            List of dictionaries with embedding, entities and concepts
+        """
+        texts = list(texts)
+        embeddings = self.encode(texts) if texts else None
+        docs = self.parse_many(texts, batch_size=batch_size, n_process=n_process, profile=profile)
+        
+        return [
+            self._analyze_text(
+                text,
+                embeddings[i] if embeddings is not None else None,
+                docs[i],
+                profile
+            )
+            for i, text in enumerate(texts)
+        ]
+    
+    def _analyze_text(self, text, embedding, doc, profile: str = None) -> dict:
+        """Embedding plus entities and concepts from a single parse"""
+        document = None
+        if isinstance(text, ProcessedDocument):
+            document, text = text, text.clean
+            if embedding is None:
+                embedding = document.embedding
+            if doc is None:
+                doc = document.doc
+        
+        if embedding is None:
+            embeddings = self.encode([text])
+            embedding = embeddings[0] if embeddings is not None else None
+        
+        if doc is None:
+            doc = self.parse(text, profile)
+        
+        if document is not None:
+            document.embedding, document.doc = embedding, doc
+        
+        analysis = {
+            'embedding': embedding,
+            'entities': self._extract_entities(doc),
+            'concepts': self._extract_noun_phrases(doc)
+        }
+        if self.skill_phrases:
+            analysis['phrases'] = self._extract_skill_phrases(doc)
+        return analysis
+    
+    def parse(self, text: str, profile: str = None):
+        """
+        Parse a text with spaCy once, for every Doc-based extractor
+        
+        Args:
+            text: Input text, or ProcessedDocument (its cleaned text is parsed
+                and the Doc kept on it)
+            profile: spaCy profile (default: spacy_profile)
+            
+        Returns:
+            spaCy Doc, or None if spaCy is unavailable
+        """
+        if isinstance(text, ProcessedDocument):
+            if text.doc is None:
+                text.doc = self.parse(text.clean, profile)
+            return text.doc
+        
+        nlp = self.get_nlp(profile)
+        if not nlp:
+            return None
         
         try:
-            # Encode texts
-            embedding1 = self.sentence_model.encode([text1])
-            embedding2 = self.sentence_model.encode([text2])
+            with span('spacy_parse'):
+                return nlp(text[:MAX_SPACY_CHARS])
+        except Exception as e:
+            print(f"Error parsing text: {e}")
+            return None
+    
+    def parse_many(self, texts: list, batch_size: int = None, n_process: int = None,
+                   profile: str = None) -> list:
+        """
+        Parse many texts with nlp.pipe
+        
+        Args:
+            texts: Input texts
+            batch_size: Texts per batch (default: pipe_batch_size)
+            n_process: Worker processes (default: pipe_n_process)
+            profile: spaCy profile (default: spacy_profile)
             
-            # Calculate cosine similarity
-            similarity = cosine_similarity(embedding1, embedding2)[0][0]
+        Returns:
+            List of spaCy Docs (None entries if spaCy is unavailable)
+        """
+        texts = list(texts)
+        nlp = self.get_nlp(profile)
+        if not nlp or not texts:
+            return [None] * len(texts)
+        
+        try:
+            with span('spacy_parse'):
+                return list(nlp.pipe(
+                    (text[:MAX_SPACY_CHARS] for text in texts),
+                    batch_size=batch_size or self.pipe_batch_size,
+                    n_process=n_process or self.pipe_n_process
+                ))
+        except Exception as e:
+            print(f"Error parsing texts: {e}")
+            return [None] * len(texts)
+    
+    def similarities(self, embedding, others: list) -> list:
+        """
+        Cosine similarity of one embedding against many in a single matrix product
+        
+        Args:
+            embedding: Query embedding (or None)
+            others: Embeddings to compare against (entries may be None)
             
-            return float(similarity)
+        Returns:
+            List of similarity scores, 0.0 where either embedding is missing
+        """
+        scores = [0.0] * len(others)
+        present = [i for i, other in enumerate(others) if other is not None]
+        if embedding is None or not present:
+            return scores
+        
+        try:
+            matrix = np.vstack([np.asarray(others[i], dtype=np.float32) for i in present])
+            row = cosine_similarity(np.asarray(embedding, dtype=np.float32).reshape(1, -1), matrix)[0]
+            for i, score in zip(present, row):
+                scores[i] = float(score)
         except Exception as e:
             print(f"Error calculating similarity: {e}")
-            return 0.0
+        
+        return scores
     
-    def _extract_entities(self, text: str) -> list:
+    def encode_chunks(self, texts: list) -> list:
         """
-        Extract named entities using spaCy
+        Embed section-aware chunks of many texts with one encode call
         
         Args:
-            text: Input text
+            texts: Raw texts (line breaks mark section headings)
+            
+        Returns:
+            List with a dictionary per text holding chunk 'sections' and
+            unit-length 'embeddings' (one row per chunk), or None entries if
+            the embedding model is unavailable
+        """
+        pieces = [section_chunks(text, self.chunk_words, self.chunk_overlap) for text in texts]
+        flat = [chunk for chunks in pieces for _, chunk in chunks]
+        
+        vectors = self.encode(flat) if flat else np.zeros((0, 0), dtype=np.float32)
+        if vectors is None:
+            return [None] * len(pieces)
+        vectors = normalize(vectors) if flat else vectors
+        
+        results = []
+        offset = 0
+        for chunks in pieces:
+            results.append({
+                'sections': [section for section, _ in chunks],
+                'embeddings': vectors[offset:offset + len(chunks)]
+            })
+            offset += len(chunks)
+        
+        return results
+    
+    def chunk_similarity(self, resume_chunks: dict, job_chunks: dict) -> tuple:
+        """
+        Pooled similarity of chunked resume and job embeddings
+        
+        Args:
+            resume_chunks: Output of encode_chunks for the resume
+            job_chunks: Output of encode_chunks for the job description
+            
+        Returns:
+            (similarity, detail) where detail has chunk_count and the pooled
+            similarity of each resume section to the whole job description
+        """
+        if resume_chunks is None or job_chunks is None:
+            return 0.0, None
+        
+        with span('chunk_similarity'):
+            resume_vectors = resume_chunks['embeddings']
+            job_vectors = job_chunks['embeddings']
+            similarity = pool_similarity(resume_vectors, job_vectors, self.pooling, self.pooling_top_k)
+            
+            section_similarity = {}
+            for section in dict.fromkeys(resume_chunks['sections']):
+                rows = [i for i, name in enumerate(resume_chunks['sections']) if name == section]
+                section_similarity[section] = pool_similarity(
+                    resume_vectors[rows], job_vectors, self.pooling, self.pooling_top_k
+                )
+        
+        return similarity, {
+            'chunk_count': {'resume': len(resume_vectors), 'job': len(job_vectors)},
+            'section_similarity': section_similarity
+        }
+    
+    @staticmethod
+    def combine(resume_analysis: dict, job_analysis: dict, similarity: float,
+                detail: dict = None) -> dict:
+        """Assemble analysis results from precomputed resume and job sides"""
+        results = {
+            'similarity': similarity,
+            'resume_entities': resume_analysis['entities'],
+            'job_entities': job_analysis['entities'],
+            'resume_concepts': resume_analysis['concepts'],
+            'job_concepts': job_analysis['concepts']
+        }
+        if detail:
+            results.update(detail)
+        if 'phrases' in resume_analysis:
+            results['resume_phrases'] = resume_analysis['phrases']
+            results['job_phrases'] = job_analysis.get('phrases', [])
+        return results
+    
+    def encode(self, texts: list, use_cache: bool = True, cache=None):
+        """
+        Encode texts with the sentence transformer in one batch
+        
+        Texts found in the embedding cache are not encoded again.
+        
+        Args:
+            texts: List of texts
+            use_cache: Read and fill the embedding cache
+            cache: EmbeddingCache to use instead of the analyzer's (optional)
+            
+        Returns:
+            Array of embeddings (one row per text), or None if unavailable
+        """
+        texts = list(texts)
+        cache = self.embedding_cache if cache is None else cache
+        if cache is None or not use_cache:
+            return self._encode(texts)
+        
+        with span('embedding_cache'):
+            vectors = cache.get_many(self.embedding_key, texts)
+        missing = [i for i, vector in enumerate(vectors) if vector is None]
+        
+        if missing:
+            encoded = self._encode([texts[i] for i in missing])
+            if encoded is None:
+                return None
+            cache.put_many(self.embedding_key, [texts[i] for i in missing], encoded)
+            for i, vector in zip(missing, np.asarray(encoded, dtype=np.float32)):
+                vectors[i] = vector
+        
+        if not vectors:
+            return np.zeros((0, 0), dtype=np.float32)
+        return np.vstack(vectors)
+    
+    def _encode(self, texts: list):
+        """Run the sentence transformer (None if unavailable)"""
+        if not self.sentence_model:
+            return None
+        
+        try:
+            with span('nlp_similarity'):
+                if self.encode_scheduler is not None:
+                    return self.encode_scheduler.encode(texts)
+                return self.sentence_model.encode(texts)
+        except Exception as e:
+            print(f"Error encoding texts: {e}")
+            return None
+    
+    def _encode_batch(self, texts: list):
+        """Forward pass for a micro-batch (runs on the scheduler thread)"""
+        return self.sentence_model.encode(texts, batch_size=self.encode_scheduler.max_batch_size)
+    
+    def _extract_entities(self, doc) -> list:
+        """
+        Extract named entities from a parsed document
+        
+        Args:
+            doc: spaCy Doc from parse (or None)
             
         Returns:
             List of entities with labels
         """
-        if not self.nlp:
+        if doc is None:
             return []
         
         try:
-            doc = self.nlp(text[:1000000])  # Limit text length
-            entities = []
-            
-            for ent in doc.ents:
-                entities.append({
-                    'text': ent.text,
-                    'label': ent.label_
-                })
+            with span('entities'):
+                entities = []
+                
+                for ent in doc.ents:
+                    entities.append({
+                        'text': ent.text,
+                        'label': ent.label_
+                    })
             
             return entities
         except Exception as e:
             print(f"Error extracting entities: {e}")
             return []
     
-    def _extract_noun_phrases(self, text: str) -> list:
+    def _extract_noun_phrases(self, doc) -> list:
         """
-        Extract noun phrases (key concepts)
+        Extract noun phrases (key concepts) from a parsed document
         
         Args:
-            text: Input text
+            doc: spaCy Doc from parse (or None)
             
         Returns:
             List of noun phrases
         """
-        if not self.nlp:
+        if doc is None:
             return []
         
         try:
-            doc = self.nlp(text[:1000000])  # Limit text length
-            noun_phrases = []
-            
-            for chunk in doc.noun_chunks:
-                # Filter out very short or very long phrases
-                if 2 <= len(chunk.text.split()) <= 4:
-                    noun_phrases.append(chunk.text.lower())
+            with span('noun_chunks'):
+                noun_phrases = []
+                
+                for chunk in doc.noun_chunks:
+                    # Filter out very short or very long phrases
+                    if 2 <= len(chunk.text.split()) <= 4:
+                        noun_phrases.append(chunk.text.lower())
             
             # Remove duplicates and return top phrases
             return list(set(noun_phrases))[:50]
@@ -151,6 +702,33 @@ class NLPAnalyzer:
             print(f"Error extracting noun phrases: {e}")
             return []
     
+    def _extract_skill_phrases(self, doc) -> list:
+        """
+        Candidate skill phrases: noun chunks of one to four words, stop words removed
+        
+        Args:
+            doc: spaCy Doc from parse (or None)
+            
+        Returns:
+            Distinct lowercased phrases in document order
+        """
+        if doc is None:
+            return []
+        
+        try:
+            with span('noun_chunks'):
+                phrases = {}
+                for chunk in doc.noun_chunks:
+                    words = [token.text.lower() for token in chunk if not token.is_stop]
+                    if 1 <= len(words) <= 4:
+                        phrases[' '.join(words)] = None
+                        if len(phrases) == MAX_SKILL_PHRASES:
+                            break
+            return list(phrases)
+        except Exception as e:
+            print(f"Error extracting skill phrases: {e}")
+            return []
+    
     def calculate_keyword_density(self, text: str, keywords: list) -> dict:
         """
         Calculate density of keywords in text
@@ -3,11 +3,22 @@ Resume Parser - Extract text and sections from resume files
 Supports PDF, DOCX, and TXT formats
 """
 
+import io
 import re
+import zipfile
 import PyPDF2
 import docx
 from typing import Dict, Optional
 
+from utils.processed_document import as_document
+
+# MIME types accepted as a hint when magic bytes are inconclusive
+MIME_TYPES = {
+    'application/pdf': 'pdf',
+    'application/vnd.openxmlformats-officedocument.wordprocessingml.document': 'docx',
+    'text/plain': 'txt'
+}
+
 class ResumeParser:
     """Parse resume files and extract structured information"""
     
@@ -34,45 +45,127 @@ class ResumeParser:
         Returns:
             Extracted text content
         """
-        file_extension = filepath.lower().split('.')[-1]
+        with open(filepath, 'rb') as file:
+            return self.extract_text_from_bytes(file.read())
+    
+    def extract_text_from_stream(self, stream, mime: Optional[str] = None) -> str:
+        """
+        Extract text from a binary file-like object
+        
+        Args:
+            stream: Readable binary stream (e.g. an uploaded file)
+            mime: MIME type hint, used only if magic bytes are inconclusive
+            
+        Returns:
+            Extracted text content
+        """
+        return self.extract_text_from_bytes(stream.read(), mime)
+    
+    def extract_text_from_bytes(self, data: bytes, mime: Optional[str] = None) -> str:
+        """
+        Extract text from in-memory file contents
+        
+        Args:
+            data: Raw file contents
+            mime: MIME type hint, used only if magic bytes are inconclusive
+            
+        Returns:
+            Extracted text content
+        """
+        return self.extract_document(data, mime)['text']
+    
+    def extract_document(self, data: bytes, mime: Optional[str] = None) -> dict:
+        """
+        Extract text plus basic document facts from in-memory file contents
+        
+        Args:
+            data: Raw file contents
+            mime: MIME type hint, used only if magic bytes are inconclusive
+            
+        Returns:
+            Dictionary with text, file_type and pages (None unless PDF)
+        """
+        file_type = self.detect_file_type(data, mime)
+        pages = None
         
-        if file_extension == 'pdf':
-            return self._extract_from_pdf(filepath)
-        elif file_extension == 'docx':
-            return self._extract_from_docx(filepath)
-        elif file_extension == 'txt':
-            return self._extract_from_txt(filepath)
+        if file_type == 'pdf':
+            text, pages = self._extract_from_pdf(io.BytesIO(data), with_pages=True)
+        elif file_type == 'docx':
+            text = self._extract_from_docx(io.BytesIO(data))
         else:
-            raise ValueError(f"Unsupported file type: {file_extension}")
+            text = self._extract_from_txt(data)
+        
+        return {'text': text, 'file_type': file_type, 'pages': pages}
     
-    def _extract_from_pdf(self, filepath: str) -> str:
-        """Extract text from PDF file"""
+    def detect_file_type(self, data: bytes, mime: Optional[str] = None) -> str:
+        """
+        Detect file type from magic bytes
+        
+        Args:
+            data: Raw file contents
+            mime: MIME type hint, used only if magic bytes are inconclusive
+            
+        Returns:
+            'pdf', 'docx' or 'txt'
+        """
+        # PDF header must open the file, after at most a BOM and whitespace
+        # (a text file that merely mentions %PDF- is still text)
+        head = data[:1024]
+        if head.startswith(b'\xef\xbb\xbf'):
+            head = head[3:]
+        if head.lstrip().startswith(b'%PDF-'):
+            return 'pdf'
+        
+        # DOCX is a ZIP container with a word/ part
+        if data.startswith(b'PK\x03\x04'):
+            try:
+                with zipfile.ZipFile(io.BytesIO(data)) as archive:
+                    if any(name.startswith('word/') for name in archive.namelist()):
+                        return 'docx'
+            except zipfile.BadZipFile:
+                pass
+            raise ValueError("Unsupported file type: zip archive")
+        
+        hint = MIME_TYPES.get((mime or '').split(';')[0].strip().lower())
+        if hint in ('pdf', 'docx'):
+            return hint
+        
+        # Plain text has no NUL bytes
+        if b'\x00' not in data[:1024]:
+            return 'txt'
+        
+        raise ValueError("Unsupported file type: unrecognized binary content")
+    
+    def _extract_from_pdf(self, source, with_pages: bool = False):
+        """Extract text (and optionally page count) from PDF file path or binary stream"""
         text = ""
         try:
-            with open(filepath, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                for page in pdf_reader.pages:
-                    text += page.extract_text() + "\n"
+            pdf_reader = PyPDF2.PdfReader(source)
+            for page in pdf_reader.pages:
+                text += page.extract_text() + "\n"
+            pages = len(pdf_reader.pages)
         except Exception as e:
             raise Exception(f"Error reading PDF: {str(e)}")
         
+        if with_pages:
+            return text.strip(), pages
         return text.strip()
     
-    def _extract_from_docx(self, filepath: str) -> str:
-        """Extract text from DOCX file"""
+    def _extract_from_docx(self, source) -> str:
+        """Extract text from DOCX file path or binary stream"""
         try:
-            doc = docx.Document(filepath)
+            doc = docx.Document(source)
             text = "\n".join([paragraph.text for paragraph in doc.paragraphs])
         except Exception as e:
             raise Exception(f"Error reading DOCX: {str(e)}")
         
         return text.strip()
     
-    def _extract_from_txt(self, filepath: str) -> str:
-        """Extract text from TXT file"""
+    def _extract_from_txt(self, data: bytes) -> str:
+        """Extract text from TXT file contents"""
         try:
-            with open(filepath, 'r', encoding='utf-8') as file:
-                text = file.read()
+            # Match universal newline handling of text-mode reads
+            text = data.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
         except Exception as e:
             raise Exception(f"Error reading TXT: {str(e)}")
         
@@ -83,17 +176,18 @@ class ResumeParser:
         Identify which sections are present in resume
         
         Args:
-            text: Resume text
+            text: Resume text or ProcessedDocument
             
         Returns:
             Dictionary of section names and presence (True/False)
         """
-        text_lower = text.lower()
+        text_lower = as_document(text).lower
         sections = {}
         
         for section_name, pattern in self.section_patterns.items():
-            # Check if section heading exists
-            sections[section_name] = bool(re.search(pattern, text_lower, re.IGNORECASE))
+            # Check if section heading exists (patterns are lowercase, so
+            # searching the lowercased text needs no IGNORECASE)
+            sections[section_name] = bool(re.search(pattern, text_lower))
         
         return sections
     
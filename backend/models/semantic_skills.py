@@ -0,0 +1,193 @@
+"""
+Semantic Skills - Match candidate phrases to the taxonomy by embedding similarity
+The taxonomy embedding matrix is computed once per taxonomy and model, then persisted
+"""
+
+import fcntl
+import os
+import re
+import threading
+
+import numpy as np
+
+from utils.chunking import normalize
+from utils.embedding_cache import EmbeddingCache
+from utils.metrics import span
+
+class SemanticSkillMatcher:
+    """
+    Find taxonomy skills that phrases paraphrase ("react.js" -> react,
+    "statistical modeling" -> statistics)
+
+    Every skill name and alias is embedded once into a unit-length matrix,
+    stored as .npy under directory and memory-mapped by all workers. A
+    request encodes its phrases in one batch; one matrix product gives each
+    phrase's most similar skill, kept if it reaches the threshold.
+
+    Phrases are mostly one-off, so they are cached in a small in-memory LRU
+    of their own rather than the analyzer's embedding cache, where they
+    would evict resume and job embeddings and grow the on-disk store.
+    """
+
+    def __init__(self, nlp_analyzer, skill_extractor, threshold: float = 0.75,
+                 directory: str = 'skill_embeddings', phrase_cache_size: int = 2048):
+        """
+        Args:
+            nlp_analyzer: NLPAnalyzer whose sentence model embeds phrases and skills
+            skill_extractor: SkillExtractor holding the taxonomy
+            threshold: Minimum cosine similarity for a match
+            directory: Where taxonomy matrices are persisted (None: memory only)
+            phrase_cache_size: Phrase embeddings kept in memory (0 disables)
+        """
+        self.nlp_analyzer = nlp_analyzer
+        self.skill_extractor = skill_extractor
+        self.threshold = threshold
+        self.directory = directory
+        self.phrase_cache = (
+            EmbeddingCache(max_entries=phrase_cache_size) if phrase_cache_size > 0 else None
+        )
+        self.lock = threading.Lock()
+        self.loaded = None  # (taxonomy version, model key, matrix, row skill IDs, index)
+
+    def config_version(self) -> str:
+        """Return a version string for the matching configuration"""
+        return f"semantic-{self.threshold}"
+
+    def _matrix_path(self, version: str) -> str:
+        """Matrix file for a taxonomy version and the current embedding model"""
+        slug = re.sub(r'[^A-Za-z0-9_.-]+', '_', self.nlp_analyzer.embedding_key)
+        return os.path.join(self.directory, f'{version}-{slug}.npy')
+
+    def taxonomy_matrix(self, build: bool = True) -> tuple:
+        """
+        Embeddings of every skill name and alias of the loaded taxonomy
+
+        Args:
+            build: Encode the names if no persisted matrix exists (False only maps one)
+
+        Returns:
+            (matrix, row skill IDs, index); matrix is None if the model is
+            unavailable, or if build is False and nothing is persisted
+        """
+        index = self.skill_extractor.index
+        model_key = self.nlp_analyzer.embedding_key
+        loaded = self.loaded
+        if loaded is not None and loaded[0] == index.version and loaded[1] == model_key:
+            return loaded[2], loaded[3], loaded[4]
+
+        with self.lock:
+            loaded = self.loaded
+            if loaded is not None and loaded[0] == index.version and loaded[1] == model_key:
+                return loaded[2], loaded[3], loaded[4]
+
+            names = [index.skill_names[i] for i in range(index.skill_count)]
+            names += [index.alias_names[i] for i in range(index.alias_count)]
+            row_skills = np.concatenate([
+                np.arange(index.skill_count, dtype=np.uint32), index.alias_skills
+            ])
+
+            if self.directory:
+                matrix = self._load_or_build(self._matrix_path(index.version), names, build)
+            else:
+                matrix = self._build(names) if build else None
+            if matrix is None:
+                return None, row_skills, index
+
+            self.loaded = (index.version, model_key, matrix, row_skills, index)
+            return matrix, row_skills, index
+
+    def _build(self, names: list):
+        """Encode taxonomy names (bypassing the embedding cache), unit length"""
+        with span('skill_embeddings'):
+            vectors = self.nlp_analyzer.encode(names, use_cache=False)
+        if vectors is None:
+            return None
+        return normalize(vectors)
+
+    def _load_or_build(self, path: str, names: list, build: bool = True):
+        """Memory-map a persisted matrix, building it under a cross-process lock"""
+        if not build:
+            if os.path.exists(path):
+                matrix = np.load(path, mmap_mode='r')
+                if matrix.shape[0] == len(names):
+                    return matrix
+            return None
+
+        os.makedirs(self.directory, exist_ok=True)
+        with open(f'{path}.lock', 'w') as lock_file:
+            # One worker encodes the taxonomy; the others wait and map its file
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                if os.path.exists(path):
+                    matrix = np.load(path, mmap_mode='r')
+                    if matrix.shape[0] == len(names):
+                        return matrix
+
+                matrix = self._build(names)
+                if matrix is None:
+                    return None
+
+                temp_path = f'{path}.{os.getpid()}.tmp'
+                with open(temp_path, 'wb') as file:
+                    np.save(file, matrix.astype(np.float32))
+                os.replace(temp_path, path)
+                print(f"✓ Embedded {len(names)} skill names: {path}")
+                return np.load(path, mmap_mode='r')
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def match_many(self, phrase_lists: list) -> list:
+        """
+        Semantic skill matches for several documents' phrases
+
+        All distinct phrases are encoded in one batch and scored against the
+        taxonomy with one matrix product.
+
+        Args:
+            phrase_lists: Candidate phrases per document
+
+        Returns:
+            Per document, {skill: {'phrase': best phrase, 'similarity': cosine}}
+        """
+        results = [{} for _ in phrase_lists]
+        phrases = list(dict.fromkeys(phrase for phrases in phrase_lists for phrase in phrases))
+        if not phrases:
+            return results
+
+        matrix, row_skills, index = self.taxonomy_matrix()
+        if matrix is None or not len(matrix):
+            return results
+        vectors = self.nlp_analyzer.encode(
+            phrases, use_cache=self.phrase_cache is not None, cache=self.phrase_cache
+        )
+        if vectors is None:
+            return results
+
+        with span('skill_similarity'):
+            scores = normalize(vectors) @ np.asarray(matrix).T  # phrases x taxonomy rows
+            best_rows = scores.argmax(axis=1)
+            best_scores = scores[np.arange(len(phrases)), best_rows]
+
+        best = {}
+        for phrase, row, score in zip(phrases, best_rows, best_scores):
+            if score >= self.threshold:
+                best[phrase] = (index.skill_names[int(row_skills[row])], float(score))
+
+        for phrase_list, matches in zip(phrase_lists, results):
+            for phrase in phrase_list:
+                if phrase not in best:
+                    continue
+                skill, score = best[phrase]
+                if skill not in matches or score > matches[skill]['similarity']:
+                    matches[skill] = {'phrase': phrase, 'similarity': score}
+        return results
+
+    def warm_up(self, build: bool = True):
+        """
+        Load or build the taxonomy matrix ahead of the first request
+
+        Args:
+            build: Encode the taxonomy if no matrix is persisted; a pre-fork
+                master passes False so it runs no inference
+        """
+        self.taxonomy_matrix(build)
@@ -0,0 +1,47 @@
+"""
+Skill Index Build - Compile a JSON skills taxonomy into a memory-mapped index
+The index is replaced atomically; running workers pick it up without a restart
+
+Usage (from backend/):
+    python -m scripts.build_skill_index --export-builtin skills.json
+    python -m scripts.build_skill_index --taxonomy skills.json --output skills.json.idx
+"""
+
+import argparse
+import json
+import sys
+
+from utils.skill_extraction import SkillExtractor, DEFAULT_ALIASES
+from utils.skill_index import build_index
+
+def main():
+    parser = argparse.ArgumentParser(description='Compile a skills taxonomy into an index')
+    parser.add_argument('--taxonomy', help='JSON taxonomy: {"categories": {...}, "aliases": {...}}')
+    parser.add_argument('--output', help='Index path (default: <taxonomy>.idx)')
+    parser.add_argument('--export-builtin', metavar='PATH',
+                        help='Write the built-in skills database as a taxonomy file and exit')
+    args = parser.parse_args()
+
+    if args.export_builtin:
+        taxonomy = {
+            'categories': SkillExtractor().get_skills_database(),
+            'aliases': DEFAULT_ALIASES
+        }
+        with open(args.export_builtin, 'w', encoding='utf-8') as file:
+            json.dump(taxonomy, file, indent=2)
+            file.write('\n')
+        print(f"✓ Wrote {args.export_builtin}")
+        return
+
+    if not args.taxonomy:
+        parser.error('--taxonomy or --export-builtin is required')
+
+    output = args.output or f'{args.taxonomy}.idx'
+    meta = build_index(args.taxonomy, output)
+    print(f"✓ Compiled {output}: {meta['skills']} skills, {meta['categories']} categories, "
+          f"{meta['aliases']} aliases")
+    json.dump(meta, sys.stdout, indent=2)
+    print()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+"""
+ONNX Export - Offline conversion of the sentence transformer for ONNX Runtime
+Writes model.onnx, a dynamically int8-quantized model_int8.onnx and the tokenizer
+
+Usage (from backend/):
+    python -m scripts.export_onnx --output onnx/all-MiniLM-L6-v2
+    python -m benchmarks.embedding_backends --onnx-dir onnx/all-MiniLM-L6-v2
+
+Needs torch, sentence-transformers and onnxruntime; serving the exported
+model needs only onnxruntime and the tokenizer.
+"""
+
+import argparse
+import json
+import os
+import sys
+
+from models.embedding_backend import ONNX_MODEL_FILE, ONNX_INT8_MODEL_FILE, EXPORT_META_FILE
+
+def export(model_name: str, output_dir: str, opset: int = 14, quantize: bool = True) -> dict:
+    """
+    Export a mean-pooling sentence transformer to ONNX
+
+    Only the transformer runs in ONNX; pooling and normalization are applied
+    by OnnxEmbeddingBackend as recorded in export.json.
+
+    Args:
+        model_name: Sentence transformer name
+        output_dir: Directory for the exported files
+        opset: ONNX opset version
+        quantize: Also write the int8 model
+
+    Returns:
+        Export metadata written to export.json
+    """
+    import torch
+    from sentence_transformers import SentenceTransformer
+
+    model = SentenceTransformer(model_name, device='cpu')
+    transformer = model[0]
+    pooling = model[1]
+    if not getattr(pooling, 'pooling_mode_mean_tokens', False):
+        raise ValueError(f"{model_name} does not use mean pooling; only mean pooling is supported")
+
+    os.makedirs(output_dir, exist_ok=True)
+    auto_model = transformer.auto_model.eval()
+    auto_model.config.return_dict = False
+    tokenizer = transformer.tokenizer
+
+    sample = tokenizer(['Senior software engineer with Python experience.'], return_tensors='pt')
+    input_names = [name for name in ('input_ids', 'attention_mask', 'token_type_ids') if name in sample]
+    dynamic_axes = {name: {0: 'batch', 1: 'sequence'} for name in input_names}
+    dynamic_axes['last_hidden_state'] = {0: 'batch', 1: 'sequence'}
+
+    model_path = os.path.join(output_dir, ONNX_MODEL_FILE)
+    with torch.no_grad():
+        torch.onnx.export(
+            auto_model,
+            tuple(sample[name] for name in input_names),
+            model_path,
+            input_names=input_names,
+            output_names=['last_hidden_state'],
+            dynamic_axes=dynamic_axes,
+            opset_version=opset,
+            do_constant_folding=True
+        )
+    print(f"✓ Exported {model_path}")
+
+    if quantize:
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+
+        int8_path = os.path.join(output_dir, ONNX_INT8_MODEL_FILE)
+        quantize_dynamic(model_path, int8_path, weight_type=QuantType.QInt8)
+        print(f"✓ Quantized {int8_path}")
+
+    tokenizer.save_pretrained(output_dir)
+
+    meta = {
+        'model': model_name,
+        'dimension': model.get_sentence_embedding_dimension(),
+        'max_seq_length': model.max_seq_length,
+        'normalize': any(type(module).__name__ == 'Normalize' for module in model),
+        'inputs': input_names,
+        'opset': opset,
+        'quantized': quantize
+    }
+    with open(os.path.join(output_dir, EXPORT_META_FILE), 'w') as file:
+        json.dump(meta, file, indent=2)
+
+    return meta
+
+def main():
+    parser = argparse.ArgumentParser(description='Export the sentence transformer to ONNX')
+    parser.add_argument('--model', default='all-MiniLM-L6-v2', help='Sentence transformer name')
+    parser.add_argument('--output', default='onnx/all-MiniLM-L6-v2', help='Output directory')
+    parser.add_argument('--opset', type=int, default=14, help='ONNX opset version')
+    parser.add_argument('--no-quantize', action='store_true', help='Skip the int8 model')
+    args = parser.parse_args()
+
+    meta = export(args.model, args.output, args.opset, quantize=not args.no_quantize)
+    json.dump(meta, sys.stdout, indent=2)
+    print()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,148 @@
+"""
+Production Server - Pre-fork serving with models shared copy-on-write
+Loads all models once in the gunicorn master, then forks the workers.
+The master also runs the one analysis job worker pool for all web workers.
+
+Usage:
+    python serve.py --workers 4 --bind 0.0.0.0:5000
+"""
+
+import argparse
+import gc
+import os
+import threading
+import time
+
+from gunicorn.app.base import BaseApplication
+
+from utils.memory import process_memory
+
+class PreforkApplication(BaseApplication):
+    """Gunicorn application serving an already-imported Flask app"""
+
+    def __init__(self, application, options: dict):
+        self.application = application
+        self.options = options
+        super().__init__()
+
+    def load_config(self):
+        for key, value in self.options.items():
+            self.cfg.set(key, value)
+
+    def load(self):
+        return self.application
+
+def make_post_fork(pipeline, torch_threads: int):
+    """Build the per-worker setup hook"""
+
+    def post_fork(server, worker):
+        # Each worker gets its own small torch thread pool instead of
+        # every worker fighting over all cores
+        try:
+            import torch
+            torch.set_num_threads(torch_threads)
+        except ImportError:
+            pass
+
+        # First inference allocates per-process buffers; do it before serving.
+        # A skill embedding matrix the master could only map if persisted is
+        # built here (by one worker; the others wait and map its file)
+        pipeline.warm_up(dummy_inference=True)
+        server.log.info(f"Worker {worker.pid} ready: {process_memory()}")
+
+    return post_fork
+
+def make_when_ready(interval: float, job_worker_pool=None):
+    """Build the master hook that starts the job workers and reports worker memory"""
+
+    def when_ready(server):
+        if job_worker_pool is not None:
+            # One pool for the whole server, owned by the master
+            job_worker_pool.start()
+
+        if interval <= 0:
+            return
+
+        def report():
+            while True:
+                time.sleep(interval)
+                master = process_memory()
+                workers = [process_memory(pid) for pid in list(server.WORKERS)]
+                workers = [usage for usage in workers if usage]
+                total_uss = sum(usage['uss_mb'] for usage in workers)
+                total_pss = master.get('pss_mb', 0) + sum(usage['pss_mb'] for usage in workers)
+                server.log.info(
+                    f"Memory: master={master} workers={workers} "
+                    f"total_worker_uss_mb={round(total_uss, 1)} total_pss_mb={round(total_pss, 1)}"
+                )
+
+        threading.Thread(target=report, name='memory-report', daemon=True).start()
+
+    return when_ready
+
+def make_on_exit(job_worker_pool=None):
+    """Build the master hook that stops the job workers"""
+
+    def on_exit(server):
+        if job_worker_pool is not None:
+            job_worker_pool.stop()
+
+    return on_exit
+
+def main():
+    parser = argparse.ArgumentParser(description='Run the ATS Resume Analyzer with pre-forked workers')
+    parser.add_argument('--bind', default=os.environ.get('BIND', f"{os.environ.get('HOST', '0.0.0.0')}:{os.environ.get('PORT', '5000')}"))
+    parser.add_argument('--workers', type=int, default=int(os.environ.get('WEB_WORKERS', 2)))
+    parser.add_argument('--threads', type=int, default=int(os.environ.get('WEB_THREADS', 4)),
+                        help='Request threads per worker')
+    parser.add_argument('--torch-threads', type=int, default=int(os.environ.get('TORCH_THREADS', 1)),
+                        help='Torch intra-op threads per worker')
+    parser.add_argument('--timeout', type=int, default=120)
+    parser.add_argument('--memory-report-interval', type=float, default=60,
+                        help='Seconds between worker memory reports (0 disables)')
+    parser.add_argument('--job-workers', type=int, default=None,
+                        help='Analysis job worker processes (default: JOB_WORKERS; 0 if they run as a separate service)')
+    args = parser.parse_args()
+
+    # Thread pools read these when torch/BLAS first load, which happens below
+    for variable in ('OMP_NUM_THREADS', 'MKL_NUM_THREADS', 'OPENBLAS_NUM_THREADS'):
+        os.environ.setdefault(variable, str(args.torch_threads))
+
+    from app import app, pipeline
+    from utils.job_queue import JobWorkerPool
+
+    # Web workers must not each start their own job worker pool
+    app.config['JOB_WORKERS_AUTOSTART'] = False
+    job_workers = app.config['JOB_WORKERS'] if args.job_workers is None else args.job_workers
+    job_worker_pool = None
+    if job_workers > 0:
+        job_worker_pool = JobWorkerPool(app.config['JOB_QUEUE_DB'], num_workers=job_workers)
+
+    # Load every model in the master so workers inherit them copy-on-write.
+    # No torch inference here (OpenMP thread pools do not survive fork), so
+    # the skill embedding matrix is only mapped if already persisted.
+    start = time.perf_counter()
+    pipeline.warm_up(dummy_inference=False)
+    print(f"✓ Models loaded in master in {time.perf_counter() - start:.1f}s: {process_memory()}")
+
+    # Move everything loaded so far out of the collector's reach, so GC passes
+    # in workers do not write to (and un-share) the pages holding these objects
+    gc.collect()
+    gc.freeze()
+
+    options = {
+        'bind': args.bind,
+        'workers': args.workers,
+        'threads': args.threads,
+        'worker_class': 'gthread',
+        'timeout': args.timeout,
+        'preload_app': True,
+        'post_fork': make_post_fork(pipeline, args.torch_threads),
+        'when_ready': make_when_ready(args.memory_report_interval, job_worker_pool),
+        'on_exit': make_on_exit(job_worker_pool)
+    }
+
+    PreforkApplication(app, options).run()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,10 @@
+"""
+Test setup: import backend modules the way the app does (run from backend/)
+"""
+
+import os
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
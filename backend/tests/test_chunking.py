@@ -0,0 +1,87 @@
+"""
+Chunking tests - section headings, word windows and chunk pooling
+"""
+
+import numpy as np
+import pytest
+
+from utils.chunking import (
+    heading_section, normalize, pool_similarity, section_chunks, split_sections, window_words
+)
+
+JOB_DESCRIPTION = (
+    "About the role\n"
+    "Build data tools for analysts.\n"
+    "Requirements\n"
+    "- Strong Python skills\n"
+    "- 5+ years experience with Spark\n"
+    "- Kubernetes knowledge\n"
+    "What we offer\n"
+    "Remote work and learning budget\n"
+)
+
+@pytest.mark.parametrize('line, section', [
+    ('Summary', 'summary'),
+    ('About the role', 'summary'),
+    ('Work Experience', 'experience'),
+    ('TECHNICAL SKILLS:', 'skills'),
+    ('## Skills & Certifications', 'skills'),
+    ('Requirements', 'requirements'),
+    ('What we offer', 'benefits')
+])
+def test_heading_lines(line, section):
+    assert heading_section(line) == section
+
+@pytest.mark.parametrize('line', [
+    '- Strong Python skills',
+    '- 5+ years experience with Spark',
+    'Education.',
+    'Experience in education technology',
+    ''
+])
+def test_lines_with_heading_words_are_not_headings(line):
+    assert heading_section(line) is None
+
+def test_bullets_with_heading_words_stay_in_their_section():
+    sections = dict(split_sections(JOB_DESCRIPTION))
+
+    assert list(sections) == ['summary', 'requirements', 'benefits']
+    assert 'Strong Python skills' in sections['requirements']
+    assert '5+ years experience with Spark' in sections['requirements']
+    assert 'Kubernetes knowledge' in sections['requirements']
+
+def test_text_before_first_heading_is_header():
+    assert split_sections("Jane Doe\njane@example.com\nSkills\nPython") == [
+        ('header', 'Jane Doe\njane@example.com'), ('skills', 'Python')
+    ]
+
+def test_section_chunks_keep_every_requirement():
+    chunks = dict(section_chunks(JOB_DESCRIPTION))
+
+    assert 'python' in chunks['requirements']
+    assert 'spark' in chunks['requirements']
+    assert 'kubernetes' in chunks['requirements']
+
+def test_window_words_overlap():
+    words = ' '.join(str(i) for i in range(10))
+
+    assert window_words(words, 4, 2) == ['0 1 2 3', '2 3 4 5', '4 5 6 7', '6 7 8 9']
+    assert window_words('a b', 4, 2) == ['a b']
+    assert window_words('', 4, 2) == []
+
+def test_windows_never_cross_sections():
+    text = "Skills\n" + "python " * 10 + "\nEducation\n" + "degree " * 10
+    for section_name, window in section_chunks(text, size=4, overlap=1):
+        expected = 'python' if section_name == 'skills' else 'degree'
+        assert set(window.split()) == {expected}
+
+def test_pool_similarity_modes():
+    query = normalize(np.array([[1.0, 0.0], [0.0, 1.0]]))
+    document = normalize(np.array([[1.0, 0.0]]))
+
+    assert pool_similarity(query, document, 'max_sim') == pytest.approx(1.0)
+    assert pool_similarity(query, document, 'topk_mean', top_k=2) == pytest.approx(0.5)
+    assert pool_similarity(query, document, 'mean') == pytest.approx(np.sqrt(0.5))
+    assert pool_similarity(query[:0], document) == 0.0
+    with pytest.raises(ValueError):
+        pool_similarity(query, document, 'median')
@@ -0,0 +1,205 @@
+"""
+Embedding backend tests - ONNX backend output and parity with the torch reference
+The ONNX backend is checked offline against a tiny exported model vendored in
+fixtures/onnx-tiny (needs onnxruntime and transformers; regenerate it with
+python -m tests.test_embedding_backends, which also needs onnx).
+Parity with all-MiniLM-L6-v2 is skipped unless sentence-transformers and an
+exported model are present (python -m scripts.export_onnx --output
+onnx/all-MiniLM-L6-v2, or set EMBEDDING_ONNX_DIR)
+"""
+
+import functools
+import json
+import os
+
+import numpy as np
+import pytest
+
+from benchmarks.embedding_backends import DEFAULT_MIN_COSINE, parity, parity_corpus
+from models.analysis_pipeline import AnalysisPipeline
+from models.embedding_backend import (
+    EXPORT_META_FILE, ONNX_INT8_MODEL_FILE, ONNX_MODEL_FILE, create_embedding_backend
+)
+from models.nlp_analyzer import NLPAnalyzer
+
+MODEL_NAME = 'all-MiniLM-L6-v2'
+ONNX_DIR = os.environ.get(
+    'EMBEDDING_ONNX_DIR',
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'onnx', MODEL_NAME)
+)
+MODEL_FILES = {'onnx': ONNX_MODEL_FILE, 'onnx-int8': ONNX_INT8_MODEL_FILE}
+
+# Tiny model exported like scripts/export_onnx.py does: a BERT-style graph
+# (token and token-type embeddings, a dense layer) with a word-level tokenizer
+TINY_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'onnx-tiny')
+TINY_EXPECTED_FILE = 'expected.json'
+TINY_MAX_SEQ_LENGTH = 16
+TINY_DIMENSION = 8
+
+# Texts of different lengths (one truncated to max_seq_length, one with
+# unknown words) so batches are padded and reordered
+TINY_TEXTS = (
+    'senior python engineer',
+    'python engineer with docker and kubernetes experience',
+    'data scientist',
+    'senior data engineer with python sql spark airflow docker kubernetes aws experience '
+    'building pipelines for analytics teams',
+    'rust and haskell developer',
+    'kubernetes'
+)
+
+@functools.lru_cache(maxsize=None)
+def corpus() -> tuple:
+    """Small fixed corpus: whole documents plus their section chunks"""
+    return tuple(parity_corpus(documents=2))
+
+@functools.lru_cache(maxsize=None)
+def reference_embeddings():
+    """Torch embeddings of the corpus, computed once for both backends"""
+    pytest.importorskip('sentence_transformers')
+    return create_embedding_backend('torch', MODEL_NAME).encode(list(corpus()))
+
+def tiny_expected() -> dict:
+    """Embeddings of TINY_TEXTS computed with numpy when the fixture was built"""
+    with open(os.path.join(TINY_DIR, TINY_EXPECTED_FILE)) as file:
+        expected = json.load(file)
+    return dict(expected, embeddings=np.asarray(expected['embeddings'], dtype=np.float32))
+
+@pytest.mark.parametrize('backend', ['onnx', 'onnx-int8'])
+@pytest.mark.parametrize('batch_size', [1, 2, 32])
+def test_onnx_backend_matches_vendored_embeddings(backend, batch_size):
+    pytest.importorskip('onnxruntime')
+    pytest.importorskip('transformers')
+
+    expected = tiny_expected()
+    model = create_embedding_backend(backend, MODEL_NAME, TINY_DIR)
+    embeddings = model.encode(list(TINY_TEXTS), batch_size=batch_size)
+
+    assert list(TINY_TEXTS) == expected['texts']
+    assert embeddings.dtype == np.float32
+    assert embeddings.shape == (len(TINY_TEXTS), TINY_DIMENSION)
+    np.testing.assert_allclose(np.linalg.norm(embeddings, axis=1), 1.0, atol=1e-5)
+    if backend == 'onnx':
+        np.testing.assert_allclose(embeddings, expected['embeddings'], atol=1e-5)
+    assert parity(embeddings, expected['embeddings'])['min_cosine'] >= DEFAULT_MIN_COSINE[backend]
+
+def test_onnx_backend_encodes_no_texts():
+    pytest.importorskip('onnxruntime')
+    pytest.importorskip('transformers')
+
+    embeddings = create_embedding_backend('onnx', MODEL_NAME, TINY_DIR).encode([])
+
+    assert embeddings.shape == (0, TINY_DIMENSION)
+
+@pytest.mark.parametrize('backend', ['onnx', 'onnx-int8'])
+def test_onnx_backend_matches_torch(backend):
+    pytest.importorskip('onnxruntime')
+    path = os.path.join(ONNX_DIR, MODEL_FILES[backend])
+    if not os.path.exists(path):
+        pytest.skip(f"{path} not exported")
+
+    reference = reference_embeddings()
+    embeddings = create_embedding_backend(backend, MODEL_NAME, ONNX_DIR).encode(list(corpus()))
+
+    assert embeddings.shape == reference.shape
+    assert parity(embeddings, reference)['min_cosine'] >= DEFAULT_MIN_COSINE[backend]
+
+def test_config_version_changes_with_backend():
+    analyzers = [NLPAnalyzer(embedding_backend=backend, onnx_dir=ONNX_DIR)
+                 for backend in ('torch', 'onnx', 'onnx-int8')]
+
+    assert len({analyzer.config_version() for analyzer in analyzers}) == 3
+    assert len({analyzer.embedding_key for analyzer in analyzers}) == 3
+    assert len({AnalysisPipeline(nlp_analyzer=analyzer).config_version()
+                for analyzer in analyzers}) == 3
+
+def build_tiny_fixture(seed: int = 0):
+    """Write the tiny model, its int8 quantization, tokenizer and expected embeddings to TINY_DIR"""
+    import onnx
+    from onnx import TensorProto, helper, numpy_helper
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+    from tokenizers import Tokenizer, models, pre_tokenizers, processors
+
+    os.makedirs(TINY_DIR, exist_ok=True)
+    rng = np.random.default_rng(seed)
+
+    # Word-level vocabulary of the texts, less a few words left unknown
+    special = ['[PAD]', '[UNK]', '[CLS]', '[SEP]']
+    words = sorted({word for text in TINY_TEXTS for word in text.split()} - {'rust', 'haskell', 'developer'})
+    vocab = {token: i for i, token in enumerate(special + words)}
+    tokenizer = Tokenizer(models.WordLevel(vocab, unk_token='[UNK]'))
+    tokenizer.pre_tokenizer = pre_tokenizers.Whitespace()
+    tokenizer.post_processor = processors.TemplateProcessing(
+        single='[CLS] $A [SEP]', special_tokens=[('[CLS]', vocab['[CLS]']), ('[SEP]', vocab['[SEP]'])]
+    )
+    tokenizer.save(os.path.join(TINY_DIR, 'tokenizer.json'))
+    with open(os.path.join(TINY_DIR, 'tokenizer_config.json'), 'w') as file:
+        json.dump({
+            'tokenizer_class': 'PreTrainedTokenizerFast',
+            'model_input_names': ['input_ids', 'token_type_ids', 'attention_mask'],
+            'model_max_length': TINY_MAX_SEQ_LENGTH,
+            'unk_token': '[UNK]',
+            'pad_token': '[PAD]',
+            'cls_token': '[CLS]',
+            'sep_token': '[SEP]'
+        }, file, indent=2)
+
+    # last_hidden_state = tanh((token_embedding[input_ids] + type_embedding[token_type_ids]) @ dense)
+    token_embedding = rng.normal(size=(len(vocab), TINY_DIMENSION)).astype(np.float32)
+    type_embedding = rng.normal(scale=0.1, size=(2, TINY_DIMENSION)).astype(np.float32)
+    dense = rng.normal(scale=0.5, size=(TINY_DIMENSION, TINY_DIMENSION)).astype(np.float32)
+    inputs = [
+        helper.make_tensor_value_info(name, TensorProto.INT64, ['batch', 'sequence'])
+        for name in ('input_ids', 'attention_mask', 'token_type_ids')
+    ]
+    graph = helper.make_graph(
+        [
+            helper.make_node('Gather', ['token_embedding', 'input_ids'], ['tokens']),
+            helper.make_node('Gather', ['type_embedding', 'token_type_ids'], ['types']),
+            helper.make_node('Add', ['tokens', 'types'], ['embedded']),
+            helper.make_node('MatMul', ['embedded', 'dense'], ['projected']),
+            helper.make_node('Tanh', ['projected'], ['last_hidden_state'])
+        ],
+        'tiny_encoder',
+        inputs,
+        [helper.make_tensor_value_info(
+            'last_hidden_state', TensorProto.FLOAT, ['batch', 'sequence', TINY_DIMENSION]
+        )],
+        initializer=[
+            numpy_helper.from_array(token_embedding, 'token_embedding'),
+            numpy_helper.from_array(type_embedding, 'type_embedding'),
+            numpy_helper.from_array(dense, 'dense')
+        ]
+    )
+    model = helper.make_model(graph, opset_imports=[helper.make_opsetid('', 14)])
+    model.ir_version = 8
+    onnx.checker.check_model(model)
+    model_path = os.path.join(TINY_DIR, ONNX_MODEL_FILE)
+    onnx.save(model, model_path)
+    quantize_dynamic(model_path, os.path.join(TINY_DIR, ONNX_INT8_MODEL_FILE), weight_type=QuantType.QInt8)
+
+    with open(os.path.join(TINY_DIR, EXPORT_META_FILE), 'w') as file:
+        json.dump({
+            'model': 'tiny-test-encoder',
+            'dimension': TINY_DIMENSION,
+            'max_seq_length': TINY_MAX_SEQ_LENGTH,
+            'normalize': True,
+            'inputs': [item.name for item in inputs],
+            'opset': 14,
+            'quantized': True
+        }, file, indent=2)
+
+    # Reference: sentence-transformers mean pooling over each text's own tokens
+    # (no padding), then L2 normalization
+    embeddings = []
+    for text in TINY_TEXTS:
+        ids = tokenizer.encode(text).ids
+        ids = ids[:TINY_MAX_SEQ_LENGTH - 1] + ids[-1:] if len(ids) > TINY_MAX_SEQ_LENGTH else ids
+        pooled = np.tanh((token_embedding[ids] + type_embedding[0]) @ dense).mean(axis=0)
+        embeddings.append((pooled / np.linalg.norm(pooled)).tolist())
+    with open(os.path.join(TINY_DIR, TINY_EXPECTED_FILE), 'w') as file:
+        json.dump({'texts': list(TINY_TEXTS), 'embeddings': embeddings}, file, indent=1)
+
+if __name__ == '__main__':
+    build_tiny_fixture()
+    print(f"✓ Wrote {TINY_DIR}")
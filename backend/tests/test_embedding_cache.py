@@ -0,0 +1,118 @@
+"""
+Embedding cache tests - LRU tier, shared on-disk store and crash recovery
+"""
+
+import os
+
+import numpy as np
+import pytest
+
+from utils.embedding_cache import KEY_BYTES, EmbeddingCache
+
+MODEL = 'test-model'
+
+def vectors(count: int, dimension: int = 4, seed: int = 0) -> np.ndarray:
+    return np.random.default_rng(seed).normal(size=(count, dimension)).astype(np.float32)
+
+def test_memory_tier_hits_and_evicts_least_recently_used():
+    cache = EmbeddingCache(max_entries=2)
+    a, b, c = vectors(3)
+    cache.put_many(MODEL, ['a', 'b'], [a, b])
+    cache.get_many(MODEL, ['a'])
+    cache.put_many(MODEL, ['c'], [c])
+
+    found = cache.get_many(MODEL, ['a', 'b', 'c'])
+
+    np.testing.assert_array_equal(found[0], a)
+    assert found[1] is None
+    np.testing.assert_array_equal(found[2], c)
+    stats = cache.stats()
+    assert (stats['memory_hits'], stats['misses'], stats['evictions']) == (3, 1, 1)
+    assert stats['memory_entries'] == 2
+
+def test_keys_normalize_whitespace_and_separate_models():
+    cache = EmbeddingCache()
+    cache.put_many(MODEL, ['senior  python\nengineer'], vectors(1))
+
+    assert cache.get_many(MODEL, [' senior python engineer '])[0] is not None
+    assert cache.get_many('other-model', ['senior python engineer'])[0] is None
+    assert EmbeddingCache.make_key(MODEL, 'a b') != EmbeddingCache.make_key(MODEL, 'ab')
+
+def test_disk_tier_is_shared_between_caches(tmp_path):
+    expected = vectors(3)
+    EmbeddingCache(str(tmp_path)).put_many(MODEL, ['a', 'b', 'c'], expected)
+
+    reader = EmbeddingCache(str(tmp_path))
+    found = reader.get_many(MODEL, ['c', 'a', 'missing'])
+
+    np.testing.assert_array_equal(found[0], expected[2])
+    np.testing.assert_array_equal(found[1], expected[0])
+    assert found[2] is None
+    stats = reader.stats()
+    assert (stats['disk_hits'], stats['misses']) == (2, 1)
+    assert stats['disk_entries'] == {MODEL: 3}
+    # Disk hits are promoted to the memory tier
+    reader.get_many(MODEL, ['a'])
+    assert reader.stats()['memory_hits'] == 1
+
+def test_reader_sees_vectors_appended_after_it_opened(tmp_path):
+    writer = EmbeddingCache(str(tmp_path))
+    reader = EmbeddingCache(str(tmp_path))
+    writer.put_many(MODEL, ['a'], vectors(1, seed=1))
+    assert reader.get_many(MODEL, ['a'])[0] is not None
+
+    later = vectors(1, seed=2)
+    writer.put_many(MODEL, ['b'], later)
+
+    np.testing.assert_array_equal(reader.get_many(MODEL, ['b'])[0], later[0])
+
+def test_known_keys_are_not_appended_again(tmp_path):
+    first = EmbeddingCache(str(tmp_path))
+    second = EmbeddingCache(str(tmp_path))
+    first.put_many(MODEL, ['a', 'b'], vectors(2))
+
+    second.put_many(MODEL, ['b', 'c', 'c'], vectors(3))
+
+    assert second.stats()['disk_entries'] == {MODEL: 3}
+
+def test_float16_store_keeps_its_dtype(tmp_path):
+    expected = vectors(2)
+    EmbeddingCache(str(tmp_path), dtype='float16').put_many(MODEL, ['a', 'b'], expected)
+
+    reader = EmbeddingCache(str(tmp_path), dtype='float32')
+    found = reader.get_many(MODEL, ['a', 'b'])
+
+    assert all(vector.dtype == np.float32 for vector in found)
+    np.testing.assert_allclose(np.stack(found), expected, atol=1e-2)
+    assert os.path.getsize(tmp_path / f'{MODEL}.vec') == expected.size * 2
+
+def test_partial_records_from_a_crashed_writer_are_dropped(tmp_path):
+    cache = EmbeddingCache(str(tmp_path))
+    first = vectors(2, seed=1)
+    cache.put_many(MODEL, ['a', 'b'], first)
+    # A writer died mid-append: half a row and half a key
+    with open(tmp_path / f'{MODEL}.vec', 'ab') as file:
+        file.write(b'\x01' * 6)
+    with open(tmp_path / f'{MODEL}.idx', 'ab') as file:
+        file.write(b'\x02' * (KEY_BYTES // 2))
+
+    later = vectors(1, seed=2)
+    EmbeddingCache(str(tmp_path)).put_many(MODEL, ['c'], later)
+
+    reader = EmbeddingCache(str(tmp_path))
+    found = reader.get_many(MODEL, ['a', 'b', 'c'])
+    np.testing.assert_array_equal(np.stack(found[:2]), first)
+    np.testing.assert_array_equal(found[2], later[0])
+    assert os.path.getsize(tmp_path / f'{MODEL}.vec') == 3 * 4 * 4
+    assert os.path.getsize(tmp_path / f'{MODEL}.idx') == 3 * KEY_BYTES
+
+def test_dimension_mismatch_is_rejected(tmp_path):
+    cache = EmbeddingCache(str(tmp_path))
+    cache.put_many(MODEL, ['a'], vectors(1, dimension=4))
+
+    with pytest.raises(ValueError):
+        cache.put_many(MODEL, ['b'], vectors(1, dimension=8))
+
+def test_unsupported_dtype_is_rejected():
+    with pytest.raises(ValueError):
+        EmbeddingCache(dtype='int8')
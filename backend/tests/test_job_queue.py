@@ -0,0 +1,119 @@
+"""
+Job queue tests - leases, requeueing and worker supervision
+"""
+
+import time
+
+import pytest
+
+from utils import job_queue
+from utils.job_queue import MAX_ATTEMPTS, JobQueue, JobWorkerPool
+
+@pytest.fixture
+def queue(tmp_path):
+    return JobQueue(str(tmp_path / 'jobs.db'), lease_seconds=60)
+
+def test_claim_in_submission_order(queue):
+    first = queue.submit('a.txt', b'a', 'job a')
+    second = queue.submit('b.txt', b'b', 'job b')
+
+    assert queue.claim()['job_id'] == first
+    assert queue.claim()['job_id'] == second
+    assert queue.claim() is None
+    assert queue.get(first)['status'] == 'running'
+
+def test_complete_and_fail(queue):
+    done = queue.submit('a.txt', b'a', 'job a')
+    failed = queue.submit('b.txt', b'b', 'job b')
+    queue.claim()
+    queue.claim()
+
+    queue.complete(done, {'ats_score': 80})
+    queue.fail(failed, 'bad file')
+
+    assert queue.get(done)['status'] == 'done'
+    assert queue.get(done)['result'] == {'ats_score': 80}
+    assert queue.get(failed)['status'] == 'failed'
+    assert queue.get(failed)['error'] == 'bad file'
+    assert queue.stats() == {'done': 1, 'failed': 1}
+
+def test_expired_lease_is_requeued(tmp_path):
+    queue = JobQueue(str(tmp_path / 'jobs.db'), lease_seconds=0.05)
+    job_id = queue.submit('a.txt', b'a', 'job a')
+    queue.claim()
+
+    assert queue.requeue_expired() == 0
+    time.sleep(0.1)
+    assert queue.requeue_expired() == 1
+    assert queue.get(job_id)['status'] == 'queued'
+    assert queue.claim()['job_id'] == job_id
+
+def test_renewed_lease_is_kept(tmp_path):
+    queue = JobQueue(str(tmp_path / 'jobs.db'), lease_seconds=0.2)
+    job_id = queue.submit('a.txt', b'a', 'job a')
+    queue.claim()
+
+    for _ in range(3):
+        time.sleep(0.1)
+        queue.renew(job_id)
+    assert queue.requeue_expired() == 0
+    assert queue.get(job_id)['status'] == 'running'
+
+def test_job_that_keeps_killing_workers_fails(queue):
+    job_id = queue.submit('a.txt', b'a', 'job a')
+    for _ in range(MAX_ATTEMPTS):
+        assert queue.claim()['job_id'] == job_id
+        queue.requeue_worker(job_queue.os.getpid())
+
+    assert queue.get(job_id)['status'] == 'failed'
+    assert queue.claim() is None
+
+def test_requeue_worker_only_touches_its_jobs(queue):
+    job_id = queue.submit('a.txt', b'a', 'job a')
+    queue.claim()
+
+    assert queue.requeue_worker(-1) == 0
+    assert queue.requeue_worker(job_queue.os.getpid()) == 1
+    assert queue.get(job_id)['status'] == 'queued'
+
+class FakeProcess:
+    """Popen stand-in"""
+
+    pids = iter(range(100000, 200000))
+
+    def __init__(self):
+        self.pid = next(self.pids)
+        self.returncode = None
+
+    def poll(self):
+        return self.returncode
+
+    def terminate(self):
+        self.returncode = -15
+
+    def wait(self):
+        return self.returncode
+
+def test_pool_restarts_exited_workers_and_requeues_their_jobs(tmp_path, monkeypatch):
+    db_path = str(tmp_path / 'jobs.db')
+    queue = JobQueue(db_path)
+    pool = JobWorkerPool(db_path, num_workers=2)
+    monkeypatch.setattr(pool, '_spawn', FakeProcess)
+    pool.processes = [pool._spawn(), pool._spawn()]
+
+    # The first worker claims a job, then dies
+    job_id = queue.submit('a.txt', b'a', 'job a')
+    monkeypatch.setattr(job_queue.os, 'getpid', lambda: pool.processes[0].pid)
+    queue.claim()
+    crashed = pool.processes[0]
+    crashed.returncode = -9
+
+    assert pool.check(queue) == 1
+    assert pool.processes[0] is not crashed
+    assert pool.alive() == 2
+    assert queue.get(job_id)['status'] == 'queued'
+    assert pool.check(queue) == 0
+
+    pool.stop()
+    assert pool.processes == []
+    assert pool.check(queue) == 0
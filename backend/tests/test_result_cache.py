@@ -0,0 +1,60 @@
+"""
+Result cache tests - keys, LRU and TTL, and the shared SQLite tier
+"""
+
+from utils import result_cache
+from utils.result_cache import ResultCache
+
+def test_key_ignores_case_and_spacing_but_not_line_breaks():
+    key = ResultCache.make_key(b'resume', 'Python  Engineer\nDocker', 'v1')
+
+    assert ResultCache.make_key(b'resume', ' python engineer \n docker ', 'v1') == key
+    assert ResultCache.make_key(b'resume', 'Python Engineer Docker', 'v1') != key
+    assert ResultCache.make_key(b'other', 'Python Engineer\nDocker', 'v1') != key
+    assert ResultCache.make_key(b'resume', 'Python Engineer\nDocker', 'v2') != key
+
+def test_memory_tier_evicts_least_recently_used():
+    cache = ResultCache(max_entries=2)
+    cache.set('a', {'score': 1})
+    cache.set('b', {'score': 2})
+    cache.get('a')
+    cache.set('c', {'score': 3})
+
+    assert cache.get('a') == {'score': 1}
+    assert cache.get('b') is None
+    assert cache.get('c') == {'score': 3}
+    stats = cache.stats()
+    assert (stats['memory_hits'], stats['misses'], stats['evictions']) == (3, 1, 1)
+
+def test_entries_expire(monkeypatch, tmp_path):
+    now = [1000.0]
+    monkeypatch.setattr(result_cache.time, 'time', lambda: now[0])
+    cache = ResultCache(ttl_seconds=60, db_path=str(tmp_path / 'results.db'))
+    cache.set('a', {'score': 1})
+
+    now[0] += 59
+    assert cache.get('a') == {'score': 1}
+    now[0] += 2
+    assert cache.get('a') is None
+    assert cache.stats()['memory_entries'] == 0
+
+def test_sqlite_tier_is_shared_between_caches(tmp_path):
+    path = str(tmp_path / 'results.db')
+    ResultCache(db_path=path).set('a', {'score': 1, 'skills': ['python']})
+
+    reader = ResultCache(db_path=path)
+
+    assert reader.get('a') == {'score': 1, 'skills': ['python']}
+    assert reader.get('a') == {'score': 1, 'skills': ['python']}
+    stats = reader.stats()
+    assert (stats['disk_hits'], stats['memory_hits'], stats['disk_entries']) == (1, 1, 1)
+
+def test_clear_drops_every_tier(tmp_path):
+    path = str(tmp_path / 'results.db')
+    cache = ResultCache(db_path=path)
+    cache.set('a', {'score': 1})
+
+    cache.clear()
+
+    assert cache.get('a') is None
+    assert ResultCache(db_path=path).get('a') is None
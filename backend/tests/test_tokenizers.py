@@ -0,0 +1,125 @@
+"""
+Tokenizer tests - regex keyword tokenizer against NLTK word_tokenize
+word_tokenize output is vendored in fixtures/word_tokenize.json, so parity is
+checked offline; the fixture itself is checked when nltk and its punkt data
+are installed (NLTK_DATA). Regenerate it with: python -m tests.test_tokenizers
+"""
+
+import json
+import os
+
+import pytest
+
+from benchmarks.corpus import generate_job_description, generate_resume
+from utils import text_processing
+from utils.stopwords_en import ENGLISH_STOP_WORDS
+from utils.text_processing import clean_text, extract_bigrams, extract_keywords
+
+FIXTURE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'word_tokenize.json')
+
+# Hand-written samples with the tokens the two tokenizers are most likely to
+# split differently. Sentences end in ordinary words, so punkt splits them
+# the same way whatever abbreviations its model knows.
+SAMPLES = (
+    "Senior Software Engineer with 7+ years of Python, C++, C# and Node.js experience. "
+    "Built CI/CD pipelines (Jenkins, GitHub Actions) for micro-services on AWS/GCP. "
+    "Don't settle: we target 99.9% uptime!",
+    "We're hiring a Data Scientist who knows scikit-learn, TensorFlow 2.x, SQL & NoSQL. "
+    "Requirements: 3-5 years' experience; a Master's degree is preferred. Remote-friendly team?",
+    'Hands-on "full-stack" developer; state-of-the-art React/Redux front ends, REST APIs and GraphQL. '
+    'Comfortable with Kubernetes, Terraform and Ansible - on-call rotations included.',
+    "Skills: Java/Kotlin, Spring Boot, PostgreSQL, Redis, Docker. "
+    "Certifications: AWS Solutions Architect (Associate), Scrum Master.",
+    "Résumé of José Núñez: bilingual (English/Español) customer-success manager, "
+    "Salesforce admin, and data-driven storyteller.",
+    "It’s a fast-paced role where you’ll own pipelines end-to-end, from ingestion through reporting."
+)
+
+# Raw text where the tokenizers knowingly differ: word_tokenize leaves a word
+# attached to a symbol it does not split off (em dash, ellipsis, =, |, ™, an
+# inner apostrophe, a comma before a digit) and drops it as non-alphabetic,
+# while the regex keeps the word: (text, regex keywords, word_tokenize keywords)
+DIVERGENCES = (
+    ("Frontend—backend developer with Snowflake… and Kafka experience.",
+     ['frontend', 'backend', 'developer', 'snowflake', 'kafka', 'experience'],
+     ['developer', 'kafka', 'experience']),
+    ("Author at O'Reilly, speaker at PyCon.",
+     ['author', 'reilly', 'speaker', 'pycon'],
+     ['author', 'speaker', 'pycon']),
+    ("Python,2 years; Go=fun | Rust™ enthusiast",
+     ['python', 'years', 'fun', 'rust', 'enthusiast'],
+     ['years', 'enthusiast'])
+)
+
+def raw_corpus() -> list:
+    """Raw texts as /api/keywords receives them: samples plus seeded benchmark documents"""
+    texts = list(SAMPLES)
+    for seed in range(2):
+        texts.append(generate_resume(1 + seed % 2, seed=seed))
+        texts.append(generate_job_description(1, seed=seed))
+    return texts
+
+def corpus() -> list:
+    """Raw texts and the same texts cleaned as the pipeline tokenizes them"""
+    texts = raw_corpus()
+    return texts + [clean_text(text) for text in texts]
+
+def fixture_texts() -> list:
+    """Every text word_tokenize output is vendored for (lowercased, as tokenize passes it)"""
+    return [text.lower() for text in corpus() + [text for text, _, _ in DIVERGENCES]]
+
+def load_fixture() -> dict:
+    """Vendored word_tokenize output per lowercased text"""
+    with open(FIXTURE_PATH, encoding='utf-8') as file:
+        return json.load(file)['tokens']
+
+@pytest.fixture
+def vendored_word_tokenize(monkeypatch):
+    """Serve KEYWORD_TOKENIZER=nltk from the fixture instead of nltk and punkt"""
+    tokens = load_fixture()
+    monkeypatch.setattr(text_processing, '_word_tokenize', lambda text: list(tokens[text]))
+
+def nltk_data(resource: str):
+    """Skip unless nltk and a data package are installed"""
+    nltk = pytest.importorskip('nltk')
+    try:
+        nltk.data.find(resource)
+    except LookupError:
+        pytest.skip(f"NLTK data {resource} not installed")
+    return nltk
+
+@pytest.mark.parametrize('extract', [extract_keywords, extract_bigrams])
+def test_regex_tokenizer_matches_word_tokenize(vendored_word_tokenize, extract):
+    for text in corpus():
+        assert extract(text, tokenizer='regex') == extract(text, tokenizer='nltk')
+
+@pytest.mark.parametrize('text, regex_keywords, nltk_keywords', DIVERGENCES)
+def test_known_divergences_on_raw_text(vendored_word_tokenize, text, regex_keywords, nltk_keywords):
+    assert extract_keywords(text, tokenizer='regex') == regex_keywords
+    assert extract_keywords(text, tokenizer='nltk') == nltk_keywords
+
+def test_fixture_matches_word_tokenize():
+    nltk = nltk_data('tokenizers/punkt')
+    tokens = load_fixture()
+
+    assert sorted(tokens) == sorted(set(fixture_texts()))
+    for text in fixture_texts():
+        assert nltk.word_tokenize(text) == tokens[text]
+
+def test_vendored_stopwords_match_nltk():
+    nltk_data('corpora/stopwords')
+    from nltk.corpus import stopwords
+
+    assert ENGLISH_STOP_WORDS == frozenset(stopwords.words('english'))
+
+if __name__ == '__main__':
+    import nltk
+
+    # One text per line, so a changed tokenization shows up as a small diff
+    entries = [
+        f'  {json.dumps(text, ensure_ascii=False)}: {json.dumps(nltk.word_tokenize(text), ensure_ascii=False)}'
+        for text in dict.fromkeys(fixture_texts())
+    ]
+    with open(FIXTURE_PATH, 'w', encoding='utf-8') as file:
+        file.write(f'{{"nltk": "{nltk.__version__}", "tokens": {{\n' + ',\n'.join(entries) + '\n}}\n')
+    print(f"✓ Wrote {FIXTURE_PATH}")
@@ -0,0 +1,178 @@
+"""
+Chunking Utilities - Section-aware windows for long-document embeddings
+Splits text at section headings, then into overlapping word windows
+"""
+
+import re
+
+import numpy as np
+
+from utils.text_processing import clean_text
+
+# Section heading phrases recognised in resumes and job descriptions; a line
+# is a heading only when all of it is one of these phrases
+SECTION_HEADINGS = {
+    'summary': r'(summary|objective|profile|about( (the|this) (role|job|position|company|team)| us| you)?)',
+    'experience': r'(experience|employment|employment history|work history)',
+    'education': r'(education|academic background|academics|training)',
+    'skills': r'(skills|competencies|skill set)',
+    'projects': r'(projects|portfolio)',
+    'certifications': r'(certifications|certificates|licenses)',
+    'achievements': r'(achievements|awards|honors)',
+    'responsibilities': r'(responsibilities|duties|what you will do|what you\'ll do)',
+    'requirements': r'(requirements|qualifications|what we are looking for|must have)',
+    'benefits': r'(benefits|perks|what we offer)'
+}
+
+# Words that may precede a heading phrase ("Work Experience", "Technical Skills")
+HEADING_QUALIFIERS = (
+    r'((professional|career|executive|work|relevant|technical|core|key|minimum|'
+    r'preferred|required|basic|additional|job|your|our) )*'
+)
+
+# Further phrases after the first ("Skills & Certifications", "Licenses and Certificates")
+_ANY_HEADING = '|'.join(SECTION_HEADINGS.values())
+HEADING_PATTERNS = {
+    section_name: re.compile(
+        rf'{HEADING_QUALIFIERS}{pattern}( ?(&|and|/|,) ?{HEADING_QUALIFIERS}({_ANY_HEADING}))*'
+    )
+    for section_name, pattern in SECTION_HEADINGS.items()
+}
+
+POOLING_MODES = ('mean', 'max_sim', 'topk_mean')
+
+def heading_section(line: str):
+    """
+    Section name if a line is a section heading
+
+    A line is a heading when, apart from markup ('#', a trailing ':') and
+    case, the whole line is a heading phrase. Lines that merely contain a
+    heading word ("- Strong Python skills") are section text.
+
+    Args:
+        line: One line of raw text
+
+    Returns:
+        Section name, or None if the line is not a heading
+    """
+    line = ' '.join(line.strip().strip('#:').split()).lower()
+    if not line:
+        return None
+
+    for section_name, pattern in HEADING_PATTERNS.items():
+        if pattern.fullmatch(line):
+            return section_name
+    return None
+
+def split_sections(text: str) -> list:
+    """
+    Split raw text into sections at heading lines
+
+    Text before the first heading belongs to a 'header' section.
+
+    Args:
+        text: Raw text with line breaks
+
+    Returns:
+        List of (section name, section text) in document order
+    """
+    sections = []
+    name, lines = 'header', []
+
+    for line in text.splitlines():
+        section_name = heading_section(line)
+        if section_name:
+            if any(part.strip() for part in lines):
+                sections.append((name, '\n'.join(lines)))
+            name, lines = section_name, []
+        else:
+            lines.append(line)
+
+    if any(part.strip() for part in lines):
+        sections.append((name, '\n'.join(lines)))
+    return sections
+
+def window_words(text: str, size: int, overlap: int) -> list:
+    """
+    Split text into overlapping windows of words
+
+    Args:
+        text: Cleaned text
+        size: Words per window
+        overlap: Words shared by consecutive windows
+
+    Returns:
+        List of window texts
+    """
+    words = text.split()
+    if len(words) <= size:
+        return [' '.join(words)] if words else []
+
+    step = max(1, size - overlap)
+    windows = []
+    for start in range(0, len(words), step):
+        windows.append(' '.join(words[start:start + size]))
+        if start + size >= len(words):
+            break
+    return windows
+
+def section_chunks(text: str, size: int = 128, overlap: int = 32) -> list:
+    """
+    Cleaned, overlapping windows that never cross a section boundary
+
+    Args:
+        text: Raw text with line breaks
+        size: Words per window
+        overlap: Words shared by consecutive windows of a section
+
+    Returns:
+        List of (section name, window text)
+    """
+    chunks = []
+    for section_name, section_text in split_sections(text):
+        for window in window_words(clean_text(section_text), size, overlap):
+            chunks.append((section_name, window))
+    return chunks
+
+def normalize(vectors: np.ndarray) -> np.ndarray:
+    """Scale rows to unit length (zero rows stay zero)"""
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+def pool_similarity(query: np.ndarray, document: np.ndarray,
+                    mode: str = 'max_sim', top_k: int = 3) -> float:
+    """
+    Similarity of two documents from their unit-length chunk embeddings
+
+    Modes:
+        mean: Cosine of the mean chunk embeddings
+        max_sim: Best-matching query chunk for each document chunk, averaged
+        topk_mean: Mean of the top_k query chunks for each document chunk, averaged
+
+    Args:
+        query: Chunk embeddings of the resume (one row per chunk)
+        document: Chunk embeddings of the job description
+        mode: Pooling mode from POOLING_MODES
+        top_k: Chunks averaged per document chunk for topk_mean
+
+    Returns:
+        Similarity score, 0.0 if either side has no chunks
+    """
+    if len(query) == 0 or len(document) == 0:
+        return 0.0
+
+    if mode == 'mean':
+        centroids = normalize(np.vstack([query.mean(axis=0), document.mean(axis=0)]))
+        return float(centroids[0] @ centroids[1])
+
+    scores = document @ query.T  # document chunks x query chunks
+    if mode == 'max_sim':
+        return float(scores.max(axis=1).mean())
+    if mode == 'topk_mean':
+        k = min(top_k, scores.shape[1])
+        best = np.partition(scores, scores.shape[1] - k, axis=1)[:, -k:]
+        return float(best.mean(axis=1).mean())
+
+    raise ValueError(f"Unknown pooling mode: {mode}")
@@ -0,0 +1,131 @@
+"""
+Components - Analysis settings and the components built from them
+The web app and the job workers both build their pipeline here
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from models.analysis_pipeline import AnalysisPipeline, parse_stage_timeouts
+from models.nlp_analyzer import NLPAnalyzer
+from models.semantic_skills import SemanticSkillMatcher
+from utils.embedding_cache import EmbeddingCache
+from utils.skill_extraction import SkillExtractor
+
+def load_config(environ=None) -> dict:
+    """
+    Read the analysis settings from environment variables
+
+    Args:
+        environ: Mapping to read (default: os.environ)
+
+    Returns:
+        Settings keyed like the Flask app config
+    """
+    env = os.environ if environ is None else environ
+    return {
+        'SPACY_PROFILE': env.get('SPACY_PROFILE', 'full'),
+        'SPACY_MODEL': env.get('SPACY_MODEL', 'en_core_web_md'),
+        'SPACY_FAST_MODEL': env.get('SPACY_FAST_MODEL', 'en_core_web_sm'),
+        'SPACY_BATCH_SIZE': int(env.get('SPACY_BATCH_SIZE', 32)),
+        'SPACY_N_PROCESS': int(env.get('SPACY_N_PROCESS', 1)),
+        'EMBEDDING_BACKEND': env.get('EMBEDDING_BACKEND', 'torch'),
+        'EMBEDDING_ONNX_DIR': env.get('EMBEDDING_ONNX_DIR', 'onnx/all-MiniLM-L6-v2'),
+        'EMBEDDING_THREADS': int(env.get('EMBEDDING_THREADS', 0)),
+        'ENCODE_BATCHING': env.get('ENCODE_BATCHING', '0') == '1',
+        'ENCODE_MAX_BATCH': int(env.get('ENCODE_MAX_BATCH', 32)),
+        'ENCODE_MAX_WAIT_MS': float(env.get('ENCODE_MAX_WAIT_MS', 5)),
+        'ANALYSIS_MODE': env.get('ANALYSIS_MODE', 'sequential'),
+        'ANALYSIS_THREADS': int(env.get('ANALYSIS_THREADS', 4)),
+        'STAGE_TIMEOUT': float(env.get('STAGE_TIMEOUT', 30)),
+        'STAGE_TIMEOUTS': parse_stage_timeouts(env.get('STAGE_TIMEOUTS', '')),
+        'EMBEDDING_MODE': env.get('EMBEDDING_MODE', 'document'),
+        'EMBEDDING_CHUNK_WORDS': int(env.get('EMBEDDING_CHUNK_WORDS', 128)),
+        'EMBEDDING_CHUNK_OVERLAP': int(env.get('EMBEDDING_CHUNK_OVERLAP', 32)),
+        'EMBEDDING_POOLING': env.get('EMBEDDING_POOLING', 'max_sim'),
+        'EMBEDDING_POOLING_TOP_K': int(env.get('EMBEDDING_POOLING_TOP_K', 3)),
+        'EMBEDDING_CACHE_SIZE': int(env.get('EMBEDDING_CACHE_SIZE', 10000)),
+        'EMBEDDING_CACHE_DIR': env.get('EMBEDDING_CACHE_DIR') or None,
+        'EMBEDDING_CACHE_DTYPE': env.get('EMBEDDING_CACHE_DTYPE', 'float32'),
+        'SKILLS_TAXONOMY': env.get('SKILLS_TAXONOMY') or None,
+        'SKILLS_INDEX': env.get('SKILLS_INDEX') or None,
+        'SKILLS_RELOAD_INTERVAL': float(env.get('SKILLS_RELOAD_INTERVAL', 5)),
+        'SEMANTIC_SKILLS': env.get('SEMANTIC_SKILLS', '0') == '1',
+        'SEMANTIC_SKILLS_THRESHOLD': float(env.get('SEMANTIC_SKILLS_THRESHOLD', 0.75)),
+        'SEMANTIC_PHRASE_CACHE_SIZE': int(env.get('SEMANTIC_PHRASE_CACHE_SIZE', 2048)),
+        'SKILL_EMBEDDINGS_DIR': env.get('SKILL_EMBEDDINGS_DIR', 'skill_embeddings')
+    }
+
+def build_components(config) -> dict:
+    """
+    Build the analysis pipeline and its components from settings
+
+    Args:
+        config: Settings as returned by load_config (or the Flask app config)
+
+    Returns:
+        {'embedding_cache', 'stage_executor', 'nlp_analyzer', 'skill_extractor',
+         'semantic_skills', 'pipeline'}; stage_executor and semantic_skills may be None
+    """
+    embedding_cache = EmbeddingCache(
+        directory=config['EMBEDDING_CACHE_DIR'],
+        max_entries=config['EMBEDDING_CACHE_SIZE'],
+        dtype=config['EMBEDDING_CACHE_DTYPE']
+    )
+    # Shared, bounded pool for the independent stages of each analysis
+    # (threads start on first use, so none exist before a pre-fork server forks)
+    stage_executor = None
+    if config['ANALYSIS_MODE'] == 'parallel':
+        stage_executor = ThreadPoolExecutor(
+            max_workers=config['ANALYSIS_THREADS'],
+            thread_name_prefix='analysis-stage'
+        )
+    nlp_analyzer = NLPAnalyzer(
+        spacy_model=config['SPACY_MODEL'],
+        embedding_cache=embedding_cache,
+        pipe_batch_size=config['SPACY_BATCH_SIZE'],
+        pipe_n_process=config['SPACY_N_PROCESS'],
+        spacy_profile=config['SPACY_PROFILE'],
+        spacy_profiles={'fast': {'model': config['SPACY_FAST_MODEL']}},
+        embedding_mode=config['EMBEDDING_MODE'],
+        chunk_words=config['EMBEDDING_CHUNK_WORDS'],
+        chunk_overlap=config['EMBEDDING_CHUNK_OVERLAP'],
+        pooling=config['EMBEDDING_POOLING'],
+        pooling_top_k=config['EMBEDDING_POOLING_TOP_K'],
+        embedding_backend=config['EMBEDDING_BACKEND'],
+        onnx_dir=config['EMBEDDING_ONNX_DIR'],
+        embedding_threads=config['EMBEDDING_THREADS'],
+        micro_batching=config['ENCODE_BATCHING'],
+        max_batch_size=config['ENCODE_MAX_BATCH'],
+        max_wait_ms=config['ENCODE_MAX_WAIT_MS']
+    )
+    skill_extractor = SkillExtractor(
+        taxonomy_path=config['SKILLS_TAXONOMY'],
+        index_path=config['SKILLS_INDEX'],
+        reload_interval=config['SKILLS_RELOAD_INTERVAL']
+    )
+    semantic_skills = None
+    if config['SEMANTIC_SKILLS']:
+        semantic_skills = SemanticSkillMatcher(
+            nlp_analyzer,
+            skill_extractor,
+            threshold=config['SEMANTIC_SKILLS_THRESHOLD'],
+            directory=config['SKILL_EMBEDDINGS_DIR'],
+            phrase_cache_size=config['SEMANTIC_PHRASE_CACHE_SIZE']
+        )
+    pipeline = AnalysisPipeline(
+        nlp_analyzer=nlp_analyzer,
+        skill_extractor=skill_extractor,
+        executor=stage_executor,
+        stage_timeout=config['STAGE_TIMEOUT'],
+        stage_timeouts=config['STAGE_TIMEOUTS'],
+        semantic_skills=semantic_skills
+    )
+    return {
+        'embedding_cache': embedding_cache,
+        'stage_executor': stage_executor,
+        'nlp_analyzer': nlp_analyzer,
+        'skill_extractor': skill_extractor,
+        'semantic_skills': semantic_skills,
+        'pipeline': pipeline
+    }
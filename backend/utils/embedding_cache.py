@@ -0,0 +1,291 @@
+"""
+Embedding Cache - Reuse sentence embeddings across requests and workers
+In-process LRU tier in front of an append-only, memory-mapped vector store
+"""
+
+import fcntl
+import hashlib
+import json
+import os
+import re
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+
+import numpy as np
+
+# Bytes of SHA-256 kept per key in the on-disk index
+KEY_BYTES = 16
+
+class EmbeddingCache:
+    """
+    Two-tier cache of text embeddings keyed by model name and text
+
+    On-disk layout (per model) in the cache directory:
+        <model>.json  Dimension and storage dtype
+        <model>.vec   Vectors, one fixed-size row per entry, append-only
+        <model>.idx   One KEY_BYTES key per entry; record i describes row i,
+                      so a vector's offset is i * dimension * itemsize
+
+    Vectors are written before their index record, so a reader that sees a
+    record can always read its row. Writers hold an exclusive file lock;
+    readers take no lock and memory-map the vectors instead of loading them.
+    """
+
+    def __init__(self, directory: str = None, max_entries: int = 10000, dtype: str = 'float32'):
+        """
+        Args:
+            directory: Directory for the shared on-disk tier (optional)
+            max_entries: Maximum vectors kept in memory
+            dtype: On-disk storage type, 'float32' or 'float16'
+        """
+        if dtype not in ('float32', 'float16'):
+            raise ValueError(f"Unsupported embedding cache dtype: {dtype}")
+
+        self.directory = directory
+        self.max_entries = max_entries
+        self.dtype = np.dtype(dtype)
+        self.lock = threading.Lock()
+        self.entries = OrderedDict()  # key -> float32 vector
+        self.stores = {}  # model name -> _DiskStore
+        self.counters = {
+            'hits': 0,
+            'memory_hits': 0,
+            'disk_hits': 0,
+            'misses': 0,
+            'evictions': 0
+        }
+
+        if self.directory:
+            os.makedirs(self.directory, exist_ok=True)
+
+    @staticmethod
+    def make_key(model_name: str, text: str) -> bytes:
+        """Key for a text under a model (whitespace-normalized)"""
+        digest = hashlib.sha256()
+        digest.update(model_name.encode('utf-8'))
+        digest.update(b'\0')
+        digest.update(' '.join(text.split()).encode('utf-8'))
+        return digest.digest()[:KEY_BYTES]
+
+    def get_many(self, model_name: str, texts: list) -> list:
+        """
+        Look up embeddings
+
+        Args:
+            model_name: Embedding model name
+            texts: Texts to look up
+
+        Returns:
+            List with a float32 vector per text, or None where missing
+        """
+        keys = [self.make_key(model_name, text) for text in texts]
+        found = [None] * len(keys)
+        missing = []
+
+        with self.lock:
+            for i, key in enumerate(keys):
+                vector = self.entries.get(key)
+                if vector is not None:
+                    self.entries.move_to_end(key)
+                    self.counters['hits'] += 1
+                    self.counters['memory_hits'] += 1
+                    found[i] = vector
+                else:
+                    missing.append(i)
+
+        if missing and self.directory:
+            store = self._store(model_name)
+            disk_hits = 0
+            for i in missing:
+                vector = store.get(keys[i])
+                if vector is not None:
+                    found[i] = vector
+                    disk_hits += 1
+            with self.lock:
+                for i in missing:
+                    if found[i] is not None:
+                        self._store_memory(keys[i], found[i])
+                self.counters['hits'] += disk_hits
+                self.counters['disk_hits'] += disk_hits
+                self.counters['misses'] += len(missing) - disk_hits
+        else:
+            with self.lock:
+                self.counters['misses'] += len(missing)
+
+        return found
+
+    def put_many(self, model_name: str, texts: list, vectors) -> None:
+        """
+        Store embeddings in every tier
+
+        Args:
+            model_name: Embedding model name
+            texts: Texts that were embedded
+            vectors: Their embeddings, one row per text
+        """
+        keys = [self.make_key(model_name, text) for text in texts]
+        vectors = np.asarray(vectors, dtype=np.float32)
+
+        with self.lock:
+            for key, vector in zip(keys, vectors):
+                self._store_memory(key, vector)
+
+        if self.directory:
+            self._store(model_name).append(keys, vectors)
+
+    def _store(self, model_name: str):
+        """On-disk store for a model, opened on first use"""
+        with self.lock:
+            store = self.stores.get(model_name)
+            if store is None:
+                store = self.stores[model_name] = _DiskStore(self.directory, model_name, self.dtype)
+            return store
+
+    def _store_memory(self, key, vector):
+        """Insert into the LRU tier (caller holds the lock)"""
+        self.entries[key] = vector
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+            self.counters['evictions'] += 1
+
+    def stats(self) -> dict:
+        """Return hit/miss counters and tier sizes"""
+        with self.lock:
+            stats = dict(self.counters)
+            stats['memory_entries'] = len(self.entries)
+            stores = dict(self.stores)
+
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = round(stats['hits'] / lookups, 4) if lookups else 0.0
+        stats['max_entries'] = self.max_entries
+        if self.directory:
+            stats['dtype'] = self.dtype.name
+            stats['disk_entries'] = {name: store.count() for name, store in stores.items()}
+
+        return stats
+
+class _DiskStore:
+    """Append-only vectors file plus key index for one model"""
+
+    def __init__(self, directory: str, model_name: str, dtype):
+        slug = re.sub(r'[^A-Za-z0-9_.-]+', '_', model_name)
+        self.meta_path = os.path.join(directory, f'{slug}.json')
+        self.vectors_path = os.path.join(directory, f'{slug}.vec')
+        self.index_path = os.path.join(directory, f'{slug}.idx')
+        self.lock_path = os.path.join(directory, f'{slug}.lock')
+        self.dtype = dtype
+
+        self.lock = threading.Lock()
+        self.dimension = None
+        self.rows = {}  # key -> row
+        self.index_offset = 0  # bytes of the index file already read
+        self.matrix = None
+
+        self._load_meta()
+
+    @contextmanager
+    def _write_lock(self):
+        """Serialize writers across threads and processes"""
+        with open(self.lock_path, 'w') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _load_meta(self):
+        """Read dimension and dtype if the store exists"""
+        try:
+            with open(self.meta_path) as file:
+                meta = json.load(file)
+        except (OSError, ValueError):
+            return
+        self.dimension = meta['dimension']
+        # The store keeps whatever dtype it was created with
+        self.dtype = np.dtype(meta['dtype'])
+
+    def _refresh(self):
+        """Read index records appended since the last refresh (caller holds the lock)"""
+        if self.dimension is None:
+            self._load_meta()
+            if self.dimension is None:
+                return
+
+        try:
+            with open(self.index_path, 'rb') as file:
+                file.seek(self.index_offset)
+                data = file.read()
+        except OSError:
+            return
+
+        usable = len(data) - len(data) % KEY_BYTES
+        first_row = self.index_offset // KEY_BYTES
+        for i in range(0, usable, KEY_BYTES):
+            self.rows.setdefault(data[i:i + KEY_BYTES], first_row + i // KEY_BYTES)
+        self.index_offset += usable
+
+        rows = self.index_offset // KEY_BYTES
+        if rows and (self.matrix is None or self.matrix.shape[0] < rows):
+            self.matrix = np.memmap(
+                self.vectors_path, dtype=self.dtype, mode='r', shape=(rows, self.dimension)
+            )
+
+    def get(self, key: bytes):
+        """Vector for a key as float32, or None"""
+        with self.lock:
+            row = self.rows.get(key)
+            if row is None:
+                self._refresh()
+                row = self.rows.get(key)
+            if row is None:
+                return None
+            return np.array(self.matrix[row], dtype=np.float32)
+
+    def append(self, keys: list, vectors: np.ndarray):
+        """Append vectors not already stored"""
+        with self.lock, self._write_lock():
+            if self.dimension is None:
+                self._load_meta()
+            if self.dimension is None:
+                self.dimension = int(vectors.shape[1])
+                temp_path = self.meta_path + '.tmp'
+                with open(temp_path, 'w') as file:
+                    json.dump({'dimension': self.dimension, 'dtype': self.dtype.name}, file)
+                os.replace(temp_path, self.meta_path)
+            elif vectors.shape[1] != self.dimension:
+                raise ValueError(
+                    f"Embedding dimension {vectors.shape[1]} does not match cache dimension {self.dimension}"
+                )
+
+            # Pick up records other processes appended, then skip known keys
+            self._refresh()
+            rows = self.index_offset // KEY_BYTES
+            row_bytes = self.dimension * self.dtype.itemsize
+
+            # Drop anything a crashed writer left past the last complete record
+            for path, size in ((self.index_path, rows * KEY_BYTES),
+                               (self.vectors_path, rows * row_bytes)):
+                if os.path.exists(path) and os.path.getsize(path) > size:
+                    os.truncate(path, size)
+
+            new = {}
+            for key, vector in zip(keys, vectors):
+                if key not in self.rows and key not in new:
+                    new[key] = vector
+            if not new:
+                return
+
+            with open(self.vectors_path, 'ab') as file:
+                file.write(np.asarray(list(new.values()), dtype=self.dtype).tobytes())
+            with open(self.index_path, 'ab') as file:
+                file.write(b''.join(new))
+
+            self._refresh()
+
+    def count(self) -> int:
+        """Number of stored vectors"""
+        with self.lock:
+            self._refresh()
+            return self.index_offset // KEY_BYTES
@@ -0,0 +1,157 @@
+"""
+Encode Scheduler - Micro-batch embedding requests from concurrent callers
+One background thread turns queued requests into a single forward pass
+"""
+
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+
+import numpy as np
+
+from utils.metrics import REGISTRY, ENCODE_QUEUE_DEPTH, ENCODE_BATCH_SIZE, ENCODE_WAIT
+
+class EncodeScheduler:
+    """
+    Collect encode calls into batches bounded by size and wait time
+
+    A batch is dispatched when it holds max_batch_size texts, or when the
+    oldest queued request has waited max_wait_ms. A request larger than
+    max_batch_size runs on its own; the encoder batches it internally.
+    """
+
+    def __init__(self, encode_fn, max_batch_size: int = 32, max_wait_ms: float = 5.0):
+        """
+        Args:
+            encode_fn: Function mapping a list of texts to an array, one row per text
+            max_batch_size: Texts per forward pass
+            max_wait_ms: Longest a request waits for others to join its batch
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+
+        self.encode_fn = encode_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.pid = None
+        self._reset()
+
+    def _reset(self):
+        """Fresh queue and worker state (also after fork, where threads do not survive)"""
+        self.condition = threading.Condition()
+        self.pending = deque()  # (texts, future, enqueued_at)
+        self.pending_texts = 0
+        self.thread = None
+        self.stopped = False
+        self.pid = os.getpid()
+
+    def _ensure_worker(self):
+        """Start the batching thread in this process (caller holds the condition)"""
+        if self.thread is None or not self.thread.is_alive():
+            self.thread = threading.Thread(target=self._run, name='encode-scheduler', daemon=True)
+            self.thread.start()
+
+    def submit(self, texts: list) -> Future:
+        """
+        Queue texts for encoding
+
+        Args:
+            texts: Texts to encode
+
+        Returns:
+            Future resolving to an array with one row per text
+        """
+        texts = list(texts)
+        future = Future()
+        if not texts:
+            future.set_result(None)
+            return future
+
+        if self.pid != os.getpid():
+            self._reset()
+
+        with self.condition:
+            if self.stopped:
+                raise RuntimeError("Encode scheduler is stopped")
+            self._ensure_worker()
+            self.pending.append((texts, future, time.perf_counter()))
+            self.pending_texts += len(texts)
+            self._record_depth()
+            self.condition.notify()
+        return future
+
+    def encode(self, texts: list):
+        """Encode texts through the scheduler and wait for the result"""
+        return self.submit(texts).result()
+
+    def stop(self):
+        """Stop the worker after it drains the queue"""
+        with self.condition:
+            self.stopped = True
+            self.condition.notify()
+        if self.thread is not None:
+            self.thread.join()
+
+    def _run(self):
+        """Worker loop: wait for a full batch or the deadline, then run it"""
+        while True:
+            with self.condition:
+                while not self.pending and not self.stopped:
+                    self.condition.wait()
+                if not self.pending:
+                    return
+
+                deadline = self.pending[0][2] + self.max_wait
+                while self.pending_texts < self.max_batch_size and not self.stopped:
+                    remaining = deadline - time.perf_counter()
+                    if remaining <= 0:
+                        break
+                    self.condition.wait(remaining)
+
+                batch = self._take_batch()
+                self._record_depth()
+
+            self._run_batch(batch)
+
+    def _take_batch(self) -> list:
+        """Pop queued requests up to max_batch_size texts (caller holds the condition)"""
+        batch = [self.pending.popleft()]
+        size = len(batch[0][0])
+        while self.pending and size + len(self.pending[0][0]) <= self.max_batch_size:
+            request = self.pending.popleft()
+            batch.append(request)
+            size += len(request[0])
+        self.pending_texts -= size
+        return batch
+
+    def _run_batch(self, batch: list):
+        """One forward pass for the batch; resolve each caller's future"""
+        started = time.perf_counter()
+        texts = [text for request_texts, _, _ in batch for text in request_texts]
+
+        if REGISTRY.enabled:
+            ENCODE_BATCH_SIZE.observe(len(texts))
+            for _, _, enqueued_at in batch:
+                ENCODE_WAIT.observe(started - enqueued_at)
+
+        try:
+            vectors = self.encode_fn(texts)
+            if vectors is None:
+                raise RuntimeError("Embedding model unavailable")
+            vectors = np.asarray(vectors)
+        except Exception as e:
+            for _, future, _ in batch:
+                future.set_exception(e)
+            return
+
+        offset = 0
+        for request_texts, future, _ in batch:
+            future.set_result(vectors[offset:offset + len(request_texts)])
+            offset += len(request_texts)
+
+    def _record_depth(self):
+        """Publish the number of queued texts (caller holds the condition)"""
+        if REGISTRY.enabled:
+            ENCODE_QUEUE_DEPTH.set(self.pending_texts)
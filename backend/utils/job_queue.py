@@ -0,0 +1,392 @@
+"""
+Job Queue - Run resume analyses asynchronously on worker processes
+Jobs are stored in SQLite so queued work survives a restart
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import subprocess
+import sys
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Seconds a claimed job stays reserved without a heartbeat from its worker
+LEASE_SECONDS = 60
+
+# Claims of a job before it is failed instead of requeued (a job that keeps killing workers)
+MAX_ATTEMPTS = 3
+
+class JobQueue:
+    """
+    SQLite-backed queue of analysis jobs
+
+    A claim leases the job for lease_seconds; the worker renews the lease
+    while it runs. Jobs whose lease ran out (the worker died or hung) are
+    queued again, up to MAX_ATTEMPTS claims.
+    """
+
+    def __init__(self, db_path: str, lease_seconds: float = LEASE_SECONDS):
+        """
+        Open (and create if needed) the job database
+
+        Args:
+            db_path: Path to the job database
+            lease_seconds: Seconds a claim lasts without renewal
+        """
+        self.db_path = db_path
+        self.lease_seconds = lease_seconds
+        self.expired_checked_at = 0.0
+        with self._connect() as conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id TEXT PRIMARY KEY,
+                    status TEXT NOT NULL,
+                    filename TEXT NOT NULL,
+                    file_data BLOB,
+                    job_description TEXT NOT NULL,
+                    result TEXT,
+                    error TEXT,
+                    worker_pid INTEGER,
+                    created_at TEXT NOT NULL,
+                    started_at TEXT,
+                    finished_at TEXT
+                )
+            ''')
+            conn.execute(
+                'CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status, created_at)'
+            )
+            columns = {row[1] for row in conn.execute('PRAGMA table_info(jobs)')}
+            if 'lease_expires' not in columns:
+                conn.execute('ALTER TABLE jobs ADD COLUMN lease_expires REAL')
+            if 'attempts' not in columns:
+                conn.execute('ALTER TABLE jobs ADD COLUMN attempts INTEGER NOT NULL DEFAULT 0')
+
+    @contextmanager
+    def _connect(self):
+        """Open a connection in autocommit mode"""
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def submit(self, filename: str, file_data: bytes, job_description: str) -> str:
+        """
+        Enqueue an analysis job
+
+        Args:
+            filename: Original resume filename
+            file_data: Raw resume file contents
+            job_description: Job description text
+
+        Returns:
+            Job ID
+        """
+        job_id = uuid.uuid4().hex
+        with self._connect() as conn:
+            conn.execute(
+                'INSERT INTO jobs (id, status, filename, file_data, job_description, created_at) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                (job_id, 'queued', filename, file_data, job_description,
+                 datetime.now().isoformat())
+            )
+        return job_id
+
+    def get(self, job_id: str):
+        """
+        Get job status and result
+
+        Args:
+            job_id: Job ID
+
+        Returns:
+            Dictionary describing the job, or None if unknown
+        """
+        with self._connect() as conn:
+            row = conn.execute(
+                'SELECT id, status, filename, result, error, created_at, started_at, finished_at '
+                'FROM jobs WHERE id = ?',
+                (job_id,)
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        return {
+            'job_id': row[0],
+            'status': row[1],
+            'filename': row[2],
+            'result': json.loads(row[3]) if row[3] else None,
+            'error': row[4],
+            'created_at': row[5],
+            'started_at': row[6],
+            'finished_at': row[7]
+        }
+
+    def claim(self):
+        """
+        Atomically take the oldest queued job and lease it to this process
+
+        Returns:
+            Dictionary with job fields, or None if the queue is empty
+        """
+        if time.monotonic() - self.expired_checked_at >= self.lease_seconds / 3:
+            self.expired_checked_at = time.monotonic()
+            self.requeue_expired()
+        with self._connect() as conn:
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                row = conn.execute(
+                    "SELECT id, filename, file_data, job_description FROM jobs "
+                    "WHERE status = 'queued' ORDER BY created_at LIMIT 1"
+                ).fetchone()
+                if row is not None:
+                    conn.execute(
+                        "UPDATE jobs SET status = 'running', worker_pid = ?, started_at = ?, "
+                        "lease_expires = ?, attempts = attempts + 1 WHERE id = ?",
+                        (os.getpid(), datetime.now().isoformat(),
+                         time.time() + self.lease_seconds, row[0])
+                    )
+                conn.execute('COMMIT')
+            except Exception:
+                conn.execute('ROLLBACK')
+                raise
+
+        if row is None:
+            return None
+
+        return {
+            'job_id': row[0],
+            'filename': row[1],
+            'file_data': row[2],
+            'job_description': row[3]
+        }
+
+    def renew(self, job_id: str):
+        """Extend the lease of a running job"""
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE jobs SET lease_expires = ? WHERE id = ? AND status = 'running'",
+                (time.time() + self.lease_seconds, job_id)
+            )
+
+    def complete(self, job_id: str, result: dict):
+        """Store a job's result and drop its uploaded file"""
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE jobs SET status = 'done', result = ?, file_data = NULL, finished_at = ? "
+                "WHERE id = ?",
+                (json.dumps(result), datetime.now().isoformat(), job_id)
+            )
+
+    def fail(self, job_id: str, error: str):
+        """Mark a job as failed and drop its uploaded file"""
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE jobs SET status = 'failed', error = ?, file_data = NULL, finished_at = ? "
+                "WHERE id = ?",
+                (error, datetime.now().isoformat(), job_id)
+            )
+
+    def requeue_expired(self) -> int:
+        """
+        Put back running jobs whose lease ran out (failing those claimed MAX_ATTEMPTS times)
+
+        Returns:
+            Number of jobs requeued or failed
+        """
+        return self._release("lease_expires IS NULL OR lease_expires < ?", (time.time(),))
+
+    def requeue_worker(self, pid: int) -> int:
+        """
+        Put back the running jobs of a worker known to have exited
+
+        Returns:
+            Number of jobs requeued or failed
+        """
+        return self._release('worker_pid = ?', (pid,))
+
+    def _release(self, condition: str, params: tuple) -> int:
+        """Requeue (or fail, after MAX_ATTEMPTS claims) running jobs matching a condition"""
+        with self._connect() as conn:
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                failed = conn.execute(
+                    f"UPDATE jobs SET status = 'failed', error = ?, file_data = NULL, "
+                    f"finished_at = ?, lease_expires = NULL "
+                    f"WHERE status = 'running' AND attempts >= ? AND ({condition})",
+                    (f'Worker stopped while processing the job ({MAX_ATTEMPTS} attempts)',
+                     datetime.now().isoformat(), MAX_ATTEMPTS) + params
+                ).rowcount
+                requeued = conn.execute(
+                    f"UPDATE jobs SET status = 'queued', worker_pid = NULL, started_at = NULL, "
+                    f"lease_expires = NULL WHERE status = 'running' AND ({condition})",
+                    params
+                ).rowcount
+                conn.execute('COMMIT')
+            except Exception:
+                conn.execute('ROLLBACK')
+                raise
+        return failed + requeued
+
+    def stats(self) -> dict:
+        """Return job counts by status"""
+        with self._connect() as conn:
+            rows = conn.execute(
+                'SELECT status, COUNT(*) FROM jobs GROUP BY status'
+            ).fetchall()
+        return dict(rows)
+
+class JobWorkerPool:
+    """Supervised pool of worker processes that drain a JobQueue"""
+
+    def __init__(self, db_path: str, num_workers: int = 2, poll_interval: float = 0.5,
+                 supervise_interval: float = 2.0):
+        """
+        Args:
+            db_path: Path to the job database
+            num_workers: Number of worker processes
+            poll_interval: Seconds to wait when the queue is empty
+            supervise_interval: Seconds between checks for exited workers
+        """
+        self.db_path = os.path.abspath(db_path)
+        self.num_workers = num_workers
+        self.poll_interval = poll_interval
+        self.supervise_interval = supervise_interval
+        self.processes = []
+        self.restarts = 0
+        self.lock = threading.Lock()
+        self.stopping = threading.Event()
+        self.supervisor = None
+
+    def _spawn(self):
+        """Start one worker process"""
+        # Each worker is a fresh interpreter so it loads its own models once
+        return subprocess.Popen(
+            [sys.executable, '-m', 'utils.job_queue',
+             '--db', self.db_path,
+             '--poll-interval', str(self.poll_interval),
+             '--parent-pid', str(os.getpid())],
+            cwd=BACKEND_DIR
+        )
+
+    def start(self):
+        """Requeue jobs with expired leases, start worker processes and their supervisor"""
+        JobQueue(self.db_path).requeue_expired()
+
+        self.stopping.clear()
+        with self.lock:
+            self.processes = [self._spawn() for _ in range(self.num_workers)]
+        self.supervisor = threading.Thread(
+            target=self._supervise, name='job-worker-supervisor', daemon=True
+        )
+        self.supervisor.start()
+        print(f"✓ Started {self.num_workers} analysis workers")
+
+    def _supervise(self):
+        """Restart exited workers and requeue the jobs they held"""
+        queue = JobQueue(self.db_path)
+        while not self.stopping.wait(self.supervise_interval):
+            self.check(queue)
+
+    def check(self, queue=None) -> int:
+        """
+        Replace exited workers once, requeueing their running jobs
+
+        Returns:
+            Number of workers restarted
+        """
+        queue = queue or JobQueue(self.db_path)
+        restarted = 0
+        with self.lock:
+            if self.stopping.is_set():
+                return 0
+            for i, process in enumerate(self.processes):
+                if process.poll() is None:
+                    continue
+                print(f"⚠ Analysis worker {process.pid} exited ({process.returncode}); restarting")
+                queue.requeue_worker(process.pid)
+                self.processes[i] = self._spawn()
+                restarted += 1
+        self.restarts += restarted
+        return restarted
+
+    def stop(self):
+        """Stop supervising and terminate worker processes"""
+        self.stopping.set()
+        with self.lock:
+            for process in self.processes:
+                process.terminate()
+            for process in self.processes:
+                process.wait()
+            self.processes = []
+
+    def alive(self) -> int:
+        """Return number of running worker processes"""
+        return sum(1 for process in self.processes if process.poll() is None)
+
+def run_worker(db_path: str, poll_interval: float = 0.5, parent_pid: int = None):
+    """
+    Worker loop: load models once, then process jobs until the parent exits
+
+    Args:
+        db_path: Path to the job database
+        poll_interval: Seconds to wait when the queue is empty
+        parent_pid: Exit once this process is no longer our parent (optional)
+    """
+    from utils.components import build_components, load_config
+
+    # Same settings as the web app, so workers score alike and share the on-disk caches
+    pipeline = build_components(load_config())['pipeline']
+    pipeline.warm_up()
+    queue = JobQueue(db_path)
+    print(f"✓ Analysis worker {os.getpid()} ready")
+
+    # An orphaned worker is re-parented, so this cannot be fooled by PID reuse
+    while parent_pid is None or os.getppid() == parent_pid:
+        job = queue.claim()
+        if job is None:
+            time.sleep(poll_interval)
+            continue
+
+        done = threading.Event()
+        heartbeat = threading.Thread(
+            target=_keep_lease, args=(queue, job['job_id'], done), name='job-lease', daemon=True
+        )
+        heartbeat.start()
+        try:
+            resume_text = pipeline.resume_parser.extract_text_from_bytes(job['file_data'])
+            job_context = pipeline.prepare_job(job['job_description'])
+            result = pipeline.analyze(resume_text, job_context)
+            queue.complete(job['job_id'], result)
+        except Exception as e:
+            print(f"Error in job {job['job_id']}: {str(e)}")
+            queue.fail(job['job_id'], str(e))
+        finally:
+            done.set()
+            heartbeat.join()
+
+def _keep_lease(queue, job_id: str, done):
+    """Renew a job's lease until it finishes"""
+    while not done.wait(queue.lease_seconds / 3):
+        try:
+            queue.renew(job_id)
+        except sqlite3.Error as e:
+            print(f"⚠ Lease of job {job_id} not renewed: {e}")
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Run an analysis job worker')
+    parser.add_argument('--db', default='jobs.db', help='Path to the job database')
+    parser.add_argument('--poll-interval', type=float, default=0.5)
+    parser.add_argument('--parent-pid', type=int, default=None)
+    args = parser.parse_args()
+
+    run_worker(args.db, args.poll_interval, args.parent_pid)
@@ -0,0 +1,219 @@
+"""
+Job Description Registry - Precomputed job-side analysis reused by ID
+In-process LRU tier with an optional SQLite tier shared across workers
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from contextlib import contextmanager
+
+import numpy as np
+
+from utils.result_cache import normalize_job_description
+
+class JobRegistry:
+    """Content-addressed store of prepared job descriptions"""
+
+    def __init__(self, max_entries: int = 256, db_path: str = None):
+        """
+        Args:
+            max_entries: Maximum job descriptions kept in each tier
+            db_path: SQLite file for the shared tier (optional)
+        """
+        self.max_entries = max_entries
+        self.db_path = db_path
+        self.lock = threading.Lock()
+        self.entries = OrderedDict()  # job_id -> (version, created_at, job)
+        self.counters = {'hits': 0, 'misses': 0, 'evictions': 0}
+
+        if self.db_path:
+            with self._connect() as conn:
+                conn.execute('PRAGMA journal_mode=WAL')
+                conn.execute('''
+                    CREATE TABLE IF NOT EXISTS job_descriptions (
+                        id TEXT PRIMARY KEY,
+                        version TEXT NOT NULL,
+                        data BLOB NOT NULL,
+                        embedding BLOB,
+                        created_at REAL NOT NULL,
+                        last_used REAL NOT NULL
+                    )
+                ''')
+                conn.execute(
+                    'CREATE INDEX IF NOT EXISTS idx_job_descriptions_last_used '
+                    'ON job_descriptions (last_used)'
+                )
+
+    @staticmethod
+    def make_id(job_description: str) -> str:
+        """Content-addressed ID: identical postings (ignoring case/whitespace) share it"""
+        normalized = normalize_job_description(job_description)
+        return hashlib.sha256(normalized.encode('utf-8')).hexdigest()[:24]
+
+    @contextmanager
+    def _connect(self):
+        """Open a connection to the shared tier"""
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def register(self, job: dict, version: str) -> str:
+        """
+        Store a prepared job description
+
+        Args:
+            job: Output of AnalysisPipeline.prepare_job
+            version: Pipeline configuration version the job was prepared with
+
+        Returns:
+            Job description ID
+        """
+        job_id = self.make_id(job['text'])
+        job = compact_job(job)
+        now = time.time()
+
+        with self.lock:
+            self._store_memory(job_id, (version, now, job))
+
+        if self.db_path:
+            data, embedding = serialize_job(job)
+            with self._connect() as conn:
+                conn.execute(
+                    'INSERT OR REPLACE INTO job_descriptions '
+                    '(id, version, data, embedding, created_at, last_used) VALUES (?, ?, ?, ?, ?, ?)',
+                    (job_id, version, data, embedding, now, now)
+                )
+                conn.execute('''
+                    DELETE FROM job_descriptions WHERE id IN (
+                        SELECT id FROM job_descriptions
+                        ORDER BY last_used DESC LIMIT -1 OFFSET ?
+                    )
+                ''', (self.max_entries,))
+
+        return job_id
+
+    def get(self, job_id: str) -> dict:
+        """
+        Look up a prepared job description
+
+        Args:
+            job_id: ID returned by register
+
+        Returns:
+            Dictionary with job_id, version, created_at and job, or None
+        """
+        with self.lock:
+            entry = self.entries.get(job_id)
+            if entry is not None:
+                self.entries.move_to_end(job_id)
+                self.counters['hits'] += 1
+                return {'job_id': job_id, 'version': entry[0], 'created_at': entry[1], 'job': entry[2]}
+
+        if self.db_path:
+            with self._connect() as conn:
+                row = conn.execute(
+                    'SELECT version, data, embedding, created_at FROM job_descriptions WHERE id = ?',
+                    (job_id,)
+                ).fetchone()
+                if row is not None:
+                    conn.execute(
+                        'UPDATE job_descriptions SET last_used = ? WHERE id = ?',
+                        (time.time(), job_id)
+                    )
+            if row is not None:
+                job = deserialize_job(row[1], row[2])
+                with self.lock:
+                    self._store_memory(job_id, (row[0], row[3], job))
+                    self.counters['hits'] += 1
+                return {'job_id': job_id, 'version': row[0], 'created_at': row[3], 'job': job}
+
+        with self.lock:
+            self.counters['misses'] += 1
+        return None
+
+    def _store_memory(self, job_id, entry):
+        """Insert into the LRU tier (caller holds the lock)"""
+        self.entries[job_id] = entry
+        self.entries.move_to_end(job_id)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+            self.counters['evictions'] += 1
+
+    def stats(self) -> dict:
+        """Return hit/miss counters and tier sizes"""
+        with self.lock:
+            stats = dict(self.counters)
+            stats['memory_entries'] = len(self.entries)
+        stats['max_entries'] = self.max_entries
+
+        if self.db_path:
+            with self._connect() as conn:
+                stats['disk_entries'] = conn.execute(
+                    'SELECT COUNT(*) FROM job_descriptions'
+                ).fetchone()[0]
+
+        return stats
+
+def compact_job(job: dict) -> dict:
+    """
+    Keep only what the resume side needs, with a float32 embedding
+
+    Chunk embeddings stay in the in-process tier only; jobs read back from
+    SQLite get them again (from the embedding cache) on first use.
+
+    Args:
+        job: Output of AnalysisPipeline.prepare_job
+
+    Returns:
+        Job dictionary usable by AnalysisPipeline.analyze
+    """
+    nlp = job.get('nlp') or {}
+    embedding = nlp.get('embedding')
+    return {
+        'text': job['text'],
+        'clean': job['clean'],
+        'keywords': list(job['keywords']),
+        'skills': set(job['skills']),
+        'nlp': {
+            'embedding': np.asarray(embedding, dtype=np.float32) if embedding is not None else None,
+            'entities': nlp.get('entities', []),
+            'concepts': nlp.get('concepts', []),
+            'phrases': nlp.get('phrases', [])
+        },
+        'chunks': job.get('chunks')
+    }
+
+def serialize_job(job: dict) -> tuple:
+    """Encode a compact job as (compressed JSON, raw float32 embedding bytes)"""
+    fields = {key: job[key] for key in ('text', 'clean', 'keywords')}
+    fields['skills'] = sorted(job['skills'])
+    fields['entities'] = job['nlp']['entities']
+    fields['concepts'] = job['nlp']['concepts']
+    fields['phrases'] = job['nlp'].get('phrases', [])
+    data = zlib.compress(json.dumps(fields).encode('utf-8'))
+
+    embedding = job['nlp']['embedding']
+    return data, embedding.tobytes() if embedding is not None else None
+
+def deserialize_job(data: bytes, embedding: bytes) -> dict:
+    """Decode the output of serialize_job"""
+    fields = json.loads(zlib.decompress(data))
+    return {
+        'text': fields['text'],
+        'clean': fields['clean'],
+        'keywords': fields['keywords'],
+        'skills': set(fields['skills']),
+        'nlp': {
+            'embedding': np.frombuffer(embedding, dtype=np.float32) if embedding is not None else None,
+            'entities': fields['entities'],
+            'concepts': fields['concepts'],
+            'phrases': fields.get('phrases', [])
+        }
+    }
@@ -0,0 +1,40 @@
+"""
+Memory Utilities - Per-process memory accounting
+Reports unique (USS) and proportional (PSS) memory so forked workers can be sized
+"""
+
+import os
+
+def process_memory(pid: int = None) -> dict:
+    """
+    Read memory usage of a process from /proc (Linux)
+
+    Args:
+        pid: Process ID (defaults to the current process)
+
+    Returns:
+        Dictionary with rss, pss, uss and shared sizes in MB,
+        or an empty dictionary where /proc is unavailable
+    """
+    pid = pid or os.getpid()
+    fields = {}
+
+    try:
+        with open(f'/proc/{pid}/smaps_rollup') as file:
+            for line in file:
+                parts = line.split()
+                if len(parts) >= 2 and parts[0].endswith(':') and parts[1].isdigit():
+                    fields[parts[0][:-1]] = int(parts[1])  # kB
+    except OSError:
+        return {}
+
+    uss = fields.get('Private_Clean', 0) + fields.get('Private_Dirty', 0)
+    shared = fields.get('Shared_Clean', 0) + fields.get('Shared_Dirty', 0)
+
+    return {
+        'pid': pid,
+        'rss_mb': round(fields.get('Rss', 0) / 1024, 1),
+        'pss_mb': round(fields.get('Pss', 0) / 1024, 1),
+        'uss_mb': round(uss / 1024, 1),
+        'shared_mb': round(shared / 1024, 1)
+    }
@@ -0,0 +1,335 @@
+"""
+Metrics - Stage timing spans, counters and Prometheus text exposition
+Spans are no-ops when metrics are disabled and no request trace is active
+"""
+
+import os
+import threading
+import time
+
+# Latency buckets in seconds
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1,
+                   0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+class Counter:
+    """Monotonic counter with optional labels"""
+
+    type_name = 'counter'
+
+    def __init__(self, name: str, help_text: str, labelnames: tuple = ()):
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = tuple(labelnames)
+        self.values = {}
+        self.lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels):
+        """Increase the counter for a label set"""
+        key = _label_key(self.labelnames, labels)
+        with self.lock:
+            self.values[key] = self.values.get(key, 0) + amount
+
+    def samples(self):
+        """Yield (suffix, labels, value) tuples"""
+        with self.lock:
+            items = list(self.values.items())
+        for key, value in items:
+            yield '', key, value
+
+class Gauge(Counter):
+    """Value that can go up and down"""
+
+    type_name = 'gauge'
+
+    def set(self, value: float, **labels):
+        """Set the gauge for a label set"""
+        key = _label_key(self.labelnames, labels)
+        with self.lock:
+            self.values[key] = value
+
+class Histogram:
+    """Cumulative-bucket histogram with optional labels"""
+
+    type_name = 'histogram'
+
+    def __init__(self, name: str, help_text: str, labelnames: tuple = (),
+                 buckets: tuple = DEFAULT_BUCKETS):
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self.values = {}  # label key -> [bucket counts..., sum, count]
+        self.lock = threading.Lock()
+
+    def observe(self, value: float, **labels):
+        """Record one observation"""
+        key = _label_key(self.labelnames, labels)
+        with self.lock:
+            state = self.values.get(key)
+            if state is None:
+                state = self.values[key] = [0] * (len(self.buckets) + 2)
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state[i] += 1
+                    break
+            state[-2] += value
+            state[-1] += 1
+
+    def samples(self):
+        """Yield (suffix, labels, value) tuples with cumulative buckets"""
+        with self.lock:
+            items = [(key, list(state)) for key, state in self.values.items()]
+        for key, state in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets, state):
+                cumulative += count
+                yield '_bucket', key + (('le', _format_value(bound)),), cumulative
+            yield '_bucket', key + (('le', '+Inf'),), state[-1]
+            yield '_sum', key, state[-2]
+            yield '_count', key, state[-1]
+
+class MetricsRegistry:
+    """Collection of metrics rendered in Prometheus text format"""
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self.metrics = {}
+        self.lock = threading.Lock()
+
+    def _register(self, cls, name, *args, **kwargs):
+        """Return an existing metric or create it"""
+        with self.lock:
+            if name not in self.metrics:
+                self.metrics[name] = cls(name, *args, **kwargs)
+            return self.metrics[name]
+
+    def counter(self, name: str, help_text: str, labelnames: tuple = ()) -> Counter:
+        return self._register(Counter, name, help_text, labelnames)
+
+    def gauge(self, name: str, help_text: str, labelnames: tuple = ()) -> Gauge:
+        return self._register(Gauge, name, help_text, labelnames)
+
+    def histogram(self, name: str, help_text: str, labelnames: tuple = (),
+                  buckets: tuple = DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram, name, help_text, labelnames, buckets)
+
+    def render(self) -> str:
+        """Render every metric in Prometheus text exposition format"""
+        lines = []
+        with self.lock:
+            metrics = list(self.metrics.values())
+        for metric in metrics:
+            lines.append(f'# HELP {metric.name} {metric.help_text}')
+            lines.append(f'# TYPE {metric.name} {metric.type_name}')
+            for suffix, labels, value in metric.samples():
+                lines.append(f'{metric.name}{suffix}{_format_labels(labels)} {_format_value(value)}')
+        return '\n'.join(lines) + '\n'
+
+REGISTRY = MetricsRegistry(enabled=os.environ.get('METRICS_ENABLED', '1') == '1')
+
+STAGE_DURATION = REGISTRY.histogram(
+    'ats_stage_duration_seconds',
+    'Time spent in each analysis stage',
+    ('stage',)
+)
+
+REQUESTS = REGISTRY.counter(
+    'ats_requests_total',
+    'HTTP requests by endpoint and status code',
+    ('endpoint', 'status')
+)
+
+REQUEST_DURATION = REGISTRY.histogram(
+    'ats_request_duration_seconds',
+    'End-to-end HTTP request latency',
+    ('endpoint',)
+)
+
+INPUT_DOCUMENTS = REGISTRY.counter(
+    'ats_input_documents_total',
+    'Uploaded documents parsed, by detected file type',
+    ('file_type',)
+)
+
+INPUT_PAGES = REGISTRY.counter(
+    'ats_input_pages_total',
+    'PDF pages parsed'
+)
+
+INPUT_CHARACTERS = REGISTRY.counter(
+    'ats_input_characters_total',
+    'Characters of raw text analyzed',
+    ('document',)
+)
+
+INPUT_TOKENS = REGISTRY.counter(
+    'ats_input_tokens_total',
+    'Whitespace tokens of cleaned text analyzed',
+    ('document',)
+)
+
+ENCODE_QUEUE_DEPTH = REGISTRY.gauge(
+    'ats_encode_queue_depth',
+    'Texts waiting in the embedding micro-batch queue'
+)
+
+ENCODE_BATCH_SIZE = REGISTRY.histogram(
+    'ats_encode_batch_size',
+    'Texts per micro-batched embedding forward pass',
+    buckets=(1, 2, 4, 8, 16, 32, 64, 128, 256)
+)
+
+ENCODE_WAIT = REGISTRY.histogram(
+    'ats_encode_wait_seconds',
+    'Time an encode request waited in the micro-batch queue',
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+)
+
+def record_document(file_type: str, pages):
+    """Count a parsed upload and its pages"""
+    if REGISTRY.enabled:
+        INPUT_DOCUMENTS.inc(file_type=file_type)
+        if pages:
+            INPUT_PAGES.inc(pages)
+    if pages:
+        record('pages', pages)
+
+def record_input_size(document: str, characters: int, tokens: int):
+    """Count characters and tokens for a resume or job description"""
+    if REGISTRY.enabled:
+        INPUT_CHARACTERS.inc(characters, document=document)
+        INPUT_TOKENS.inc(tokens, document=document)
+    record(f'{document}_characters', characters)
+    record(f'{document}_tokens', tokens)
+
+# ============================================================================
+# REQUEST TRACES AND SPANS
+# ============================================================================
+
+_local = threading.local()
+
+class RequestTrace:
+    """Per-request stage timings and input sizes for structured logging"""
+
+    def __init__(self, request_id: str, endpoint: str):
+        self.request_id = request_id
+        self.endpoint = endpoint
+        self.start = time.perf_counter()
+        self.stages = {}
+        self.fields = {}
+        self.lock = threading.Lock()  # stages may run on pool threads
+
+    def add_stage(self, stage: str, duration: float):
+        """Accumulate time spent in a stage"""
+        with self.lock:
+            self.stages[stage] = self.stages.get(stage, 0.0) + duration
+
+    def record(self, key: str, value):
+        """Attach a field (e.g. input size) to the log line, summing numbers"""
+        with self.lock:
+            if isinstance(value, (int, float)) and key in self.fields:
+                self.fields[key] += value
+            else:
+                self.fields[key] = value
+
+    def to_dict(self) -> dict:
+        """Serialize for a structured log line"""
+        return {
+            'request_id': self.request_id,
+            'endpoint': self.endpoint,
+            'duration_ms': round((time.perf_counter() - self.start) * 1000, 2),
+            'stages_ms': {stage: round(duration * 1000, 2)
+                          for stage, duration in self.stages.items()},
+            **self.fields
+        }
+
+def start_trace(request_id: str, endpoint: str) -> RequestTrace:
+    """Begin collecting a trace for the current thread"""
+    trace = RequestTrace(request_id, endpoint)
+    _local.trace = trace
+    return trace
+
+def end_trace():
+    """Stop collecting and return the current thread's trace (or None)"""
+    trace = getattr(_local, 'trace', None)
+    _local.trace = None
+    return trace
+
+def attach_trace(trace):
+    """Continue a trace on the current thread (e.g. inside a streamed response)"""
+    _local.trace = trace
+
+def current_trace():
+    """Return the current thread's trace (or None)"""
+    return getattr(_local, 'trace', None)
+
+def record(key: str, value):
+    """Attach a field to the current trace, if any"""
+    trace = getattr(_local, 'trace', None)
+    if trace is not None:
+        trace.record(key, value)
+
+class _Span:
+    """Times a block and reports it to the histogram and the active trace"""
+
+    __slots__ = ('stage', 'trace', 'start')
+
+    def __init__(self, stage, trace):
+        self.stage = stage
+        self.trace = trace
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        duration = time.perf_counter() - self.start
+        if REGISTRY.enabled:
+            STAGE_DURATION.observe(duration, stage=self.stage)
+        if self.trace is not None:
+            self.trace.add_stage(self.stage, duration)
+        return False
+
+class _NullSpan:
+    """Span used when nothing would consume the timing"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+_NULL_SPAN = _NullSpan()
+
+def span(stage: str):
+    """
+    Time an analysis stage
+
+    Usage:
+        with span('parse'):
+            text = parser.extract_text_from_bytes(data)
+    """
+    trace = getattr(_local, 'trace', None)
+    if trace is None and not REGISTRY.enabled:
+        return _NULL_SPAN
+    return _Span(stage, trace)
+
+def _label_key(labelnames, labels) -> tuple:
+    """Build a hashable label key in declared order"""
+    return tuple((name, str(labels.get(name, ''))) for name in labelnames)
+
+def _format_labels(labels) -> str:
+    """Format a label key as {a="b",...}"""
+    if not labels:
+        return ''
+    parts = []
+    for name, value in labels:
+        value = value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+        parts.append(f'{name}="{value}"')
+    return '{' + ','.join(parts) + '}'
+
+def _format_value(value) -> str:
+    """Format a sample value"""
+    if isinstance(value, float):
+        return repr(value)
+    return str(value)
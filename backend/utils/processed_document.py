@@ -0,0 +1,82 @@
+"""
+Processed Document - One input text and everything derived from it
+Each artifact is computed at most once and shared by every component
+"""
+
+from collections import Counter
+
+from utils.text_processing import clean_text, keywords_from_counts, tokenize
+
+class ProcessedDocument:
+    """
+    A resume or job description with lazily computed artifacts
+
+    Text artifacts (lowercased and cleaned text, tokens, token counts,
+    keywords) are computed on first access. Model artifacts (the spaCy Doc
+    of the cleaned text, its embedding, chunk embeddings, skill hits) start
+    as None; the component that produces one stores it here and later
+    callers reuse it. Documents live for one analysis, so model artifacts
+    are not keyed by model, profile or taxonomy version.
+
+    ResumeParser, SkillExtractor, NLPAnalyzer and ATSScorer accept a
+    ProcessedDocument wherever they take the text.
+    """
+
+    def __init__(self, text: str, clean: str = None, doc=None, embedding=None,
+                 chunks: dict = None):
+        """
+        Args:
+            text: Raw text
+            clean: Precomputed cleaned text (optional)
+            doc: Precomputed spaCy Doc of the cleaned text (optional)
+            embedding: Precomputed embedding of the cleaned text (optional)
+            chunks: Precomputed chunk embeddings (optional)
+        """
+        self.text = text
+        self.doc = doc
+        self.embedding = embedding
+        self.chunks = chunks
+        self.skill_hits = None  # [(skill, start, end)] in text order
+        self._lower = None
+        self._clean = clean
+        self._tokens = None
+        self._token_counts = None
+        self._keywords = {}
+
+    @property
+    def lower(self) -> str:
+        """Lowercased raw text"""
+        if self._lower is None:
+            self._lower = self.text.lower()
+        return self._lower
+
+    @property
+    def clean(self) -> str:
+        """Output of clean_text"""
+        if self._clean is None:
+            self._clean = clean_text(self.lower, lowercased=True)
+        return self._clean
+
+    @property
+    def tokens(self) -> list:
+        """Keyword tokens of the cleaned text"""
+        if self._tokens is None:
+            self._tokens = tokenize(self.clean, lowercased=True)
+        return self._tokens
+
+    @property
+    def token_counts(self) -> Counter:
+        """Occurrences of each token, in first-occurrence order"""
+        if self._token_counts is None:
+            self._token_counts = Counter(self.tokens)
+        return self._token_counts
+
+    def keywords(self, top_n: int = 50) -> list:
+        """Top keywords, as extract_keywords(clean) returns them"""
+        if top_n not in self._keywords:
+            self._keywords[top_n] = keywords_from_counts(self.token_counts, top_n)
+        return self._keywords[top_n]
+
+def as_document(text) -> ProcessedDocument:
+    """Wrap raw text in a ProcessedDocument (documents are returned as they are)"""
+    return text if isinstance(text, ProcessedDocument) else ProcessedDocument(text)
@@ -0,0 +1,182 @@
+"""
+Result Cache - Reuse analysis results for repeated submissions
+In-process LRU tier with an optional SQLite tier shared across workers
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+
+class ResultCache:
+    """Two-tier cache of analysis results keyed by content hash"""
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float = 3600,
+                 db_path: str = None):
+        """
+        Args:
+            max_entries: Maximum entries kept in memory
+            ttl_seconds: Time to live for every entry
+            db_path: SQLite file for the shared tier (optional)
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.db_path = db_path
+        self.lock = threading.Lock()
+        self.entries = OrderedDict()  # key -> (expires_at, value)
+        self.counters = {
+            'hits': 0,
+            'memory_hits': 0,
+            'disk_hits': 0,
+            'misses': 0,
+            'evictions': 0
+        }
+
+        if self.db_path:
+            with self._connect() as conn:
+                conn.execute('PRAGMA journal_mode=WAL')
+                conn.execute('''
+                    CREATE TABLE IF NOT EXISTS results (
+                        key TEXT PRIMARY KEY,
+                        value TEXT NOT NULL,
+                        expires_at REAL NOT NULL
+                    )
+                ''')
+
+    @staticmethod
+    def make_key(resume_data: bytes, job_description: str, version: str) -> str:
+        """
+        Build a cache key
+
+        Args:
+            resume_data: Raw resume file contents
+            job_description: Job description text
+            version: Scorer/pipeline configuration version
+
+        Returns:
+            Hex SHA-256 key
+        """
+        digest = hashlib.sha256()
+        digest.update(hashlib.sha256(resume_data).digest())
+        digest.update(normalize_job_description(job_description).encode('utf-8'))
+        digest.update(b'\0')
+        digest.update(version.encode('utf-8'))
+        return digest.hexdigest()
+
+    @contextmanager
+    def _connect(self):
+        """Open a connection to the shared tier"""
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def get(self, key: str):
+        """
+        Look up a cached result
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            Cached result dictionary, or None on a miss
+        """
+        now = time.time()
+
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self.entries.move_to_end(key)
+                    self.counters['hits'] += 1
+                    self.counters['memory_hits'] += 1
+                    return entry[1]
+                del self.entries[key]
+
+        if self.db_path:
+            with self._connect() as conn:
+                row = conn.execute(
+                    'SELECT value, expires_at FROM results WHERE key = ? AND expires_at > ?',
+                    (key, now)
+                ).fetchone()
+            if row is not None:
+                value = json.loads(row[0])
+                with self.lock:
+                    self._store_memory(key, value, row[1])
+                    self.counters['hits'] += 1
+                    self.counters['disk_hits'] += 1
+                return value
+
+        with self.lock:
+            self.counters['misses'] += 1
+        return None
+
+    def set(self, key: str, value: dict):
+        """
+        Store a result in every tier
+
+        Args:
+            key: Cache key from make_key
+            value: JSON-serializable result
+        """
+        expires_at = time.time() + self.ttl_seconds
+
+        with self.lock:
+            self._store_memory(key, value, expires_at)
+
+        if self.db_path:
+            with self._connect() as conn:
+                conn.execute(
+                    'INSERT OR REPLACE INTO results (key, value, expires_at) VALUES (?, ?, ?)',
+                    (key, json.dumps(value), expires_at)
+                )
+                conn.execute('DELETE FROM results WHERE expires_at <= ?', (time.time(),))
+
+    def _store_memory(self, key, value, expires_at):
+        """Insert into the LRU tier (caller holds the lock)"""
+        self.entries[key] = (expires_at, value)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+            self.counters['evictions'] += 1
+
+    def clear(self):
+        """Drop every cached result"""
+        with self.lock:
+            self.entries.clear()
+        if self.db_path:
+            with self._connect() as conn:
+                conn.execute('DELETE FROM results')
+
+    def stats(self) -> dict:
+        """Return hit/miss counters and tier sizes"""
+        with self.lock:
+            stats = dict(self.counters)
+            stats['memory_entries'] = len(self.entries)
+
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = round(stats['hits'] / lookups, 4) if lookups else 0.0
+        stats['max_entries'] = self.max_entries
+        stats['ttl_seconds'] = self.ttl_seconds
+
+        if self.db_path:
+            with self._connect() as conn:
+                stats['disk_entries'] = conn.execute(
+                    'SELECT COUNT(*) FROM results'
+                ).fetchone()[0]
+
+        return stats
+
+def normalize_job_description(text: str) -> str:
+    """
+    Collapse case and whitespace so trivially different postings share a key
+
+    Line breaks are kept: chunked embeddings split sections on them, so
+    postings that differ only in line layout can score differently.
+    """
+    lines = (' '.join(line.split()) for line in text.lower().splitlines())
+    return '\n'.join(lines).strip()
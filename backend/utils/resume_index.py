@@ -0,0 +1,417 @@
+"""
+Resume Index - Stored resumes with a memory-mapped embedding matrix
+Exact top-k by matrix product, plus an optional IVF index for large corpora
+"""
+
+import fcntl
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from contextlib import contextmanager
+
+import numpy as np
+
+# Rows scored per matrix product, bounding temporary memory
+SEARCH_CHUNK_ROWS = 65536
+
+# Rows sampled to train IVF centroids
+IVF_TRAIN_SAMPLE = 100000
+
+class ResumeIndex:
+    """
+    Resume corpus on disk
+
+    Files in the index directory:
+        vectors.f32  L2-normalized float32 embeddings, one row per resume
+        meta.db      SQLite: row number, resume ID, filename, compressed text,
+                     embedding dimension and version
+        ivf.npz      IVF centroids, inverted lists and embedding version
+                     (after build_ivf)
+
+    Embeddings from another model, backend or chunking setup are not
+    comparable, so an index refuses to add or search once the embedding
+    version it was created with differs from the current one.
+    """
+
+    def __init__(self, directory: str, embedding_version: str = None):
+        """
+        Open (and create if needed) the index in a directory
+
+        Args:
+            directory: Index directory
+            embedding_version: Model, backend and chunking settings of the
+                embeddings (recorded by a new index and checked by an existing one)
+        """
+        self.directory = directory
+        self.embedding_version = embedding_version
+        os.makedirs(directory, exist_ok=True)
+        self.vectors_path = os.path.join(directory, 'vectors.f32')
+        self.db_path = os.path.join(directory, 'meta.db')
+        self.ivf_path = os.path.join(directory, 'ivf.npz')
+        self.lock_path = os.path.join(directory, '.lock')
+
+        self.lock = threading.Lock()
+        self._matrix = None  # memmap of the rows that have metadata
+        self._ivf = None
+        self._ivf_mtime = None
+
+        with self._connect() as conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS resumes (
+                    row INTEGER PRIMARY KEY,
+                    resume_id TEXT UNIQUE NOT NULL,
+                    filename TEXT,
+                    text BLOB NOT NULL,
+                    added_at REAL NOT NULL
+                )
+            ''')
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS settings (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL
+                )
+            ''')
+            if embedding_version is not None:
+                # Indexes created before versions were recorded adopt the current
+                # one, and an index with no resumes yet takes the current one
+                empty = conn.execute('SELECT COUNT(*) FROM resumes').fetchone()[0] == 0
+                conn.execute(
+                    f"INSERT OR {'REPLACE' if empty else 'IGNORE'} INTO settings (key, value) "
+                    "VALUES ('embedding_version', ?)",
+                    (embedding_version,)
+                )
+            row = conn.execute("SELECT value FROM settings WHERE key = 'embedding_version'").fetchone()
+        self.stored_version = row[0] if row else None
+
+    @staticmethod
+    def make_id(resume_data: bytes) -> str:
+        """Content-addressed resume ID"""
+        return hashlib.sha256(resume_data).hexdigest()[:24]
+
+    @contextmanager
+    def _connect(self):
+        """Open a connection to the metadata database"""
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    @contextmanager
+    def _write_lock(self):
+        """Serialize writers across threads and processes"""
+        with self.lock:
+            with open(self.lock_path, 'w') as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def check_version(self):
+        """Raise ValueError if the stored embeddings come from other settings"""
+        if self.embedding_version is not None and self.stored_version != self.embedding_version:
+            raise ValueError(
+                f"Resume index '{self.directory}' holds embeddings for '{self.stored_version}', "
+                f"not '{self.embedding_version}'. Re-add the resumes to a new RESUME_INDEX_DIR"
+            )
+
+    def dimension(self):
+        """Embedding dimension, or None while the index is empty"""
+        with self._connect() as conn:
+            row = conn.execute("SELECT value FROM settings WHERE key = 'dimension'").fetchone()
+        return int(row[0]) if row else None
+
+    def count(self) -> int:
+        """Number of stored resumes"""
+        with self._connect() as conn:
+            return conn.execute('SELECT COUNT(*) FROM resumes').fetchone()[0]
+
+    def add(self, items: list) -> list:
+        """
+        Store resumes with their embeddings
+
+        Args:
+            items: List of dicts with resume_id, filename, text and embedding
+
+        Returns:
+            List of dicts with resume_id and added (False if already stored)
+        """
+        if not items:
+            return []
+        self.check_version()
+
+        vectors = normalize_rows(np.asarray([item['embedding'] for item in items], dtype=np.float32))
+        results = []
+
+        with self._write_lock():
+            with self._connect() as conn:
+                dimension = self.dimension()
+                if dimension is None:
+                    dimension = vectors.shape[1]
+                    conn.execute(
+                        "INSERT INTO settings (key, value) VALUES ('dimension', ?)",
+                        (str(dimension),)
+                    )
+                elif dimension != vectors.shape[1]:
+                    raise ValueError(
+                        f"Embedding dimension {vectors.shape[1]} does not match index dimension {dimension}"
+                    )
+
+                existing = {
+                    row[0] for row in conn.execute(
+                        f"SELECT resume_id FROM resumes WHERE resume_id IN ({','.join('?' * len(items))})",
+                        [item['resume_id'] for item in items]
+                    )
+                }
+
+                # Rows are numbered by position in the vectors file; vectors are
+                # written before their metadata so readers never see a short file.
+                # Anything past the last row with metadata was left by a crashed
+                # writer (a partial row would shift every later one), so drop it
+                next_row = conn.execute('SELECT COALESCE(MAX(row) + 1, 0) FROM resumes').fetchone()[0]
+                row_bytes = dimension * 4
+                if os.path.exists(self.vectors_path) \
+                        and os.path.getsize(self.vectors_path) > next_row * row_bytes:
+                    os.truncate(self.vectors_path, next_row * row_bytes)
+                new_rows = []
+                with open(self.vectors_path, 'ab') as file:
+                    for item, vector in zip(items, vectors):
+                        if item['resume_id'] in existing:
+                            results.append({'resume_id': item['resume_id'], 'added': False})
+                            continue
+                        existing.add(item['resume_id'])
+                        file.write(vector.tobytes())
+                        new_rows.append((
+                            next_row,
+                            item['resume_id'],
+                            item.get('filename'),
+                            zlib.compress(item['text'].encode('utf-8')),
+                            time.time()
+                        ))
+                        results.append({'resume_id': item['resume_id'], 'added': True})
+                        next_row += 1
+
+                conn.executemany(
+                    'INSERT INTO resumes (row, resume_id, filename, text, added_at) VALUES (?, ?, ?, ?, ?)',
+                    new_rows
+                )
+
+        return results
+
+    def get(self, resume_ids: list) -> dict:
+        """
+        Load stored resumes
+
+        Args:
+            resume_ids: Resume IDs
+
+        Returns:
+            {resume_id: {'resume_id', 'filename', 'text', 'row'}}
+        """
+        if not resume_ids:
+            return {}
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"SELECT row, resume_id, filename, text FROM resumes "
+                f"WHERE resume_id IN ({','.join('?' * len(resume_ids))})",
+                list(resume_ids)
+            ).fetchall()
+        return {
+            resume_id: {
+                'resume_id': resume_id,
+                'filename': filename,
+                'text': zlib.decompress(text).decode('utf-8'),
+                'row': row
+            }
+            for row, resume_id, filename, text in rows
+        }
+
+    def vectors(self, rows) -> np.ndarray:
+        """Stored (normalized) embeddings for row numbers"""
+        self.check_version()
+        return np.asarray(self._load_matrix()[np.asarray(rows, dtype=np.int64)])
+
+    def _load_matrix(self):
+        """Memory-map every row that has metadata (reopened as the index grows)"""
+        with self._connect() as conn:
+            rows = conn.execute('SELECT COALESCE(MAX(row) + 1, 0) FROM resumes').fetchone()[0]
+
+        with self.lock:
+            if self._matrix is None or self._matrix.shape[0] != rows:
+                dimension = self.dimension()
+                if rows == 0 or dimension is None:
+                    self._matrix = np.zeros((0, dimension or 0), dtype=np.float32)
+                else:
+                    self._matrix = np.memmap(
+                        self.vectors_path, dtype=np.float32, mode='r', shape=(rows, dimension)
+                    )
+            return self._matrix
+
+    def search(self, query, k: int = 50, approximate: bool = False, nprobe: int = 8) -> list:
+        """
+        Find the resumes most similar to a query embedding
+
+        Args:
+            query: Query embedding (e.g. a job description)
+            k: Number of results
+            approximate: Use the IVF index if one has been built
+            nprobe: IVF lists to scan per query
+
+        Returns:
+            List of (resume_id, row, cosine similarity), best first
+        """
+        self.check_version()
+        matrix = self._load_matrix()
+        if matrix.shape[0] == 0 or k <= 0:
+            return []
+
+        query = normalize_rows(np.asarray(query, dtype=np.float32).reshape(1, -1))[0]
+        ivf = self._load_ivf() if approximate else None
+
+        rows = None
+        if ivf is not None:
+            rows, scores = self._search_ivf(matrix, ivf, query, nprobe)
+        if rows is None or rows.size == 0:
+            # No IVF index, or every probed list is empty: exact scan
+            rows = None
+            scores = np.empty(matrix.shape[0], dtype=np.float32)
+            for start in range(0, matrix.shape[0], SEARCH_CHUNK_ROWS):
+                scores[start:start + SEARCH_CHUNK_ROWS] = matrix[start:start + SEARCH_CHUNK_ROWS] @ query
+
+        k = min(k, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        top_rows = rows[top] if rows is not None else top
+
+        with self._connect() as conn:
+            ids = dict(conn.execute(
+                f"SELECT row, resume_id FROM resumes WHERE row IN ({','.join('?' * len(top_rows))})",
+                [int(row) for row in top_rows]
+            ).fetchall())
+
+        # Rows without metadata (an interrupted add) are skipped
+        return [(ids[int(row)], int(row), float(scores[i]))
+                for row, i in zip(top_rows, top) if int(row) in ids]
+
+    def _search_ivf(self, matrix, ivf, query, nprobe):
+        """Score only rows in the nearest IVF lists, plus rows added after the build (may be none)"""
+        centroids, list_rows, offsets, covered = ivf
+        nprobe = max(1, min(nprobe, len(centroids)))
+        lists = np.argpartition(-(centroids @ query), nprobe - 1)[:nprobe]
+
+        candidates = [list_rows[offsets[i]:offsets[i + 1]] for i in lists]
+        if matrix.shape[0] > covered:
+            candidates.append(np.arange(covered, matrix.shape[0], dtype=np.int64))
+        rows = np.sort(np.concatenate(candidates)) if candidates else np.empty(0, dtype=np.int64)
+
+        return rows, np.asarray(matrix[rows] @ query, dtype=np.float32)
+
+    def build_ivf(self, n_lists: int = None, iterations: int = 10, seed: int = 0) -> dict:
+        """
+        Cluster stored embeddings into an inverted-file index (spherical k-means)
+
+        Args:
+            n_lists: Number of clusters (default: about sqrt of the corpus size)
+            iterations: k-means iterations
+            seed: Random seed for initialization and sampling
+
+        Returns:
+            Dictionary describing the built index
+        """
+        matrix = self._load_matrix()
+        count = matrix.shape[0]
+        if count == 0:
+            raise ValueError("Index is empty")
+
+        n_lists = max(1, min(n_lists or int(np.sqrt(count)), count))
+        rng = np.random.default_rng(seed)
+
+        sample_rows = np.sort(rng.choice(count, min(count, IVF_TRAIN_SAMPLE), replace=False))
+        sample = np.asarray(matrix[sample_rows])
+        centroids = sample[rng.choice(len(sample), n_lists, replace=False)].copy()
+
+        for _ in range(iterations):
+            assignment = np.argmax(sample @ centroids.T, axis=1)
+            for cluster in range(n_lists):
+                members = sample[assignment == cluster]
+                if len(members):
+                    centroids[cluster] = members.mean(axis=0)
+                else:
+                    # Re-seed empty clusters from a random sample row
+                    centroids[cluster] = sample[rng.integers(len(sample))]
+            centroids = normalize_rows(centroids)
+
+        # Assign every stored row to its nearest centroid
+        assignment = np.empty(count, dtype=np.int32)
+        for start in range(0, count, SEARCH_CHUNK_ROWS):
+            block = matrix[start:start + SEARCH_CHUNK_ROWS]
+            assignment[start:start + len(block)] = np.argmax(block @ centroids.T, axis=1)
+
+        list_rows = np.argsort(assignment, kind='stable').astype(np.int64)
+        offsets = np.searchsorted(assignment[list_rows], np.arange(n_lists + 1)).astype(np.int64)
+
+        with self._write_lock():
+            temp_path = self.ivf_path + '.tmp.npz'
+            np.savez(temp_path, centroids=centroids, rows=list_rows, offsets=offsets,
+                     covered=np.array([count], dtype=np.int64),
+                     embedding_version=np.array(self.stored_version or ''))
+            os.replace(temp_path, self.ivf_path)
+
+        sizes = np.diff(offsets)
+        return {
+            'n_lists': n_lists,
+            'rows': count,
+            'largest_list': int(sizes.max()),
+            'empty_lists': int((sizes == 0).sum())
+        }
+
+    def _load_ivf(self):
+        """
+        Load the IVF index if present (reloaded when the file changes)
+
+        An IVF built for other embeddings (or before its version was
+        recorded) is ignored until build_ivf replaces it.
+        """
+        try:
+            mtime = os.path.getmtime(self.ivf_path)
+        except OSError:
+            return None
+
+        with self.lock:
+            if self._ivf_mtime != mtime:
+                with np.load(self.ivf_path) as data:
+                    version = str(data['embedding_version']) if 'embedding_version' in data else None
+                    if version and version == self.stored_version:
+                        self._ivf = (
+                            data['centroids'], data['rows'], data['offsets'], int(data['covered'][0])
+                        )
+                    else:
+                        self._ivf = None
+                        print(f"⚠ Ignoring IVF index built for embeddings '{version}'; "
+                              f"run build_ivf again")
+                self._ivf_mtime = mtime
+            return self._ivf
+
+    def stats(self) -> dict:
+        """Return corpus size and index details"""
+        ivf = self._load_ivf()
+        return {
+            'resumes': self.count(),
+            'dimension': self.dimension(),
+            'embedding_version': self.stored_version,
+            'embedding_version_matches': self.embedding_version is None
+            or self.stored_version == self.embedding_version,
+            'ivf_lists': len(ivf[0]) if ivf else None,
+            'ivf_covered_rows': ivf[3] if ivf else None
+        }
+
+def normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """L2-normalize each row (zero rows stay zero)"""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return (matrix / norms).astype(np.float32)
@@ -1,17 +1,174 @@
 """
 Skill Extraction - Extract technical and soft skills from text
-Uses predefined skill database and pattern matching
+Uses the built-in or an external taxonomy, compiled into an index and matcher
 """
 
-import re
-import json
+import fcntl
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+from utils.processed_document import ProcessedDocument
+from utils.skill_index import SkillIndex, build_index
+from utils.skill_matcher import count_matches
+
+# Alternative names for skills in the built-in database
+DEFAULT_ALIASES = {
+    'k8s': 'kubernetes',
+    'postgres': 'postgresql',
+    'golang': 'go',
+    'nodejs': 'node.js',
+    'reactjs': 'react',
+    'vue.js': 'vue',
+    'mongo': 'mongodb',
+    'sklearn': 'scikit-learn',
+    'amazon web services': 'aws',
+    'google cloud platform': 'google cloud'
+}
 
 class SkillExtractor:
     """Extract skills from resume and job description"""
     
-    def __init__(self):
-        """Initialize with skills database"""
-        self.skills_db = self._load_skills_database()
+    def __init__(self, taxonomy_path: str = None, index_path: str = None,
+                 reload_interval: float = 5.0):
+        """
+        Initialize with the built-in skills database or an external taxonomy
+        
+        Args:
+            taxonomy_path: JSON taxonomy, compiled into index_path when newer (optional)
+            index_path: Compiled index file (default: taxonomy_path + '.idx')
+            reload_interval: Seconds between checks for a changed taxonomy or
+                replaced index file, reloaded in the background (0 disables; use reload())
+        """
+        self.taxonomy_path = taxonomy_path
+        self.index_path = index_path or (f'{taxonomy_path}.idx' if taxonomy_path else None)
+        self.reload_interval = reload_interval
+        self.lock = threading.Lock()
+        self.checked_at = time.monotonic()
+        self.file_state = None
+        self.failed_state = None
+        self.reload_thread = None
+        self.reload_thread_lock = threading.Lock()
+        
+        if self.index_path:
+            self.reload()
+        else:
+            self.index = SkillIndex.from_taxonomy({
+                'categories': self._load_skills_database(),
+                'aliases': DEFAULT_ALIASES
+            })
+    
+    def reload(self, rebuild: bool = True) -> dict:
+        """
+        Load the index file, compiling the taxonomy first if it is newer
+        
+        The new index replaces the old one in a single assignment, so
+        concurrent extractions see either taxonomy, never a mix.
+        
+        Args:
+            rebuild: Compile the taxonomy if the index is missing or older
+            
+        Returns:
+            Index metadata, with 'rebuilt' set if the taxonomy was compiled
+        """
+        if not self.index_path:
+            raise ValueError("No skills taxonomy file configured")
+        
+        with self.lock:
+            rebuilt = False
+            if rebuild and self.taxonomy_path:
+                with self._build_lock():
+                    # Checked under the lock: another process may just have compiled it
+                    if self._stale():
+                        build_index(self.taxonomy_path, self.index_path)
+                        rebuilt = True
+            
+            file_state = self._file_state()
+            self.index = SkillIndex.open(self.index_path)
+            self.file_state = file_state
+            self.checked_at = time.monotonic()
+        
+        print(f"✓ Loaded skills taxonomy {self.index.version}: {self.index.skill_count} skills, "
+              f"{self.index.alias_count} aliases")
+        return dict(self.index.meta, rebuilt=rebuilt)
+    
+    @contextmanager
+    def _build_lock(self):
+        """Let one process at a time compile the taxonomy"""
+        with open(f'{self.index_path}.lock', 'w') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+    
+    def _stale(self) -> bool:
+        """Whether the taxonomy file is newer than its index"""
+        try:
+            index_mtime = os.stat(self.index_path).st_mtime_ns
+        except OSError:
+            index_mtime = None
+        try:
+            taxonomy_mtime = os.stat(self.taxonomy_path).st_mtime_ns
+        except OSError as e:
+            raise ValueError(f"{self.taxonomy_path}: {e.strerror}") from e
+        return index_mtime is None or taxonomy_mtime > index_mtime
+    
+    def _file_state(self) -> tuple:
+        """Identity of the index file and taxonomy modification time"""
+        state = []
+        for path in (self.index_path, self.taxonomy_path):
+            try:
+                stat = os.stat(path) if path else None
+            except OSError:
+                stat = None
+            state.append(stat and (stat.st_ino, stat.st_mtime_ns, stat.st_size))
+        return tuple(state)
+    
+    def refresh(self):
+        """
+        Start a background reload if the taxonomy changed or another process
+        replaced the index
+        
+        Never compiles or loads in the caller: extractions keep using the
+        loaded index until the reload thread swaps in the new one.
+        """
+        if not self.index_path or self.reload_interval <= 0:
+            return
+        if time.monotonic() - self.checked_at < self.reload_interval:
+            return
+        self.checked_at = time.monotonic()
+        
+        state = self._file_state()
+        if state == self.file_state or state == self.failed_state:
+            return
+        with self.reload_thread_lock:
+            if self.reload_thread is not None and self.reload_thread.is_alive():
+                return
+            self.reload_thread = threading.Thread(
+                target=self._reload_in_background, args=(state,),
+                name='skills-reload', daemon=True
+            )
+            self.reload_thread.start()
+    
+    def _reload_in_background(self, state: tuple):
+        """Reload, remembering a taxonomy that failed so it is not retried"""
+        try:
+            self.reload()
+        except Exception as e:
+            # Keep serving the loaded taxonomy until the files change again
+            self.failed_state = state
+            print(f"⚠ Skills taxonomy not reloaded: {e}")
+    
+    def config_version(self) -> str:
+        """Return the version of the loaded taxonomy"""
+        self.refresh()
+        return self.index.version
+    
+    def info(self) -> dict:
+        """Loaded taxonomy metadata"""
+        return dict(self.index.meta, path=self.index_path)
     
     def _load_skills_database(self) -> dict:
         """Load comprehensive skills database"""
@@ -74,28 +231,38 @@ class SkillExtractor:
             ]
         }
     
-    def extract_skills(self, text: str) -> set:
+    def _find(self, text) -> list:
+        """Skill occurrences, scanned once per ProcessedDocument"""
+        self.refresh()
+        if not isinstance(text, ProcessedDocument):
+            return self.index.matcher.find(text)
+        if text.skill_hits is None:
+            text.skill_hits = self.index.matcher.find(text.text)
+        return text.skill_hits
+    
+    def extract_skills(self, text) -> set:
         """
         Extract skills from text
         
         Args:
-            text: Resume or job description text
+            text: Resume or job description text, or ProcessedDocument
             
         Returns:
             Set of identified skills
         """
-        text_lower = text.lower()
-        found_skills = set()
-        
-        # Check each skill category
-        for category, skills in self.skills_db.items():
-            for skill in skills:
-                # Use word boundaries for exact matching
-                pattern = r'\b' + re.escape(skill) + r'\b'
-                if re.search(pattern, text_lower):
-                    found_skills.add(skill)
+        return {skill for skill, _, _ in self._find(text)}
+    
+    def find_skills(self, text) -> dict:
+        """
+        Find skills with their occurrence counts and positions
         
-        return found_skills
+        Args:
+            text: Resume or job description text, or ProcessedDocument
+            
+        Returns:
+            Dictionary mapping each skill to its count and [start, end] offsets
+        """
+        return count_matches(self._find(text))
     
     def categorize_skills(self, skills: set) -> dict:
         """
@@ -107,18 +274,52 @@ class SkillExtractor:
         Returns:
             Dictionary of categorized skills
         """
+        self.refresh()
+        index = self.index
         categorized = {}
         
-        for category, skill_list in self.skills_db.items():
-            category_skills = [skill for skill in skills if skill in skill_list]
-            if category_skills:
-                categorized[category] = category_skills
+        for skill in skills:
+            skill_id = index.skill_id(skill)
+            if skill_id is None:
+                continue
+            for category in index.categories_of(skill_id):
+                categorized.setdefault(category, []).append(skill)
         
-        return categorized
+        return {
+            category: categorized[category]
+            for category in index.category_names if category in categorized
+        }
     
     def get_skills_database(self) -> dict:
         """Return the complete skills database"""
-        return self.skills_db
+        self.refresh()
+        return self.index.categories()
+    
+    def skills_page(self, offset: int = 0, limit: int = 100,
+                    category: str = None, prefix: str = None) -> dict:
+        """
+        Page through the taxonomy
+        
+        Args:
+            offset: Skills to skip
+            limit: Skills to return
+            category: Only skills in this category (optional)
+            prefix: Only skills whose name starts with this (optional)
+            
+        Returns:
+            Dictionary with total count and skills with categories and aliases
+        """
+        self.refresh()
+        index = self.index
+        if category is not None and category not in index.category_ids:
+            raise ValueError(f"Unknown category '{category}'")
+        
+        total, skill_ids = index.page(offset, limit, category, prefix)
+        return {
+            'version': index.version,
+            'total': total,
+            'skills': [index.describe(skill_id) for skill_id in skill_ids]
+        }
     
     def find_skill_gaps(self, resume_skills: set, job_skills: set) -> dict:
         """
@@ -0,0 +1,334 @@
+"""
+Skill Index - Compact, memory-mapped skills taxonomy
+Compiles a JSON taxonomy with aliases into interned-ID arrays shared by all workers
+"""
+
+import bisect
+import hashlib
+import json
+import os
+from datetime import datetime
+
+import numpy as np
+
+from utils.skill_matcher import SkillMatcher
+
+MAGIC = b'ATSSKIX1'
+FORMAT_VERSION = 1
+
+# Array sections of an index file, in file order
+ARRAYS = (
+    'strings',                 # uint8: UTF-8 of skills (sorted), categories, aliases (sorted)
+    'string_offsets',          # uint32: start of each string, plus the end
+    'skill_category_offsets',  # uint32: CSR rows of skill -> category IDs
+    'skill_categories',
+    'category_member_offsets', # uint32: CSR rows of category -> skill IDs (taxonomy order)
+    'category_members',
+    'skill_alias_offsets',     # uint32: CSR rows of skill -> alias IDs
+    'skill_aliases',
+    'alias_skills'             # uint32: canonical skill ID per alias
+)
+
+def normalize_name(name: str) -> str:
+    """Skill, alias and category names are matched lowercased and trimmed"""
+    return ' '.join(str(name).lower().split())
+
+def load_taxonomy(path: str) -> dict:
+    """
+    Read a taxonomy file
+
+    Format:
+        {"categories": {"devops_tools": ["docker", "kubernetes"], ...},
+         "aliases": {"k8s": "kubernetes", ...}}
+
+    Args:
+        path: JSON taxonomy path
+
+    Returns:
+        Taxonomy dictionary
+    """
+    try:
+        with open(path, encoding='utf-8') as file:
+            taxonomy = json.load(file)
+    except OSError as e:
+        raise ValueError(f"{path}: {e.strerror}") from e
+    if not isinstance(taxonomy, dict) or not isinstance(taxonomy.get('categories'), dict):
+        raise ValueError(f"{path}: expected an object with a 'categories' mapping")
+    return taxonomy
+
+def compile_taxonomy(taxonomy: dict, source: str = None) -> bytes:
+    """
+    Compile a taxonomy into index bytes
+
+    Skills listed under several categories are stored once. Aliases must
+    point at a skill and may not shadow one.
+
+    Args:
+        taxonomy: Dictionary with 'categories' and optional 'aliases'
+        source: Taxonomy path recorded in the index metadata (optional)
+
+    Returns:
+        Index file contents
+    """
+    categories = {}
+    for category, skills in taxonomy['categories'].items():
+        members = categories.setdefault(normalize_name(category), {})
+        for skill in skills:
+            skill = normalize_name(skill)
+            if skill:
+                members[skill] = None
+
+    skills = sorted({skill for members in categories.values() for skill in members})
+    skill_ids = {skill: i for i, skill in enumerate(skills)}
+
+    aliases = {}
+    for alias, skill in (taxonomy.get('aliases') or {}).items():
+        alias, skill = normalize_name(alias), normalize_name(skill)
+        if skill not in skill_ids:
+            raise ValueError(f"Alias '{alias}' points at unknown skill '{skill}'")
+        if alias in skill_ids:
+            raise ValueError(f"Alias '{alias}' is also a skill")
+        aliases[alias] = skill_ids[skill]
+    alias_names = sorted(aliases)
+
+    category_names = list(categories)
+    strings = [name.encode('utf-8') for name in skills + category_names + alias_names]
+    string_offsets = np.zeros(len(strings) + 1, dtype=np.uint32)
+    np.cumsum([len(s) for s in strings], out=string_offsets[1:])
+
+    skill_categories = [[] for _ in skills]
+    for category_id, members in enumerate(categories.values()):
+        for skill in members:
+            skill_categories[skill_ids[skill]].append(category_id)
+
+    skill_aliases = [[] for _ in skills]
+    for alias_id, alias in enumerate(alias_names):
+        skill_aliases[aliases[alias]].append(alias_id)
+
+    def csr(rows):
+        offsets = np.zeros(len(rows) + 1, dtype=np.uint32)
+        np.cumsum([len(row) for row in rows], out=offsets[1:])
+        values = np.fromiter((value for row in rows for value in row), dtype=np.uint32, count=int(offsets[-1]))
+        return offsets, values
+
+    arrays = {'strings': np.frombuffer(b''.join(strings), dtype=np.uint8), 'string_offsets': string_offsets}
+    arrays['skill_category_offsets'], arrays['skill_categories'] = csr(skill_categories)
+    arrays['category_member_offsets'], arrays['category_members'] = csr(
+        [[skill_ids[skill] for skill in members] for members in categories.values()]
+    )
+    arrays['skill_alias_offsets'], arrays['skill_aliases'] = csr(skill_aliases)
+    arrays['alias_skills'] = np.array([aliases[alias] for alias in alias_names], dtype=np.uint32)
+
+    digest = hashlib.sha256()
+    for name in ARRAYS:
+        digest.update(arrays[name].tobytes())
+
+    # Arrays follow the header, each aligned to 8 bytes
+    layout, offset = {}, 0
+    for name in ARRAYS:
+        layout[name] = [offset, arrays[name].dtype.str, len(arrays[name])]
+        offset += -(-arrays[name].nbytes // 8) * 8
+    header = json.dumps({
+        'format': FORMAT_VERSION,
+        'version': digest.hexdigest()[:16],
+        'skills': len(skills),
+        'categories': len(category_names),
+        'aliases': len(alias_names),
+        'source': source,
+        'created': datetime.now().isoformat(),
+        'arrays': layout
+    }).encode('utf-8')
+    header += b' ' * (-(len(MAGIC) + 4 + len(header)) % 8)
+
+    parts = [MAGIC, np.uint32(len(header)).tobytes(), header]
+    for name in ARRAYS:
+        data = arrays[name].tobytes()
+        parts.append(data + b'\0' * (-len(data) % 8))
+    return b''.join(parts)
+
+def build_index(taxonomy_path: str, index_path: str) -> dict:
+    """
+    Compile a taxonomy file and atomically replace the index
+
+    Readers that have the old index mapped keep using it until they reload.
+
+    Args:
+        taxonomy_path: JSON taxonomy path
+        index_path: Output index path
+
+    Returns:
+        Metadata of the new index
+    """
+    data = compile_taxonomy(load_taxonomy(taxonomy_path), source=taxonomy_path)
+    directory = os.path.dirname(os.path.abspath(index_path))
+    os.makedirs(directory, exist_ok=True)
+
+    temp_path = f'{index_path}.{os.getpid()}.tmp'
+    with open(temp_path, 'wb') as file:
+        file.write(data)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temp_path, index_path)
+    return SkillIndex(data).meta
+
+class _Strings:
+    """Sequence view of a range of the interned string table (for bisect)"""
+
+    def __init__(self, index, start: int, count: int):
+        self.index = index
+        self.start = start
+        self.count = count
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, i: int) -> str:
+        return self.index.string(self.start + i)
+
+class SkillIndex:
+    """
+    Read-only skills taxonomy over compiled index bytes or a memory-mapped file
+
+    Skills have IDs 0..skills-1 in name order; categories keep taxonomy
+    order. The skill matcher is built in-process from the string table:
+    matching does a dict lookup per token, which an array trie walked from
+    Python could not match, so only the arrays are shared through the map
+    (a pre-fork server builds the matcher before forking, and workers
+    share it copy-on-write until they reload).
+    """
+
+    def __init__(self, data, path: str = None):
+        """
+        Args:
+            data: Index bytes, or a uint8 memmap of an index file
+            path: File the index was mapped from (optional)
+        """
+        raw = np.frombuffer(data, dtype=np.uint8) if isinstance(data, bytes) else data
+        if bytes(raw[:len(MAGIC)]) != MAGIC:
+            raise ValueError(f"{path or 'data'} is not a skill index")
+
+        header_length = int(raw[len(MAGIC):len(MAGIC) + 4].view(np.uint32)[0])
+        start = len(MAGIC) + 4
+        self.meta = json.loads(bytes(raw[start:start + header_length]).decode('utf-8'))
+        if self.meta['format'] != FORMAT_VERSION:
+            raise ValueError(f"Unsupported skill index format {self.meta['format']}")
+
+        base = start + header_length
+        for name, (offset, dtype, count) in self.meta.pop('arrays').items():
+            dtype = np.dtype(dtype)
+            begin = base + offset
+            setattr(self, name, raw[begin:begin + count * dtype.itemsize].view(dtype))
+
+        self.path = path
+        self.version = self.meta['version']
+        self.skill_count = self.meta['skills']
+        self.category_count = self.meta['categories']
+        self.alias_count = self.meta['aliases']
+        self.skill_names = _Strings(self, 0, self.skill_count)
+        self.category_names = [self.string(self.skill_count + i) for i in range(self.category_count)]
+        self.category_ids = {name: i for i, name in enumerate(self.category_names)}
+        self.alias_names = _Strings(self, self.skill_count + self.category_count, self.alias_count)
+
+        # Decode the string table once to build the matcher
+        blob = self.strings.tobytes()
+        offsets = self.string_offsets.tolist()
+        names = [blob[offsets[i]:offsets[i + 1]].decode('utf-8') for i in range(len(offsets) - 1)]
+        alias_start = self.skill_count + self.category_count
+        self.matcher = SkillMatcher(
+            names[:self.skill_count],
+            {names[alias_start + i]: names[skill_id] for i, skill_id in enumerate(self.alias_skills.tolist())}
+        )
+
+    @classmethod
+    def open(cls, path: str):
+        """Memory-map an index file"""
+        try:
+            data = np.memmap(path, dtype=np.uint8, mode='r')
+        except OSError as e:
+            raise ValueError(f"{path}: {e.strerror}") from e
+        return cls(data, path)
+
+    @classmethod
+    def from_taxonomy(cls, taxonomy: dict):
+        """Compile a taxonomy in memory"""
+        return cls(compile_taxonomy(taxonomy))
+
+    def string(self, string_id: int) -> str:
+        """Decode an interned string"""
+        start, end = self.string_offsets[string_id], self.string_offsets[string_id + 1]
+        return self.strings[start:end].tobytes().decode('utf-8')
+
+    def skill_id(self, name: str):
+        """ID of a skill or alias (aliases resolve to their skill), or None"""
+        name = normalize_name(name)
+        i = bisect.bisect_left(self.skill_names, name)
+        if i < self.skill_count and self.skill_names[i] == name:
+            return i
+        i = bisect.bisect_left(self.alias_names, name)
+        if i < self.alias_count and self.alias_names[i] == name:
+            return int(self.alias_skills[i])
+        return None
+
+    def canonical(self, name: str):
+        """Canonical skill name for a skill or alias, or None"""
+        skill_id = self.skill_id(name)
+        return None if skill_id is None else self.skill_names[skill_id]
+
+    def categories_of(self, skill_id: int) -> list:
+        """Category names of a skill"""
+        start, end = self.skill_category_offsets[skill_id], self.skill_category_offsets[skill_id + 1]
+        return [self.category_names[i] for i in self.skill_categories[start:end]]
+
+    def aliases_of(self, skill_id: int) -> list:
+        """Aliases of a skill"""
+        start, end = self.skill_alias_offsets[skill_id], self.skill_alias_offsets[skill_id + 1]
+        return [self.alias_names[int(i)] for i in self.skill_aliases[start:end]]
+
+    def category_skills(self, category: str) -> list:
+        """Skill IDs of a category in taxonomy order"""
+        category_id = self.category_ids[category]
+        start, end = self.category_member_offsets[category_id], self.category_member_offsets[category_id + 1]
+        return [int(i) for i in self.category_members[start:end]]
+
+    def categories(self) -> dict:
+        """Category -> skill names, as in the source taxonomy"""
+        return {
+            category: [self.skill_names[i] for i in self.category_skills(category)]
+            for category in self.category_names
+        }
+
+    def page(self, offset: int = 0, limit: int = 100, category: str = None, prefix: str = None) -> tuple:
+        """
+        A page of skills, optionally within a category and/or by name prefix
+
+        Args:
+            offset: Skills to skip
+            limit: Skills to return
+            category: Only skills of this category (taxonomy order)
+            prefix: Only skills whose name starts with this (name order)
+
+        Returns:
+            (total matching skills, list of skill IDs)
+        """
+        if category is not None:
+            ids = self.category_skills(category)
+            if prefix:
+                prefix = normalize_name(prefix)
+                ids = [i for i in ids if self.skill_names[i].startswith(prefix)]
+            return len(ids), ids[offset:offset + limit]
+
+        start, end = 0, self.skill_count
+        if prefix:
+            prefix = normalize_name(prefix)
+            start = bisect.bisect_left(self.skill_names, prefix)
+            end = bisect.bisect_left(self.skill_names, prefix + '\U0010ffff')
+        first = min(start + offset, end)
+        return end - start, list(range(first, min(first + limit, end)))
+
+    def describe(self, skill_id: int) -> dict:
+        """Skill name with its categories and aliases"""
+        return {
+            'name': self.skill_names[skill_id],
+            'categories': self.categories_of(skill_id),
+            'aliases': self.aliases_of(skill_id)
+        }
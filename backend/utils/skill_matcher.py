@@ -0,0 +1,145 @@
+"""
+Skill Matcher - Find every taxonomy skill in one pass over the text
+Skills are compiled once into a token trie; matching walks the trie from each token
+"""
+
+import re
+
+# Words (\w runs) and single symbols; whitespace only separates tokens
+TOKEN_PATTERN = re.compile(r'\w+|[^\w\s]')
+
+# Trie key under which a node stores the (canonical) skill it completes
+SKILL_KEY = None
+
+def tokenize(text: str) -> list:
+    """
+    Split text into trie keys with their character offsets
+
+    The first token of a skill is keyed by its text. Later tokens are keyed
+    by their text when directly attached to the previous token ("node.js",
+    "c++") and by a leading space when separated by whitespace ("sql server").
+
+    Args:
+        text: Text to tokenize (matched case-insensitively)
+
+    Returns:
+        List of (token, key, start, end)
+    """
+    tokens = []
+    previous_end = None
+    for match in TOKEN_PATTERN.finditer(text):
+        token = match.group().lower()
+        start, end = match.span()
+        key = token if start == previous_end else ' ' + token
+        tokens.append((token, key, start, end))
+        previous_end = end
+    return tokens
+
+def count_matches(matches: list) -> dict:
+    """
+    Occurrence counts and offsets per skill
+
+    Args:
+        matches: Output of SkillMatcher.find
+
+    Returns:
+        {skill: {'count': n, 'offsets': [[start, end], ...]}}
+    """
+    found = {}
+    for skill, start, end in matches:
+        entry = found.setdefault(skill, {'count': 0, 'offsets': []})
+        entry['count'] += 1
+        entry['offsets'].append([start, end])
+    return found
+
+class SkillMatcher:
+    """
+    Compiled matcher for a skill taxonomy
+
+    Matches start and end at token boundaries: word tokens are whole \\w
+    runs, so "go" never matches inside "google", while skills ending in a
+    symbol ("c++", "c#") match before spaces and punctuation. Overlapping
+    skills are all reported ("sql server" also yields "sql"). Aliases
+    report their canonical skill ("k8s" yields "kubernetes").
+    """
+
+    def __init__(self, skills, aliases: dict = None):
+        """
+        Args:
+            skills: Iterable of skill names (case-insensitive)
+            aliases: Alias -> canonical skill name (optional)
+        """
+        self.root = {}
+        self.names = 0
+
+        for skill in skills:
+            self.add(skill)
+        for alias, skill in (aliases or {}).items():
+            self.add(alias, skill)
+
+    def add(self, name: str, skill: str = None):
+        """
+        Add a skill name to the trie (names already present are ignored)
+
+        Args:
+            name: Text to match
+            skill: Canonical skill reported for matches (default: name)
+        """
+        tokens = tokenize(name.strip())
+        if not tokens:
+            return
+
+        node = self.root.setdefault(tokens[0][0], {})
+        for _, key, _, _ in tokens[1:]:
+            node = node.setdefault(key, {})
+
+        if SKILL_KEY not in node:
+            node[SKILL_KEY] = (skill or name).strip().lower()
+            self.names += 1
+
+    def __len__(self) -> int:
+        return self.names
+
+    def find(self, text: str) -> list:
+        """
+        Find all skill occurrences
+
+        Args:
+            text: Resume or job description text
+
+        Returns:
+            List of (skill, start, end) character spans in text order
+        """
+        tokens = tokenize(text)
+        root = self.root
+        matches = []
+
+        for i, (token, _, start, _) in enumerate(tokens):
+            node = root.get(token)
+            j = i
+            while node is not None:
+                skill = node.get(SKILL_KEY)
+                if skill is not None:
+                    matches.append((skill, start, tokens[j][3]))
+                j += 1
+                if j == len(tokens):
+                    break
+                node = node.get(tokens[j][1])
+
+        return matches
+
+    def count(self, text: str) -> dict:
+        """
+        Occurrence counts and offsets per skill
+
+        Args:
+            text: Resume or job description text
+
+        Returns:
+            {skill: {'count': n, 'offsets': [[start, end], ...]}}
+        """
+        return count_matches(self.find(text))
+
+    def extract(self, text: str) -> set:
+        """Set of skills present in text"""
+        return {skill for skill, _, _ in self.find(text)}
@@ -3,46 +3,112 @@ Text Processing Utilities
 Clean, normalize, and extract keywords from text
 """
 
+import os
 import re
 import string
+import threading
 from collections import Counter
-import nltk
-from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize
 
-# Download required NLTK data
-try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    nltk.download('punkt')
-
-try:
-    nltk.data.find('corpora/stopwords')
-except LookupError:
-    nltk.download('stopwords')
-
-# Initialize stopwords
-STOP_WORDS = set(stopwords.words('english'))
+from utils.stopwords_en import ENGLISH_STOP_WORDS
 
 # Add custom stopwords for resumes
 CUSTOM_STOP_WORDS = {
     'resume', 'cv', 'curriculum', 'vitae', 'page', 'pages',
     'name', 'address', 'phone', 'email', 'linkedin', 'github'
 }
-STOP_WORDS.update(CUSTOM_STOP_WORDS)
 
-def clean_text(text: str) -> str:
+STOP_WORDS = frozenset(ENGLISH_STOP_WORDS | CUSTOM_STOP_WORDS)
+
+# Word runs, kept whole across inner hyphens, dots and slashes and with trailing
+# pluses ("full-stack", "node.js", "ci/cd", "c++") as word_tokenize keeps them;
+# apostrophes split contractions into fragments ("don", "t") that are all stopwords
+WORD_PATTERN = re.compile(r'\w+(?:[-./]\w+)*\+*')
+
+# Keyword tokenizer: 'regex' (default) or 'nltk' (word_tokenize, needs nltk and punkt)
+TOKENIZERS = ('regex', 'nltk')
+DEFAULT_TOKENIZER = os.environ.get('KEYWORD_TOKENIZER', 'regex')
+# Let the nltk tokenizer download punkt when it is missing (off: never touch the network)
+NLTK_DOWNLOAD = os.environ.get('NLTK_DOWNLOAD', '0') == '1'
+
+_word_tokenize = None
+_nltk_lock = threading.Lock()
+
+def ensure_nltk_data(download: bool = None):
+    """
+    Import NLTK and check for the punkt tokenizer models, on first use only
+
+    Args:
+        download: Download punkt when missing (default: NLTK_DOWNLOAD)
+
+    Returns:
+        nltk.word_tokenize
+    """
+    global _word_tokenize
+    if _word_tokenize is None:
+        with _nltk_lock:
+            if _word_tokenize is None:
+                try:
+                    import nltk
+                except ImportError:
+                    raise RuntimeError(
+                        "KEYWORD_TOKENIZER=nltk requires nltk (pip install nltk)"
+                    ) from None
+                try:
+                    nltk.data.find('tokenizers/punkt')
+                except LookupError:
+                    if not (NLTK_DOWNLOAD if download is None else download):
+                        raise RuntimeError(
+                            "NLTK punkt data not found; install it into NLTK_DATA "
+                            "or set NLTK_DOWNLOAD=1"
+                        ) from None
+                    nltk.download('punkt')
+                _word_tokenize = nltk.word_tokenize
+    return _word_tokenize
+
+def get_stop_words() -> set:
+    """Return English plus resume-specific stopwords"""
+    return STOP_WORDS
+
+def tokenize(text: str, tokenizer: str = None, lowercased: bool = False) -> list:
+    """
+    Split lowercased text into word tokens
+
+    Args:
+        text: Input text
+        tokenizer: 'regex' or 'nltk' (default: KEYWORD_TOKENIZER)
+        lowercased: text is already lowercase (skips a pass)
+
+    Returns:
+        List of tokens
+    """
+    tokenizer = tokenizer or DEFAULT_TOKENIZER
+    if not lowercased:
+        text = text.lower()
+    if tokenizer == 'regex':
+        return WORD_PATTERN.findall(text)
+    if tokenizer == 'nltk':
+        return ensure_nltk_data()(text)
+    raise ValueError(f"Unknown tokenizer '{tokenizer}' (expected one of {', '.join(TOKENIZERS)})")
+
+def warm_up_tokenizer(tokenizer: str = None):
+    """Load the keyword tokenizer's data ahead of the first request"""
+    if (tokenizer or DEFAULT_TOKENIZER) == 'nltk':
+        ensure_nltk_data()
+
+def clean_text(text: str, lowercased: bool = False) -> str:
     """
     Clean and normalize text
     
     Args:
         text: Raw text
+        lowercased: text is already lowercase (skips a pass)
         
     Returns:
         Cleaned text
     """
     # Convert to lowercase
-    text = text.lower()
+    if not lowercased:
+        text = text.lower()
     
     # Remove URLs
     text = re.sub(r'http\S+|www\S+', '', text)
@@ -61,52 +127,66 @@ def clean_text(text: str) -> str:
     
     return text
 
-def extract_keywords(text: str, top_n: int = 50) -> list:
+def extract_keywords(text: str, top_n: int = 50, tokenizer: str = None) -> list:
     """
     Extract important keywords from text
     
     Args:
         text: Input text
         top_n: Number of top keywords to return
+        tokenizer: 'regex' or 'nltk' (default: KEYWORD_TOKENIZER)
         
     Returns:
         List of keywords sorted by frequency
     """
-    # Tokenize
-    tokens = word_tokenize(text.lower())
+    # Tokenize and count
+    return keywords_from_counts(Counter(tokenize(text, tokenizer)), top_n)
+
+def keywords_from_counts(token_counts: Counter, top_n: int = 50) -> list:
+    """
+    Top keywords from token counts
+    
+    Args:
+        token_counts: Counter of tokens, in first-occurrence order
+        top_n: Number of top keywords to return
+        
+    Returns:
+        List of keywords sorted by frequency (ties in text order)
+    """
+    stop_words = get_stop_words()
     
     # Remove stopwords and short words
-    keywords = [
-        word for word in tokens 
-        if word not in STOP_WORDS 
+    word_freq = Counter({
+        word: count for word, count in token_counts.items()
+        if word not in stop_words
         and len(word) > 2
         and word.isalpha()
-    ]
-    
-    # Count frequencies
-    word_freq = Counter(keywords)
+    })
     
     # Get top keywords
     top_keywords = [word for word, freq in word_freq.most_common(top_n)]
     
     return top_keywords
 
-def extract_bigrams(text: str, top_n: int = 20) -> list:
+def extract_bigrams(text: str, top_n: int = 20, tokenizer: str = None) -> list:
     """
     Extract important two-word phrases
     
     Args:
         text: Input text
         top_n: Number of top bigrams to return
+        tokenizer: 'regex' or 'nltk' (default: KEYWORD_TOKENIZER)
         
     Returns:
         List of bigrams
     """
+    stop_words = get_stop_words()
+    
     # Tokenize
-    tokens = word_tokenize(text.lower())
+    tokens = tokenize(text, tokenizer)
     
     # Remove stopwords
-    tokens = [word for word in tokens if word not in STOP_WORDS and word.isalpha()]
+    tokens = [word for word in tokens if word not in stop_words and word.isalpha()]
     
     # Create bigrams
     bigrams = [f"{tokens[i]} {tokens[i+1]}" for i in range(len(tokens)-1)]